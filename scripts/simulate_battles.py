@@ -0,0 +1,79 @@
+"""
+Simulate battles between AI controlled trainers, to check the balance
+of the monsters.
+
+Each pair of monsters fights the given number of battles and the script
+prints, for each pair, the rate of battles won by the first monster and
+the mean number of turns.  Battles are seeded, so running the script
+again with the same arguments gives the same results.
+
+Without monsters, every pair of monsters in the database is simulated:
+
+    python -m scripts.simulate_battles --battles 20 --level 25 > results.csv
+
+With monsters, only the pairs among them are simulated:
+
+    python -m scripts.simulate_battles rockitten bigfin nut
+
+Effects that need the game world (e.g. "money") can't be simulated; the
+battles using them are counted as errors.
+"""
+import csv
+import sys
+import time
+from argparse import ArgumentParser
+from itertools import combinations
+
+from tuxemon.db import db
+from tuxemon.simulation import simulate_battles
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("monsters", nargs="*", help="monster slugs")
+    parser.add_argument("--battles", type=int, default=10)
+    parser.add_argument("--level", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    db.load(snapshot=True)
+    monsters = args.monsters or sorted(db.database["monster"])
+    matchups = [([a], [b]) for a, b in combinations(monsters, 2)]
+
+    start = time.perf_counter()
+    stats = simulate_battles(
+        matchups,
+        battles=args.battles,
+        level=args.level,
+        seed=args.seed,
+        processes=args.processes,
+    )
+    elapsed = time.perf_counter() - start
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(
+        ["monster0", "monster1", "win_rate", "draws", "errors", "mean_turns"]
+    )
+    for (party0, party1), result in sorted(stats.items()):
+        writer.writerow(
+            [
+                party0[0],
+                party1[0],
+                f"{result.win_rate:.3f}",
+                result.draws,
+                result.errors,
+                f"{result.mean_turns:.2f}",
+            ]
+        )
+
+    battles = sum(result.battles for result in stats.values())
+    print(
+        f"{battles} battles in {elapsed:.1f}s "
+        f"({battles / elapsed:.0f} battles/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
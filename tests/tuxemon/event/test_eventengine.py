@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
+from tuxemon.event import EventObject, MapAction, MapCondition
+from tuxemon.event.eventcondition import EventCondition
 from tuxemon.event.eventengine import EventEngine, RunningEvent
 
 
@@ -20,3 +22,142 @@ class TestRunningEvent(unittest.TestCase):
 class TestEventEngine(unittest.TestCase):
     def test_(self):
         eng = EventEngine(None)
+
+
+class CountingCondition(EventCondition):
+    name = "counting"
+    dependencies = frozenset({"variables"})
+    calls = 0
+
+    def test(self, session, condition):
+        CountingCondition.calls += 1
+        return "key" in session.player.game_variables
+
+
+class VolatileCountingCondition(CountingCondition):
+    name = "volatile_counting"
+    dependencies = None
+
+
+class TestEventEngineDependencies(unittest.TestCase):
+    def setUp(self):
+        CountingCondition.calls = 0
+        self.session = MagicMock()
+        self.session.player.game_variables = {}
+        self.session.player.monsters = []
+        self.session.client.key_events = []
+        self.session.client.get_state_by_name.side_effect = ValueError
+        self.engine = EventEngine(self.session)
+        self.engine.conditions = {
+            "counting": CountingCondition,
+            "volatile_counting": VolatileCountingCondition,
+        }
+
+    def make_event(self, cond_type):
+        cond = MapCondition(cond_type, [], 0, 0, 1, 1, "is", None)
+        return EventObject(1, "event", 0, 0, 1, 1, [cond], [])
+
+    def check(self, event):
+        self.engine.update_dependencies()
+        return self.engine.check_event_conditions(event)
+
+    def test_result_reused_while_dependencies_unchanged(self):
+        event = self.make_event("counting")
+        self.assertFalse(self.check(event))
+        self.assertFalse(self.check(event))
+        self.assertEqual(CountingCondition.calls, 1)
+
+    def test_result_updated_when_dependency_changes(self):
+        event = self.make_event("counting")
+        self.assertFalse(self.check(event))
+        self.session.player.game_variables["key"] = "value"
+        self.assertTrue(self.check(event))
+        self.assertEqual(CountingCondition.calls, 2)
+
+    def test_condition_without_dependencies_always_checked(self):
+        event = self.make_event("volatile_counting")
+        self.check(event)
+        self.check(event)
+        self.assertEqual(CountingCondition.calls, 2)
+        self.assertIsNone(self.engine.get_event_dependencies(event))
+
+    def test_reset_discards_results(self):
+        event = self.make_event("counting")
+        self.check(event)
+        self.engine.reset()
+        self.check(event)
+        self.assertEqual(CountingCondition.calls, 2)
+
+    def test_update_without_player(self):
+        self.session.player = None
+        self.session.client.inits = []
+        self.session.client.events = []
+        self.engine.update(1 / 60)
+        self.engine.update(1 / 60)
+
+    def test_results_discarded_while_no_events(self):
+        event = self.make_event("counting")
+        self.check(event)
+        self.session.client.events = []
+        self.session.client.inits = []
+        self.engine.update_dependencies()
+        self.check(event)
+        self.assertEqual(CountingCondition.calls, 2)
+
+    def test_condition_instance_reused(self):
+        cond = MapCondition("counting", [], 0, 0, 1, 1, "is", None)
+        self.engine.check_condition(cond)
+        instance = self.engine._condition_instances["counting"]
+        self.engine.check_condition(cond)
+        self.assertIs(self.engine._condition_instances["counting"], instance)
+
+
+class TestEventEngineCompile(unittest.TestCase):
+    def setUp(self):
+        CountingCondition.calls = 0
+        self.session = MagicMock()
+        self.session.player.game_variables = {}
+        self.engine = EventEngine(self.session)
+
+    def make_event(self, cond_type, parameters, operator="is"):
+        cond = MapCondition(cond_type, parameters, 0, 0, 1, 1, operator, None)
+        return EventObject(1, "event", 0, 0, 1, 1, [cond], [])
+
+    def test_compile_events_compiles_conditions(self):
+        event = self.make_event("variable_set", ["key:value"])
+        self.engine.compile_events([event])
+        self.assertIn(id(event.conds[0]), self.engine._compiled_conditions)
+
+    def test_compiled_condition_reads_current_state(self):
+        event = self.make_event("variable_set", ["key:value"])
+        self.engine.compile_events([event])
+        self.assertFalse(self.engine.check_condition(event.conds[0]))
+        self.session.player.game_variables["key"] = "value"
+        self.assertTrue(self.engine.check_condition(event.conds[0]))
+
+    def test_compiled_condition_operator_not(self):
+        event = self.make_event("variable_set", ["key:value"], "not")
+        self.assertTrue(self.engine.check_condition(event.conds[0]))
+
+    def test_compiled_variable_is_numeric_operand(self):
+        event = self.make_event("variable_is", ["count", "greater_than", "2"])
+        self.session.player.game_variables["count"] = 3
+        self.assertTrue(self.engine.check_condition(event.conds[0]))
+        self.session.player.game_variables["count"] = 1
+        self.assertFalse(self.engine.check_condition(event.conds[0]))
+
+    def test_missing_condition_is_false(self):
+        event = self.make_event("missing_condition", [])
+        self.assertFalse(self.engine.check_condition(event.conds[0]))
+
+    def test_create_action_returns_new_instances(self):
+        map_action = MapAction("set_variable", ["key:value"], None)
+        first = self.engine.create_action(map_action)
+        second = self.engine.create_action(map_action)
+        self.assertIsNotNone(first)
+        self.assertIsNot(first, second)
+        self.assertEqual(first.var_list, second.var_list)
+
+    def test_create_action_missing_action(self):
+        map_action = MapAction("missing_action", [], None)
+        self.assertIsNone(self.engine.create_action(map_action))
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest import mock
+
+from pygame.rect import Rect
+
+from tuxemon import prepare
+from tuxemon.client import LocalPygameClient
+from tuxemon.entity import Entity
+from tuxemon.math import Vector2, Vector3
+
+
+class TestDirtyRects(unittest.TestCase):
+    def setUp(self):
+        self.client = LocalPygameClient(prepare.CONFIG)
+        self.client.screen = mock.Mock()
+        self.client.screen.get_rect.return_value = Rect(0, 0, 100, 100)
+        self.client.config = mock.Mock(dirty_rects=True, collision_map=False)
+        self.client.controller_overlay = None
+        self.background = mock.Mock(static=True, rect=Rect(0, 0, 100, 100))
+        self.menu = mock.Mock(static=False, rect=Rect(10, 10, 20, 20))
+
+    def draw(self, *states):
+        self.client.drawn_states = list(states)
+        return self.client.get_dirty_rects()
+
+    def test_first_frame_is_full(self):
+        self.assertIsNone(self.draw(self.menu, self.background))
+
+    def test_only_menu_changed(self):
+        self.draw(self.menu, self.background)
+        rects = self.draw(self.menu, self.background)
+        self.assertEqual(rects, [Rect(10, 10, 20, 20)])
+
+    def test_moved_menu_includes_previous_area(self):
+        self.draw(self.menu, self.background)
+        self.draw(self.menu, self.background)
+        self.menu.rect = Rect(30, 30, 20, 20)
+        rects = self.draw(self.menu, self.background)
+        self.assertEqual(rects, [Rect(30, 30, 20, 20), Rect(10, 10, 20, 20)])
+
+    def test_states_changed_is_full(self):
+        other = mock.Mock(static=False, rect=Rect(0, 0, 5, 5))
+        self.draw(self.menu, self.background)
+        self.assertIsNone(self.draw(other, self.menu, self.background))
+
+    def test_full_screen_state_is_full(self):
+        world = mock.Mock(static=False, rect=Rect(0, 0, 100, 100))
+        self.draw(self.menu, world)
+        self.assertIsNone(self.draw(self.menu, world))
+
+    def test_disabled(self):
+        self.client.config.dirty_rects = False
+        self.draw(self.menu, self.background)
+        self.assertIsNone(self.draw(self.menu, self.background))
+
+
+class TestEntityDrawPosition(unittest.TestCase):
+    def setUp(self):
+        self.entity = Entity(world=mock.MagicMock())
+        self.entity.position3 = Vector3(1, 2, 0)
+
+    def test_not_moving(self):
+        self.assertEqual(self.entity.get_draw_position(0.5), Vector2(1, 2))
+
+    def test_moving(self):
+        self.entity.velocity3 = Vector3(2, 0, 0)
+        self.assertEqual(self.entity.get_draw_position(0.25), Vector2(1.5, 2))
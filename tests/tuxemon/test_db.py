@@ -0,0 +1,252 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tuxemon import db, prepare
+from tuxemon.constants import paths
+from tuxemon.db import JSONDatabase, ShapeModel
+
+
+class TestDatabaseSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        snapshot_path = os.path.join(self.tmp_dir.name, "snapshot.pickle")
+        patcher = mock.patch.object(db, "DB_SNAPSHOT_PATH", snapshot_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.shape = ShapeModel(
+            slug="dragon", armour=7, dodge=5, hp=6, melee=6, ranged=6, speed=6
+        )
+
+    def test_load_snapshot_missing_file(self):
+        database = JSONDatabase()
+        self.assertFalse(database.load_snapshot("key"))
+
+    def test_save_and_load_snapshot(self):
+        database = JSONDatabase()
+        database.database["shape"] = {"dragon": self.shape}
+        database.save_snapshot("key")
+        loaded = JSONDatabase()
+        self.assertTrue(loaded.load_snapshot("key"))
+        self.assertEqual(loaded.database["shape"]["dragon"], self.shape)
+
+    def test_load_snapshot_with_other_key(self):
+        database = JSONDatabase()
+        database.database["shape"] = {"dragon": self.shape}
+        database.save_snapshot("key")
+        loaded = JSONDatabase()
+        self.assertFalse(loaded.load_snapshot("other_key"))
+        self.assertEqual(loaded.database["shape"], {})
+
+    def test_load_snapshot_with_other_version(self):
+        database = JSONDatabase()
+        database.save_snapshot("key")
+        loaded = JSONDatabase()
+        with mock.patch.object(db, "DB_SNAPSHOT_VERSION", -1):
+            self.assertFalse(loaded.load_snapshot("key"))
+
+    def test_snapshot_key_is_stable(self):
+        database = JSONDatabase()
+        self.assertEqual(database.snapshot_key(), database.snapshot_key())
+
+    def test_snapshot_key_covers_resources(self):
+        database = JSONDatabase()
+        mod_path = os.path.join(self.tmp_dir.name, "mod")
+        sprite = os.path.join(mod_path, "gfx", "sprites", "dragon.png")
+        os.makedirs(os.path.dirname(sprite))
+        with open(sprite, "wb") as fp:
+            fp.write(b"sprite")
+        with mock.patch.object(
+            paths, "mods_folder", self.tmp_dir.name
+        ), mock.patch.object(prepare.CONFIG, "mods", ["mod"]):
+            key = database.snapshot_key()
+            with open(sprite, "wb") as fp:
+                fp.write(b"edited sprite")
+            self.assertNotEqual(database.snapshot_key(), key)
+            key = database.snapshot_key()
+            os.remove(sprite)
+            self.assertNotEqual(database.snapshot_key(), key)
+
+
+class TestLazyTable(unittest.TestCase):
+    def setUp(self):
+        self.database = JSONDatabase()
+        self.shape = {
+            "slug": "dragon",
+            "armour": 7,
+            "dodge": 5,
+            "hp": 6,
+            "melee": 6,
+            "ranged": 6,
+            "speed": 6,
+        }
+        self.table = db.LazyTable(
+            self.database, "shape", {"dragon": self.shape}
+        )
+
+    def test_contains_does_not_build_model(self):
+        self.assertIn("dragon", self.table)
+        self.assertEqual(self.table.loaded, 0)
+
+    def test_getitem_builds_model(self):
+        shape = self.table["dragon"]
+        self.assertIsInstance(shape, ShapeModel)
+        self.assertEqual(self.table.loaded, 1)
+
+    def test_getitem_returns_same_model(self):
+        self.assertIs(self.table["dragon"], self.table["dragon"])
+
+    def test_getitem_missing_slug(self):
+        with self.assertRaises(KeyError):
+            self.table["missing"]
+
+    def test_getitem_invalid_entry_is_removed(self):
+        table = db.LazyTable(self.database, "shape", {"dragon": {}})
+        with self.assertRaises(KeyError):
+            table["dragon"]
+        self.assertNotIn("dragon", table)
+
+    def test_lookup_lazy_table(self):
+        self.database.database["shape"] = self.table
+        shape = self.database.lookup("dragon", table="shape")
+        self.assertEqual(shape.slug, "dragon")
+
+    def test_has_entry_lazy_table(self):
+        self.database.database["shape"] = self.table
+        self.assertTrue(self.database.has_entry("dragon", "shape"))
+        self.assertFalse(self.database.has_entry("missing", "shape"))
+
+
+class TestValidatorDbEntry(unittest.TestCase):
+    def setUp(self):
+        self.database = JSONDatabase()
+        self.validator = db.Validator(self.database)
+
+    def test_db_entry_uses_preloaded_entries(self):
+        self.database.preloaded["shape"] = {"dragon": {"slug": "dragon"}}
+        self.assertTrue(self.validator.db_entry("shape", "dragon"))
+        self.assertFalse(self.validator.db_entry("shape", "blob"))
+
+    def test_db_entry_uses_lazy_table(self):
+        self.database.database["shape"] = db.LazyTable(
+            self.database, "shape", {"dragon": None}
+        )
+        self.assertTrue(self.validator.db_entry("shape", "dragon"))
+
+    def test_db_entry_indexes_table_once(self):
+        with mock.patch.object(
+            self.database, "index_json", return_value={"dragon": "path"}
+        ) as index_json:
+            self.assertTrue(self.validator.db_entry("shape", "dragon"))
+            self.assertFalse(self.validator.db_entry("shape", "blob"))
+        index_json.assert_called_once_with("shape")
+
+    def test_db_entry_reindexes_reloaded_table(self):
+        with mock.patch.object(
+            self.database, "index_json", return_value={"dragon": "path"}
+        ):
+            self.assertFalse(self.validator.db_entry("shape", "blob"))
+        self.database.database["shape"] = {}
+        with mock.patch.object(
+            self.database, "index_json", return_value={"blob": "path"}
+        ):
+            self.assertTrue(self.validator.db_entry("shape", "blob"))
+
+
+class TestClearPreloaded(unittest.TestCase):
+    def test_clear_preloaded_keeps_tables(self):
+        database = JSONDatabase()
+        database.preloaded["shape"] = {"dragon": {"slug": "dragon"}}
+        database.clear_preloaded()
+        self.assertEqual(database.preloaded["shape"], {})
+        self.assertEqual(database.preloaded["monster"], {})
+
+
+class TestBuildModels(unittest.TestCase):
+    def test_build_models_valid_entry(self):
+        item = {
+            "slug": "dragon",
+            "armour": 7,
+            "dodge": 5,
+            "hp": 6,
+            "melee": 6,
+            "ranged": 6,
+            "speed": 6,
+        }
+        results = db._build_models("shape", [item], {})
+        slug, model, error = results[0]
+        self.assertEqual(slug, "dragon")
+        self.assertIsInstance(model, ShapeModel)
+        self.assertEqual(error, "")
+
+    def test_build_models_invalid_entry(self):
+        results = db._build_models("shape", [{"slug": "dragon"}], {})
+        slug, model, error = results[0]
+        self.assertEqual(slug, "dragon")
+        self.assertIsNone(model)
+        self.assertNotEqual(error, "")
+
+
+def make_shape(slug: str, hp: int) -> dict[str, object]:
+    return {
+        "slug": slug,
+        "armour": 7,
+        "dodge": 5,
+        "hp": hp,
+        "melee": 6,
+        "ranged": 6,
+        "speed": 6,
+    }
+
+
+class TestParallelLoad(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.write("base", "dragon.json", make_shape("dragon", 1))
+        self.write(
+            "base",
+            "shapes.json",
+            [make_shape("blob", 1), make_shape("grub", 1)],
+        )
+        self.write("extra", "dragon.json", make_shape("dragon", 2))
+        self.write(
+            "extra",
+            "shapes.json",
+            [make_shape("brute", 2), make_shape("blob", 2)],
+        )
+        patchers = [
+            mock.patch.object(paths, "mods_folder", self.tmp_dir.name),
+            mock.patch.object(prepare.CONFIG, "mods", ["base", "extra"]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write(self, mod: str, filename: str, data: object) -> None:
+        path = os.path.join(self.tmp_dir.name, mod, "db", "shape")
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, filename), "w") as fp:
+            json.dump(data, fp)
+
+    def test_parallel_load_matches_sequential_load(self):
+        sequential = JSONDatabase()
+        sequential.load("shape")
+        parallel = JSONDatabase()
+        parallel.load("shape", workers=2)
+        self.assertEqual(parallel.database, sequential.database)
+        self.assertEqual(
+            list(parallel.database["shape"]),
+            list(sequential.database["shape"]),
+        )
+        # the first mod defining a slug overrides the next ones
+        hp = {
+            slug: shape.hp
+            for slug, shape in parallel.database["shape"].items()
+        }
+        self.assertEqual(hp, {"dragon": 1, "blob": 1, "grub": 1, "brute": 2})
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tuxemon import element
+from tuxemon.db import ElementItemModel, ElementModel, ElementType, db
+from tuxemon.element import ELEMENT_IDS, Element, ElementMatrix
+from tuxemon.formula import get_element_matrix
+
+
+def make_element(slug: ElementType) -> Element:
+    ele = Element()
+    ele.slug = slug
+    ele.id = ELEMENT_IDS[slug]
+    return ele
+
+
+def make_table(mult: float) -> dict[str, ElementModel]:
+    table = {}
+    for slug in ElementType:
+        types = [
+            ElementItemModel(
+                against=against,
+                multiplier=mult if against == ElementType.wood else 1.0,
+            )
+            for against in ElementType
+        ]
+        table[slug] = ElementModel.model_construct(
+            slug=slug, icon="", types=types
+        )
+    return table
+
+
+class TestElementMatrix(unittest.TestCase):
+    def setUp(self):
+        size = len(ELEMENT_IDS)
+        rows = [[1.0] * size for _ in range(size)]
+        self.fire = make_element(ElementType.fire)
+        self.water = make_element(ElementType.water)
+        self.wood = make_element(ElementType.wood)
+        self.aether = make_element(ElementType.aether)
+        rows[self.water.id][self.fire.id] = 2.0
+        rows[self.fire.id][self.wood.id] = 8.0
+        rows[self.wood.id][self.water.id] = 0.5
+        self.matrix = ElementMatrix(rows)
+
+    def test_damage_multiplier(self):
+        mult = self.matrix.damage_multiplier([self.water], [self.fire])
+        self.assertEqual(mult, 2.0)
+
+    def test_damage_multiplier_is_clamped(self):
+        mult = self.matrix.damage_multiplier([self.fire], [self.wood])
+        self.assertEqual(mult, 4.0)
+
+    def test_damage_multiplier_uses_last_types(self):
+        mult = self.matrix.damage_multiplier(
+            [self.fire, self.water], [self.wood, self.fire]
+        )
+        self.assertEqual(mult, 2.0)
+
+    def test_damage_multiplier_ignores_aether(self):
+        mult = self.matrix.damage_multiplier(
+            [self.water, self.aether], [self.fire, self.aether]
+        )
+        self.assertEqual(mult, 2.0)
+        mult = self.matrix.damage_multiplier([self.aether], [self.fire])
+        self.assertEqual(mult, 1.0)
+
+    def test_combined_multiplier(self):
+        mult = self.matrix.combined_multiplier(
+            [self.water, self.wood], [self.fire, self.water]
+        )
+        self.assertEqual(mult, 1.0)
+        mult = self.matrix.combined_multiplier([self.fire], [self.wood])
+        self.assertEqual(mult, 8.0)
+
+    def test_combined_multiplier_without_id(self):
+        unknown = Element()
+        mult = self.matrix.combined_multiplier([unknown], [self.fire])
+        self.assertEqual(mult, 1.0)
+        mult = self.matrix.combined_multiplier([self.wood], [unknown])
+        self.assertEqual(mult, 1.0)
+
+    def test_score(self):
+        techniques = [
+            SimpleNamespace(types=[self.water]),
+            SimpleNamespace(types=[self.aether]),
+        ]
+        opponents = [
+            SimpleNamespace(types=[self.fire]),
+            SimpleNamespace(types=[self.water]),
+        ]
+        scores = self.matrix.score(techniques, opponents)
+        self.assertEqual(
+            [list(row) for row in scores], [[2.0, 1.0], [1.0, 1.0]]
+        )
+
+    def test_score_without_numpy(self):
+        with mock.patch.object(element, "np", None):
+            matrix = ElementMatrix(self.matrix.rows)
+        techniques = [SimpleNamespace(types=[self.wood])]
+        opponents = [SimpleNamespace(types=[self.water])]
+        self.assertEqual(matrix.score(techniques, opponents), [[0.5]])
+
+
+class TestGetElementMatrix(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(db.database, {"element": make_table(2.0)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fire = make_element(ElementType.fire)
+        self.wood = make_element(ElementType.wood)
+
+    def test_matrix_is_cached(self):
+        self.assertIs(get_element_matrix(), get_element_matrix())
+        mult = get_element_matrix().damage_multiplier([self.fire], [self.wood])
+        self.assertEqual(mult, 2.0)
+
+    def test_matrix_follows_reloaded_table(self):
+        get_element_matrix()
+        db.database["element"] = make_table(0.5)
+        mult = get_element_matrix().damage_multiplier([self.fire], [self.wood])
+        self.assertEqual(mult, 0.5)
+        db.database["element"]["fire"] = make_table(2.0)["fire"]
+        mult = get_element_matrix().damage_multiplier([self.fire], [self.wood])
+        self.assertEqual(mult, 2.0)
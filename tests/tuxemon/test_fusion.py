@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from tuxemon import fusion
+from tuxemon.fusion import Body, fuse_all, replace_color, replace_colors
+
+
+def make_body(name: str, color: tuple[int, int, int]) -> Body:
+    body = Body()
+    body.name = name
+    body.prefix = name[:3]
+    body.suffix = name[3:]
+    body.head_size = (4, 4)
+    body.face_position = (8, 8)
+    body.body_image = Image.new("RGBA", (16, 16), (*color, 255))
+    body.face_image = Image.new("RGBA", (4, 4), (*color, 255))
+    body.primary_colors = [color] * 5
+    return body
+
+
+class TestReplaceColors(unittest.TestCase):
+    def setUp(self):
+        self.image = Image.new("RGBA", (2, 2), (10, 20, 30, 128))
+        self.image.putpixel((1, 1), (1, 2, 3, 0))
+
+    def test_replace_color(self):
+        img = replace_color(self.image, (10, 20, 30), (4, 5, 6))
+        self.assertEqual(img.getpixel((0, 0)), (4, 5, 6, 255))
+        self.assertEqual(img.getpixel((1, 1)), (1, 2, 3, 0))
+
+    def test_replacements_are_applied_in_order(self):
+        img = replace_colors(
+            self.image, [((10, 20, 30), (1, 2, 3)), ((1, 2, 3), (7, 8, 9))]
+        )
+        self.assertEqual(img.getpixel((0, 0)), (7, 8, 9, 255))
+        self.assertEqual(img.getpixel((1, 1)), (7, 8, 9, 255))
+
+    def test_replace_colors_without_numpy(self):
+        replacements = [((10, 20, 30), (1, 2, 3)), ((1, 2, 3), (7, 8, 9))]
+        expected = replace_colors(self.image, replacements)
+        with mock.patch.object(fusion, "np", None):
+            img = replace_colors(self.image, replacements)
+        self.assertEqual(list(img.getdata()), list(expected.getdata()))
+
+
+class TestFuseAll(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.bodies = [
+            make_body("sapsnap", (255, 0, 0)),
+            make_body("vivitron", (0, 0, 255)),
+        ]
+
+    def test_fuse_all(self):
+        filenames = fuse_all(self.bodies, self.tmp_dir.name, processes=1)
+        self.assertEqual(
+            sorted(os.path.basename(f) for f in filenames),
+            ["sapitron.png", "vivsnap.png"],
+        )
+        with Image.open(filenames[0]) as img:
+            self.assertEqual(img.size, (16, 16))
+
+    def test_fuse_all_skips_cached_fusions(self):
+        fuse_all(self.bodies, self.tmp_dir.name, processes=1)
+        self.assertEqual(fuse_all(self.bodies, self.tmp_dir.name, 1), [])
+
+    def test_fuse_all_does_not_change_bodies(self):
+        fuse_all(self.bodies, self.tmp_dir.name, processes=1)
+        self.assertEqual(self.bodies[0].face_position, (8, 8))
+        self.assertEqual(self.bodies[1].face_image.size, (4, 4))
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest import mock
+
+import pygame
+
+from tuxemon import graphics
+from tuxemon.graphics import SurfaceCache
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SurfaceCache(max_bytes=1024)
+
+    def test_get_missing_surface(self):
+        self.assertIsNone(self.cache.get(("image.png", 1, "smart")))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_get_cached_surface(self):
+        surface = pygame.Surface((4, 4))
+        self.cache.put(("image.png", 1, "smart"), surface)
+        self.assertIs(self.cache.get(("image.png", 1, "smart")), surface)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_scale_is_part_of_the_key(self):
+        surface = pygame.Surface((4, 4))
+        self.cache.put(("image.png", 1, "smart"), surface)
+        self.assertIsNone(self.cache.get(("image.png", 2, "smart")))
+
+    def test_least_recently_used_surface_is_evicted(self):
+        first = pygame.Surface((10, 10), pygame.SRCALPHA)
+        second = pygame.Surface((10, 10), pygame.SRCALPHA)
+        third = pygame.Surface((10, 10), pygame.SRCALPHA)
+        self.cache.put(("first.png", 1, "smart"), first)
+        self.cache.put(("second.png", 1, "smart"), second)
+        self.cache.get(("first.png", 1, "smart"))
+        self.cache.put(("third.png", 1, "smart"), third)
+        self.assertEqual(self.cache.evictions, 1)
+        self.assertEqual(self.cache.get_stats()["surfaces"], 2)
+        self.assertLessEqual(self.cache.size, 1024)
+
+    def test_evicted_surface_still_referenced_is_reused(self):
+        first = pygame.Surface((16, 16), pygame.SRCALPHA)
+        second = pygame.Surface((16, 16), pygame.SRCALPHA)
+        self.cache.put(("first.png", 1, "smart"), first)
+        self.cache.put(("second.png", 1, "smart"), second)
+        self.assertIs(self.cache.get(("first.png", 1, "smart")), first)
+
+    def test_clear(self):
+        surface = pygame.Surface((4, 4))
+        self.cache.put(("image.png", 1, "smart"), surface)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(("image.png", 1, "smart")))
+        self.assertEqual(self.cache.size, 0)
+
+
+class TestLoadAnimatedSprite(unittest.TestCase):
+    def setUp(self):
+        self.frames = [pygame.Surface((4, 4)), pygame.Surface((4, 4))]
+        patcher = mock.patch.object(
+            graphics, "load_and_scale", side_effect=self.frames
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            graphics.os.path, "exists", return_value=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_overlays_are_drawn_on_copies_of_each_frame(self):
+        overlay = pygame.Surface((2, 2))
+        overlay.fill((255, 0, 0))
+        sprite = graphics.load_animated_sprite(
+            ["a.png", "b.png"], 0.25, overlays=[overlay]
+        )
+        self.assertIsNotNone(sprite.animation)
+        for index, frame in enumerate(self.frames):
+            image = sprite.animation.get_frame(index)
+            self.assertIsNot(image, frame)
+            self.assertEqual(image.get_at((0, 0)), (255, 0, 0, 255))
+            self.assertEqual(frame.get_at((0, 0)), (0, 0, 0, 255))
+
+    def test_frames_are_shared_without_overlays(self):
+        sprite = graphics.load_animated_sprite(["a.png", "b.png"], 0.25)
+        self.assertIs(sprite.animation.get_frame(0), self.frames[0])
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest import mock
+
+from tuxemon import prepare
+from tuxemon.audio import SilentMusicPlayerState, SoundWrapper
+from tuxemon.client import HeadlessClient
+from tuxemon.platform.const import buttons
+from tuxemon.platform.events import HeadlessEventQueueHandler, VirtualInput
+
+
+class TestHeadlessEventQueueHandler(unittest.TestCase):
+    def setUp(self):
+        self.virtual_input = VirtualInput()
+        self.handler = HeadlessEventQueueHandler()
+        self.handler.add_input(0, self.virtual_input)
+
+    def test_no_events(self):
+        self.assertEqual(list(self.handler.process_events()), [])
+
+    def test_press_and_release(self):
+        self.virtual_input.press(buttons.A)
+        events = [(e.button, e.pressed) for e in self.handler.process_events()]
+        self.assertEqual(events, [(buttons.A, True)])
+        events = [(e.button, e.held) for e in self.handler.process_events()]
+        self.assertEqual(events, [(buttons.A, True)])
+        self.virtual_input.release(buttons.A)
+        events = [(e.button, e.held) for e in self.handler.process_events()]
+        self.assertEqual(events, [(buttons.A, False)])
+        self.assertEqual(list(self.handler.process_events()), [])
+
+    def test_release_controls(self):
+        self.virtual_input.press(buttons.UP)
+        released = list(self.handler.release_controls())
+        self.assertEqual(len(released), 1)
+        self.assertEqual(released[0].value, 0)
+
+    def test_set_input_keeps_virtual_input(self):
+        self.handler.set_input(0, 0, VirtualInput())
+        self.virtual_input.press(buttons.A)
+        events = [e.button for e in self.handler.process_events()]
+        self.assertEqual(events, [buttons.A])
+
+
+class TestHeadlessClient(unittest.TestCase):
+    def setUp(self):
+        self.client = HeadlessClient(prepare.CONFIG)
+
+    def test_audio_is_silent(self):
+        self.assertIsInstance(
+            self.client.current_music, SilentMusicPlayerState
+        )
+        sound = self.client.sound_manager.load_sound("sound_confirm")
+        self.assertIsInstance(sound, SoundWrapper)
+        self.assertIsNone(sound.sound)
+
+    def test_run_max_frames(self):
+        with mock.patch.object(self.client, "update") as update:
+            self.assertEqual(self.client.run(5), 5)
+        self.assertEqual(update.call_count, 5)
+        update.assert_called_with(1.0 / self.client.fps)
+        self.assertEqual(self.client.frames, 5)
+
+    def test_run_until_exit(self):
+        def update(time_delta):
+            if update.calls == 2:
+                self.client.exit = True
+            update.calls += 1
+
+        update.calls = 0
+        with mock.patch.object(self.client, "update", update):
+            self.assertEqual(self.client.run(), 3)
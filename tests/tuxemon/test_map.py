@@ -2,10 +2,15 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
 from math import pi
+from types import SimpleNamespace
+
+import pygame
+from pyscroll.animation import AnimationToken
 
 from tuxemon.compat import Rect
 from tuxemon.db import Direction, Orientation
 from tuxemon.map import (
+    MergedTileData,
     direction_to_list,
     get_adjacent_position,
     get_coord_direction,
@@ -597,3 +602,90 @@ class TestDirectionToList(unittest.TestCase):
     def test_invalid_direction(self):
         with self.assertRaises(ValueError):
             direction_to_list("invalid direction")
+
+
+def make_tile(color: tuple[int, int, int, int]) -> pygame.surface.Surface:
+    tile = pygame.Surface((2, 2), pygame.SRCALPHA)
+    tile.fill(color)
+    return tile
+
+
+class TestMergedTileData(unittest.TestCase):
+    def setUp(self):
+        ground = make_tile((0, 255, 0, 255))
+        rock = make_tile((0, 0, 0, 0))
+        rock.fill((128, 128, 128, 255), (0, 0, 1, 1))
+        roof = make_tile((255, 0, 0, 255))
+        layers = [
+            [[1, 1], [1, 1]],
+            [[2, 0], [2, 0]],
+            [[0, 0], [0, 0]],
+            [[0, 3], [0, 0]],
+        ]
+        self.tmx = SimpleNamespace(
+            layers=[SimpleNamespace(data=data) for data in layers],
+            visible_tile_layers=range(4),
+            images=[None, ground, rock, roof],
+            tile_properties={},
+            width=2,
+            height=2,
+            tilewidth=2,
+            tileheight=2,
+        )
+        self.data = MergedTileData(self.tmx, [2])
+
+    def test_pyscroll_internals(self):
+        # the merged tiles replace the rendering of pyscroll using these
+        # private attributes, which must be checked on pyscroll upgrades
+        for name in (
+            "_animated_tile",
+            "_tracked_gids",
+            "_animation_map",
+            "_animation_queue",
+            "_last_time",
+            "_update_time",
+        ):
+            self.assertTrue(hasattr(self.data, name), name)
+        for name in ("next", "positions", "advance"):
+            self.assertTrue(hasattr(AnimationToken, name), name)
+
+    def test_groups(self):
+        self.assertEqual(self.data.groups, {2: [0, 1, 2], 3: [3]})
+        self.assertEqual(list(self.data.visible_tile_layers), [2, 3])
+
+    def test_groups_with_several_sprite_layers(self):
+        data = MergedTileData(self.tmx, [4, 0])
+        self.assertEqual(data.groups, {0: [0], 3: [1, 2, 3]})
+
+    def test_single_tile_is_not_merged(self):
+        self.assertIs(self.data.get_tile_image(1, 0, 3), self.tmx.images[3])
+        self.assertIs(self.data.get_tile_image(1, 0, 2), self.tmx.images[1])
+        self.assertIsNone(self.data.get_tile_image(0, 0, 3))
+
+    def test_merged_tile(self):
+        tile = self.data.get_tile_image(0, 0, 2)
+        self.assertEqual(tile.get_at((0, 0)), (128, 128, 128, 255))
+        self.assertEqual(tile.get_at((1, 1)), (0, 255, 0, 255))
+
+    def test_merged_tile_is_shared(self):
+        self.assertIs(
+            self.data.get_tile_image(0, 0, 2),
+            self.data.get_tile_image(0, 1, 2),
+        )
+        self.assertEqual(len(self.data.merged_tiles), 1)
+
+    def test_outside_of_map(self):
+        self.assertIsNone(self.data.get_tile_image(2, 0, 2))
+        self.assertIsNone(self.data.get_tile_image(-1, 0, 2))
+
+    def test_tile_images_by_rect(self):
+        tiles = list(self.data.get_tile_images_by_rect((-1, -1, 4, 4)))
+        self.assertEqual(
+            [tile[:3] for tile in tiles],
+            [(0, 0, 2), (1, 0, 2), (0, 1, 2), (1, 1, 2), (1, 0, 3)],
+        )
+
+    def test_clear_merged_tiles(self):
+        tile = self.data.get_tile_image(0, 0, 2)
+        self.data.clear_merged_tiles()
+        self.assertIsNot(self.data.get_tile_image(0, 0, 2), tile)
@@ -0,0 +1,176 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tuxemon import map_loader
+from tuxemon.event import EventObject, MapAction
+from tuxemon.map_loader import (
+    MapPreloader,
+    YAMLEventLoader,
+    linked_maps,
+    load_map_bundle,
+    save_map_bundle,
+)
+
+
+def make_event(*acts: MapAction) -> EventObject:
+    return EventObject(None, "event", 0, 0, 1, 1, [], list(acts))
+
+
+class TestLinkedMaps(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            map_loader.prepare,
+            "fetch",
+            side_effect=lambda *args: "/".join(args),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_linked_maps(self):
+        txmn_map = SimpleNamespace(
+            filename="maps/town.tmx",
+            inits=[],
+            events=[
+                make_event(
+                    MapAction("teleport", ["house.tmx", "1", "2"], None),
+                    MapAction("set_variable", ["a:b"], None),
+                ),
+                make_event(
+                    MapAction(
+                        "delayed_teleport",
+                        ["player", "route.tmx", "1", "2"],
+                        None,
+                    ),
+                    MapAction("transition_teleport", ["house.tmx"], None),
+                    MapAction("teleport", ["town.tmx", "3", "4"], None),
+                ),
+            ],
+        )
+        self.assertEqual(
+            linked_maps(txmn_map), ["maps/house.tmx", "maps/route.tmx"]
+        )
+
+
+class TestMapPreloader(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            map_loader,
+            "_preload_map",
+            side_effect=lambda path: SimpleNamespace(filename=path),
+        )
+        self.preload_map = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.preloader = MapPreloader(2)
+        self.addCleanup(self.preloader.clear)
+
+    def test_take_preloaded_map(self):
+        self.preloader.preload(["a.tmx"])
+        self.assertEqual(self.preloader.take("a.tmx").filename, "a.tmx")
+
+    def test_map_is_taken_once(self):
+        self.preloader.preload(["a.tmx"])
+        self.preloader.take("a.tmx")
+        self.assertIsNone(self.preloader.take("a.tmx"))
+
+    def test_map_is_preloaded_once(self):
+        self.preloader.preload(["a.tmx"])
+        self.preloader.preload(["a.tmx"])
+        self.preloader.take("a.tmx")
+        self.preload_map.assert_called_once_with("a.tmx")
+
+    def test_oldest_maps_are_dropped(self):
+        self.preloader.preload(["a.tmx", "b.tmx"])
+        self.preloader.preload(["c.tmx"])
+        self.assertIsNone(self.preloader.take("a.tmx"))
+        self.assertIsNotNone(self.preloader.take("b.tmx"))
+        self.assertIsNotNone(self.preloader.take("c.tmx"))
+
+    def test_failed_map_is_not_returned(self):
+        self.preload_map.side_effect = OSError
+        self.preloader.preload(["a.tmx"])
+        self.assertIsNone(self.preloader.take("a.tmx"))
+
+    def test_disabled(self):
+        preloader = MapPreloader(0)
+        preloader.preload(["a.tmx"])
+        self.assertIsNone(preloader.take("a.tmx"))
+        self.preload_map.assert_not_called()
+
+
+class TestMapBundle(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = mock.patch.object(
+            map_loader, "MAP_BUNDLE_DIR", os.path.join(tmp_dir.name, "cache")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.path = os.path.join(tmp_dir.name, "town.tmx")
+        self.yaml_path = os.path.join(tmp_dir.name, "town.yaml")
+        for path in (self.path, self.yaml_path):
+            with open(path, "w") as fp:
+                fp.write("data")
+        self.txmn_map = SimpleNamespace(
+            filename=self.path,
+            events=[make_event(MapAction("teleport", ["a.tmx"], None))],
+            inits=[],
+            surface_map={(0, 0): {"water": 1.0}},
+            collision_map={(1, 1): None},
+            collision_lines_map={((0, 0), "down")},
+            maps={},
+        )
+        self.tiles = {
+            ("tiles.png", (0, 0, 16, 16), None): (b"", (16, 16), True, None)
+        }
+
+    def test_bundle_round_trip(self):
+        save_map_bundle(self.txmn_map, self.tiles, [self.path, self.yaml_path])
+        bundle = load_map_bundle(self.path)
+        self.assertEqual(bundle["tiles"], self.tiles)
+        self.assertEqual(
+            bundle["map"]["surface_map"], {(0, 0): {"water": 1.0}}
+        )
+        self.assertEqual(bundle["map"]["events"], self.txmn_map.events)
+
+    def test_missing_bundle(self):
+        self.assertIsNone(load_map_bundle(self.path))
+
+    def test_bundle_is_outdated_when_a_source_changes(self):
+        save_map_bundle(self.txmn_map, self.tiles, [self.path, self.yaml_path])
+        with open(self.yaml_path, "w") as fp:
+            fp.write("changed")
+        self.assertIsNone(load_map_bundle(self.path))
+
+    def test_bundle_is_outdated_when_a_source_is_created(self):
+        missing = os.path.join(os.path.dirname(self.path), "scenario.yaml")
+        save_map_bundle(self.txmn_map, self.tiles, [self.path, missing])
+        self.assertIsNotNone(load_map_bundle(self.path))
+        with open(missing, "w") as fp:
+            fp.write("data")
+        self.assertIsNone(load_map_bundle(self.path))
+
+
+class TestYAMLEventLoader(unittest.TestCase):
+    def test_load_events_and_inits(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml") as fp:
+            fp.write(
+                "events:\n"
+                "  first:\n"
+                "    type: event\n"
+                '    actions: ["set_variable a:b"]\n'
+                "  second:\n"
+                "    type: init\n"
+            )
+            fp.flush()
+            both = YAMLEventLoader().load_events(fp.name)
+            only = YAMLEventLoader().load_events(fp.name, "init")
+        self.assertEqual([e.name for e in both["event"]], ["first"])
+        self.assertEqual([e.name for e in both["init"]], ["second"])
+        self.assertEqual(only["event"], [])
+        self.assertEqual([e.name for e in only["init"]], ["second"])
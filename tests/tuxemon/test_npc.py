@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import gc
+import unittest
+from unittest import mock
+
+import pygame
+
+from tuxemon import npc
+from tuxemon.npc import get_sprite_sheet
+from tuxemon.surfanim import PLAYING, STOPPED
+
+
+class TestSpriteSheet(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            npc,
+            "load_and_scale",
+            side_effect=lambda path: pygame.Surface((16, 32)),
+        )
+        self.load_and_scale = patcher.start()
+        self.addCleanup(patcher.stop)
+        npc.sprite_sheets.clear()
+
+    def test_sheet_is_shared(self):
+        sheet = get_sprite_sheet("adventurer", False)
+        self.assertIs(get_sprite_sheet("adventurer", False), sheet)
+        self.assertEqual(self.load_and_scale.call_count, 20)
+
+    def test_sheet_is_released(self):
+        get_sprite_sheet("adventurer", False)
+        gc.collect()
+        self.assertNotIn(("adventurer", False), npc.sprite_sheets)
+
+    def test_interactive_object(self):
+        sheet = get_sprite_sheet("chest", True)
+        self.assertEqual(sheet.size, (16, 32))
+        self.assertEqual(sheet.walking, {})
+        self.load_and_scale.assert_called_with("sprites_obj/chest.png")
+
+    def test_walking_animation_copy(self):
+        sheet = get_sprite_sheet("adventurer", False)
+        animation = sheet.walking["front_walk"]
+        first = animation.copy()
+        second = animation.copy()
+        first.play()
+        first.rate = 2.0
+        self.assertEqual(first.state, PLAYING)
+        self.assertEqual(second.state, STOPPED)
+        self.assertEqual(second.rate, 1.0)
+        self.assertIs(first.get_frame(0), second.get_frame(0))
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tuxemon import prepare
+from tuxemon.constants import paths
+
+
+class TestFetch(unittest.TestCase):
+    def setUp(self):
+        prepare.refresh_asset_index()
+        self.addCleanup(prepare.refresh_asset_index)
+
+    def test_fetch_file(self):
+        path = prepare.fetch("gfx", "sprites", "battle", "missing.png")
+        expected = os.path.join(
+            paths.mods_folder, "tuxemon", "gfx/sprites/battle/missing.png"
+        )
+        self.assertEqual(path, expected)
+
+    def test_fetch_folder(self):
+        path = prepare.fetch("l18n")
+        expected = os.path.join(paths.mods_folder, "tuxemon", "l18n")
+        self.assertEqual(path, expected)
+
+    def test_fetch_missing_file(self):
+        with self.assertRaises(OSError):
+            prepare.fetch("missing_file.png")
+
+    def test_fetch_missing_file_searched_once(self):
+        with self.assertRaises(OSError):
+            prepare.fetch("missing_file.png")
+        with mock.patch.object(prepare, "get_asset_roots") as get_asset_roots:
+            with self.assertRaises(OSError):
+                prepare.fetch("missing_file.png")
+        get_asset_roots.assert_not_called()
+
+    def test_build_asset_index_with_link_loop(self):
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "gfx"))
+            open(os.path.join(root, "gfx", "sprite.png"), "w").close()
+            os.symlink(root, os.path.join(root, "gfx", "loop"))
+            with mock.patch.object(
+                prepare, "get_asset_roots", return_value=[root]
+            ):
+                index = prepare.build_asset_index()
+        self.assertEqual(index[os.path.join("gfx", "sprite.png")], root)
+
+    def test_fetch_builds_index_once(self):
+        with mock.patch.object(
+            prepare, "build_asset_index", wraps=prepare.build_asset_index
+        ) as build_asset_index:
+            prepare.fetch("gfx", "sprites", "battle", "missing.png")
+            prepare.fetch("l18n")
+        build_asset_index.assert_called_once()
+
+    def test_concurrent_fetch_builds_index_once(self):
+        def build_asset_index():
+            time.sleep(0.05)
+            return {"l18n": "root"}
+
+        with mock.patch.object(
+            prepare, "build_asset_index", side_effect=build_asset_index
+        ) as build:
+            threads = [
+                threading.Thread(target=prepare.fetch, args=("l18n",))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        build.assert_called_once()
+
+    def test_refresh_asset_index_rebuilds_index(self):
+        prepare.fetch("l18n")
+        prepare.refresh_asset_index()
+        with mock.patch.object(
+            prepare, "build_asset_index", wraps=prepare.build_asset_index
+        ) as build_asset_index:
+            prepare.fetch("l18n")
+        build_asset_index.assert_called_once()
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import base64
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pygame
+
+from tuxemon import prepare, save
+from tuxemon.save_upgrader import SAVE_VERSION
+
+
+def make_save_data(time: str) -> dict:
+    screenshot = pygame.Surface((40, 20))
+    screenshot.fill((255, 0, 0))
+    return {
+        "screenshot": base64.b64encode(
+            pygame.image.tobytes(screenshot, "RGB")
+        ).decode(),
+        "screenshot_width": 40,
+        "screenshot_height": 20,
+        "time": time,
+        "version": SAVE_VERSION,
+        "player_name": "Red",
+        "current_map": "taba_town.tmx",
+        "template": {},
+        "monsters": [],
+        "monster_boxes": {},
+        "item_boxes": {},
+        "tuxepedia": {},
+    }
+
+
+class SaveTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patchers = [
+            mock.patch.object(
+                prepare, "SAVE_PATH", os.path.join(tmp_dir.name, "slot")
+            ),
+            mock.patch.object(prepare, "SAVE_METHOD", "JSON"),
+            mock.patch.object(save.config, "compress_save", None),
+            mock.patch.dict(save.saved_sections, clear=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestSaveHeader(SaveTestCase):
+    def test_header_is_saved(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        with mock.patch.object(save, "load") as load:
+            header = save.load_header(1)
+        load.assert_not_called()
+        self.assertEqual(header["player_name"], "Red")
+        self.assertEqual(header["current_map"], "taba_town.tmx")
+        self.assertEqual(header["version"], SAVE_VERSION)
+
+    def test_thumbnail(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        thumbnail = save.load_thumbnail(save.load_header(1))
+        self.assertEqual(thumbnail.get_size(), (10, 5))
+        self.assertEqual(thumbnail.get_at((5, 2))[:3], (255, 0, 0))
+
+    def test_missing_save(self):
+        self.assertIsNone(save.load_header(1))
+
+    def test_missing_header_is_written(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        os.remove(save.get_header_path(1))
+        self.assertEqual(save.load_header(1)["time"], "2024-01-01 10:00")
+        self.assertTrue(os.path.exists(save.get_header_path(1)))
+
+    def test_outdated_header_is_ignored(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        header_path = save.get_header_path(1)
+        os.replace(header_path, header_path + ".old")
+        save_data = make_save_data("2024-02-01 10:00")
+        save_data["player_name"] = "Blue"
+        save.save(save_data, 1)
+        os.replace(header_path + ".old", header_path)
+        self.assertEqual(save.load_header(1)["player_name"], "Blue")
+
+    def test_broken_save_header_is_stamped(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        os.remove(save.get_header_path(1))
+        with mock.patch.object(save, "open_save_file", return_value={}):
+            header = save.load_header(1)
+        self.assertEqual(header["player_name"], "BROKEN SAVE!")
+        self.assertIn("error", header)
+        with mock.patch.object(save, "load") as load:
+            self.assertIn("error", save.load_header(1))
+        load.assert_not_called()
+
+    def test_index_of_latest_save(self):
+        save.save(make_save_data("2024-01-01 10:00"), 1)
+        save.save(make_save_data("2024-03-01 10:00"), 2)
+        save.save(make_save_data("2024-02-01 10:00"), 3)
+        self.assertEqual(save.get_index_of_latest_save(), 1)
+
+
+class TestIncrementalSave(SaveTestCase):
+    def setUp(self):
+        super().setUp()
+        self.save_data = make_save_data("2024-01-01 10:00")
+        self.save_data["monster_boxes"] = {"Kennel": "[]", "Old": "[]"}
+        save.save(self.save_data, 4)
+        self.journal_path = save.get_journal_path(4)
+
+    def test_first_save_is_full(self):
+        save.saved_sections.clear()
+        save.save(self.save_data, 4, incremental=True)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_only_changed_sections_are_saved(self):
+        self.save_data["current_map"] = "route1.tmx"
+        self.save_data["monster_boxes"]["Kennel"] = '[{"slug": "bigfin"}]'
+        del self.save_data["monster_boxes"]["Old"]
+        save.save(self.save_data, 4, incremental=True)
+        with open(self.journal_path) as file:
+            sections = json.loads(file.readline())["sections"]
+        self.assertEqual(
+            sections,
+            {
+                "current_map": "route1.tmx",
+                "monster_boxes/Kennel": '[{"slug": "bigfin"}]',
+                "monster_boxes/Old": None,
+            },
+        )
+        save_data = save.load(4)
+        self.assertEqual(save_data["current_map"], "route1.tmx")
+        self.assertEqual(
+            save_data["monster_boxes"], {"Kennel": '[{"slug": "bigfin"}]'}
+        )
+
+    def test_header_is_updated(self):
+        self.save_data["time"] = "2024-01-02 10:00"
+        save.save(self.save_data, 4, incremental=True)
+        with mock.patch.object(save, "load") as load:
+            header = save.load_header(4)
+        load.assert_not_called()
+        self.assertEqual(header["time"], "2024-01-02 10:00")
+
+    def test_incomplete_record_is_ignored(self):
+        self.save_data["current_map"] = "route1.tmx"
+        save.save(self.save_data, 4, incremental=True)
+        with open(self.journal_path, "a") as file:
+            file.write('{"save_id": "')
+        self.assertEqual(save.load(4)["current_map"], "route1.tmx")
+
+    def test_full_save_replaces_journal(self):
+        self.save_data["current_map"] = "route1.tmx"
+        save.save(self.save_data, 4, incremental=True)
+        self.save_data["current_map"] = "route2.tmx"
+        save.save(self.save_data, 4)
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(save.load(4)["current_map"], "route2.tmx")
+
+    def test_records_of_other_saves_are_ignored(self):
+        self.save_data["current_map"] = "route1.tmx"
+        save.save(self.save_data, 4, incremental=True)
+        os.replace(self.journal_path, self.journal_path + ".old")
+        self.save_data["current_map"] = "route2.tmx"
+        save.save(self.save_data, 4)
+        os.replace(self.journal_path + ".old", self.journal_path)
+        self.assertEqual(save.load(4)["current_map"], "route2.tmx")
+
+    def test_failed_write_makes_next_save_full(self):
+        self.save_data["current_map"] = "route1.tmx"
+        with mock.patch.object(save.os, "fsync", side_effect=OSError):
+            with self.assertRaises(OSError):
+                save.save(self.save_data, 4, incremental=True)
+        self.assertNotIn(4, save.saved_sections)
+        save.save(self.save_data, 4, incremental=True)
+        self.assertFalse(os.path.exists(self.journal_path))
+        self.assertEqual(save.load(4)["current_map"], "route1.tmx")
+
+    def test_save_without_screenshot_keeps_thumbnail(self):
+        thumbnail = save.load_header(4)["thumbnail"]
+        for key in save.SCREENSHOT_KEYS:
+            del self.save_data[key]
+        self.save_data["time"] = "2024-01-02 10:00"
+        save.save(self.save_data, 4, incremental=True)
+        header = save.load_header(4)
+        self.assertEqual(header["time"], "2024-01-02 10:00")
+        self.assertEqual(header["thumbnail"], thumbnail)
+        with open(self.journal_path) as file:
+            sections = json.loads(file.readline())["sections"]
+        self.assertEqual(sections, {"time": "2024-01-02 10:00"})
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest import mock
+
+from tuxemon import prepare
+from tuxemon.db import db
+from tuxemon.simulation import (
+    BattleResult,
+    BattleSimulator,
+    MatchupStats,
+    SimulatedTrainer,
+    _init_worker,
+    create_monster,
+    simulate_battle,
+    simulate_battles,
+)
+
+
+class TestMatchupStats(unittest.TestCase):
+    def test_add_results(self):
+        stats = MatchupStats()
+        stats.add(BattleResult(0, 4))
+        stats.add(BattleResult(1, 2))
+        stats.add(BattleResult(0, 6))
+        stats.add(BattleResult(None, 100))
+        stats.add(BattleResult(None, 0, "error"))
+        self.assertEqual(stats.wins, [2, 1])
+        self.assertEqual(stats.draws, 1)
+        self.assertEqual(stats.errors, 1)
+        self.assertEqual(stats.battles, 5)
+        self.assertEqual(stats.win_rate, 0.5)
+        self.assertEqual(stats.mean_turns, 28.0)
+
+    def test_empty(self):
+        stats = MatchupStats()
+        self.assertEqual(stats.win_rate, 0.0)
+        self.assertEqual(stats.mean_turns, 0.0)
+
+
+class TestBattleSimulator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        db.load(snapshot=True)
+
+    def test_battle_has_winner(self):
+        result = simulate_battle(["rockitten"], ["bigfin"], level=20, seed=1)
+        self.assertIn(result.winner, (0, 1))
+        self.assertGreater(result.turns, 0)
+        self.assertIsNone(result.error)
+
+    def test_battle_is_reproducible(self):
+        results = [
+            simulate_battle(["rockitten", "nut"], ["bigfin"], seed=7)
+            for _ in range(2)
+        ]
+        self.assertEqual(results[0], results[1])
+
+    def test_winner_has_monsters_left(self):
+        players = (
+            SimulatedTrainer("a", [create_monster("rockitten", 20)]),
+            SimulatedTrainer("b", [create_monster("bigfin", 20)]),
+        )
+        result = BattleSimulator(players).run()
+        winner = players[result.winner]
+        loser = players[1 - result.winner]
+        self.assertTrue(any(m.current_hp > 0 for m in winner.monsters))
+        self.assertTrue(all(m.current_hp <= 0 for m in loser.monsters))
+
+    def test_battle_stops_after_max_turns(self):
+        result = simulate_battle(
+            ["rockitten"], ["bigfin"], level=50, seed=1, max_turns=1
+        )
+        self.assertEqual(result.turns, 1)
+
+    def test_simulate_battles_in_process(self):
+        matchups = [(["rockitten"], ["bigfin"])]
+        stats = simulate_battles(matchups, battles=5, processes=1)
+        self.assertEqual(stats[("rockitten",), ("bigfin",)].battles, 5)
+
+    def test_simulate_battles_counts_errors(self):
+        with mock.patch(
+            "tuxemon.simulation.simulate_battle", side_effect=ValueError
+        ):
+            stats = simulate_battles(
+                [(["rockitten"], ["bigfin"])], battles=3, processes=1
+            )
+        self.assertEqual(stats[("rockitten",), ("bigfin",)].errors, 3)
+
+
+class TestWorkerDatabase(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.dict(db.database, {"monster": {}}),
+            mock.patch.object(db, "load"),
+            mock.patch.object(db, "load_snapshot", return_value=True),
+            mock.patch.object(db, "save_snapshot"),
+            mock.patch.object(prepare.CONFIG, "db_snapshot", True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_worker_reads_snapshot_without_writing_it(self):
+        _init_worker()
+        db.load_snapshot.assert_called_once()
+        db.save_snapshot.assert_not_called()
+        db.load.assert_not_called()
+
+    def test_worker_loads_without_snapshot(self):
+        db.load_snapshot.return_value = False
+        _init_worker()
+        db.load.assert_called_once_with()
+
+    def test_worker_ignores_disabled_snapshot(self):
+        prepare.CONFIG.db_snapshot = False
+        _init_worker()
+        db.load_snapshot.assert_not_called()
+        db.load.assert_called_once_with()
+
+    def test_database_is_loaded_before_the_workers(self):
+        with mock.patch("tuxemon.simulation.multiprocessing.Pool") as pool:
+            simulate_battles([], processes=2)
+        db.load.assert_called_once_with(snapshot=True)
+        pool.assert_called_once()
+
+    def test_database_follows_snapshot_config(self):
+        prepare.CONFIG.db_snapshot = False
+        with mock.patch("tuxemon.simulation.multiprocessing.Pool"):
+            simulate_battles([], processes=2)
+        db.load.assert_called_once_with(snapshot=False)
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import json
+import unittest
+from unittest import mock
+
+from tuxemon.save_upgrader import upgrade_monsters
+from tuxemon.storage import StorageBoxes
+
+
+class TestStorageBoxes(unittest.TestCase):
+    def setUp(self):
+        self.decode = mock.Mock(
+            side_effect=lambda data: [item["slug"] for item in data]
+        )
+        self.encode = mock.Mock(
+            side_effect=lambda box: [{"slug": slug} for slug in box]
+        )
+        self.boxes = StorageBoxes(self.decode, self.encode)
+        self.boxes.load_sections(
+            {
+                "Kennel": json.dumps([{"slug": "rockitten"}]),
+                "Old": [{"slug": "bigfin"}],
+            }
+        )
+
+    def test_boxes_are_decoded_when_used(self):
+        self.assertIn("Kennel", self.boxes)
+        self.assertEqual(list(self.boxes), ["Kennel", "Old"])
+        self.decode.assert_not_called()
+        self.assertEqual(self.boxes["Kennel"], ["rockitten"])
+        self.assertTrue(self.boxes.is_decoded("Kennel"))
+        self.assertFalse(self.boxes.is_decoded("Old"))
+
+    def test_box_is_decoded_once(self):
+        self.boxes["Kennel"].append("bigfin")
+        self.assertEqual(self.boxes["Kennel"], ["rockitten", "bigfin"])
+        self.decode.assert_called_once()
+
+    def test_pending_boxes_are_saved_unchanged(self):
+        sections = self.boxes.get_sections()
+        self.assertEqual(sections["Kennel"], '[{"slug": "rockitten"}]')
+        self.assertEqual(json.loads(sections["Old"]), [{"slug": "bigfin"}])
+        self.encode.assert_not_called()
+
+    def test_decoded_boxes_are_encoded(self):
+        self.boxes["Kennel"].append("bigfin")
+        self.boxes["New"] = ["sumobug"]
+        sections = self.boxes.get_sections()
+        self.assertEqual(
+            json.loads(sections["Kennel"]),
+            [{"slug": "rockitten"}, {"slug": "bigfin"}],
+        )
+        self.assertEqual(json.loads(sections["New"]), [{"slug": "sumobug"}])
+
+    def test_remove_box(self):
+        self.assertEqual(self.boxes.pop("Old"), ["bigfin"])
+        self.assertNotIn("Old", self.boxes)
+
+
+class TestUpgradeMonsters(unittest.TestCase):
+    def test_upgrade_monsters(self):
+        monsters = [{"slug": "axylightl", "plague": "infected"}]
+        upgrade_monsters(monsters)
+        self.assertEqual(monsters[0]["slug"], "axolightl")
+        self.assertEqual(list(monsters[0]["plague"]), ["spyderbite"])
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest import mock
+
+from tuxemon.db import TechniqueModel, db
+from tuxemon.technique.technique import Technique, decode_moves
+
+
+def make_model(power: float) -> TechniqueModel:
+    return TechniqueModel(
+        tech_id=69,
+        accuracy=0.85,
+        flip_axes="",
+        potency=0.5,
+        power=power,
+        range="melee",
+        recharge=1,
+        sfx="sfx_blaster",
+        slug="ram",
+        sort="damage",
+        target={
+            "enemy_monster": True,
+            "enemy_team": False,
+            "enemy_trainer": False,
+            "own_monster": False,
+            "own_team": False,
+            "own_trainer": False,
+        },
+        types=[],
+        category="simple",
+        tags=["animal"],
+        use_tech="combat_used_x",
+    )
+
+
+class TestTechniquePrototype(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(
+            db.database, {"technique": {"ram": make_model(1.5)}}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_techniques_share_prototype(self):
+        first, second = decode_moves([{"slug": "ram"}, {"slug": "ram"}])
+        self.assertIs(first.prototype, second.prototype)
+        self.assertIs(first.effects, second.effects)
+        self.assertEqual(first.power, 1.5)
+        self.assertTrue(first.target["enemy_monster"])
+
+    def test_definition_is_parsed_once(self):
+        Technique().load("ram")
+        with mock.patch.object(Technique, "parse_effects") as parse:
+            Technique().load("ram")
+        parse.assert_not_called()
+
+    def test_state_is_per_technique(self):
+        first, second = decode_moves([{"slug": "ram"}, {"slug": "ram"}])
+        first.power = 3.0
+        first.next_use = 2
+        self.assertEqual(second.power, 1.5)
+        self.assertEqual(second.next_use, 0)
+        first.set_stats()
+        self.assertEqual(first.power, 1.5)
+
+    def test_load_resets_state(self):
+        tech = Technique()
+        tech.load("ram")
+        tech.power = 3.0
+        tech.load("ram")
+        self.assertEqual(tech.power, 1.5)
+
+    def test_prototype_follows_database(self):
+        Technique().load("ram")
+        db.database["technique"]["ram"] = make_model(2.0)
+        tech = Technique()
+        tech.load("ram")
+        self.assertEqual(tech.power, 2.0)
+
+    def test_empty_technique(self):
+        tech = Technique()
+        self.assertEqual(tech.slug, "")
+        self.assertEqual(tech.effects, ())
+        self.assertEqual(
+            tech.get_state(), {"instance_id": tech.instance_id.hex}
+        )
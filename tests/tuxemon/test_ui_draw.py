@@ -6,15 +6,18 @@ import unittest
 import pygame
 from pygame import Rect
 
+from tuxemon import prepare
 from tuxemon.ui.draw import (
     GraphicBox,
     blit_alpha,
     build_line,
     constrain_width,
+    get_glyph_atlas,
     guess_rendered_text_size,
     guest_font_height,
     iter_render_text,
     layout,
+    layout_text,
     shadow_text,
 )
 
@@ -128,6 +131,41 @@ class TestIterRenderText(unittest.TestCase):
         )
 
 
+class TestGlyphAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        # the pixel font of the game
+        self.font = pygame.font.Font(
+            prepare.fetch("font", prepare.FONT_BASIC), 21
+        )
+        self.atlas = get_glyph_atlas(self.font, (0, 0, 0), (255, 255, 255))
+
+    def test_atlas_is_shared(self):
+        atlas = get_glyph_atlas(
+            self.font, pygame.Color(0, 0, 0), [255, 255, 255]
+        )
+        self.assertIs(atlas, self.atlas)
+        other = get_glyph_atlas(self.font, (255, 0, 0), (255, 255, 255))
+        self.assertIsNot(other, self.atlas)
+
+    def test_glyph_is_rendered_once(self):
+        self.assertIs(self.atlas.glyph("a"), self.atlas.glyph("a"))
+
+    def test_line_offsets_match_prefix_widths(self):
+        line = "AVA Tuxemon!"
+        self.assertEqual(
+            self.atlas.line_offsets(line),
+            [self.font.size(line[:i])[0] for i in range(len(line))],
+        )
+
+    def test_layout_text(self):
+        rect = pygame.Rect(10, 20, 200, 200)
+        glyphs = layout_text("ab c", self.atlas, rect)
+        self.assertEqual([char for _, _, char in glyphs], ["a", "b", "c"])
+        self.assertEqual(glyphs[0][:2], (10, 20))
+        self.assertEqual(glyphs[2][0], 10 + self.font.size("ab ")[0])
+
+
 class TestShadowText(unittest.TestCase):
 
     def setUp(self):
@@ -1,8 +1,16 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
+from unittest.mock import MagicMock
 
-from tuxemon.states.world.world_classes import BoundaryChecker
+from tuxemon.db import Direction
+from tuxemon.map import RegionProperties
+from tuxemon.states.world.world_classes import (
+    BoundaryChecker,
+    NavigationGrid,
+    astar,
+    manhattan_distance,
+)
 
 
 class TestBoundaryChecker(unittest.TestCase):
@@ -38,3 +46,130 @@ class TestBoundaryChecker(unittest.TestCase):
             repr(self.checker),
             "BoundaryChecker(invalid_x=(-1, 5), invalid_y=(-1, 7))",
         )
+
+
+class TestNavigationGrid(unittest.TestCase):
+    def setUp(self):
+        self.region = RegionProperties([Direction.up], [], [], None, None)
+        self.collision_map = {(1, 1): self.region, (2, 2): None}
+        self.surface_map = {(3, 3): {"water": 0.0}, (4, 4): {"grass": 1.0}}
+        self.grid = NavigationGrid()
+        self.grid.load(self.collision_map, self.surface_map)
+        self.entity = MagicMock()
+
+    def test_collision_map_entries(self):
+        self.assertIs(self.grid[(1, 1)], self.region)
+        self.assertIsNone(self.grid[(2, 2)])
+
+    def test_collision_map_changes_are_visible(self):
+        self.collision_map[(5, 5)] = None
+        self.assertIn((5, 5), self.grid)
+
+    def test_blocked_terrain(self):
+        self.assertEqual(self.grid[(3, 3)].key, "water")
+        self.assertNotIn((4, 4), self.grid)
+
+    def test_update_terrain(self):
+        self.grid.update_terrain((3, 3), {"water": 1.0})
+        self.grid.update_terrain((4, 4), {"grass": 0.0})
+        self.assertNotIn((3, 3), self.grid)
+        self.assertEqual(self.grid[(4, 4)].key, "grass")
+
+    def test_entity_occupancy(self):
+        self.grid.add_entity(self.entity, (6, 6))
+        self.assertIs(self.grid[(6, 6)].entity, self.entity)
+        self.grid.move_entity(self.entity, (6, 7))
+        self.assertNotIn((6, 6), self.grid)
+        self.assertIs(self.grid[(6, 7)].entity, self.entity)
+        self.grid.remove_entity(self.entity)
+        self.assertNotIn((6, 7), self.grid)
+
+    def test_get_occupant(self):
+        other = MagicMock()
+        self.grid.add_entity(self.entity, (6, 6))
+        self.grid.add_entity(other, (6, 6))
+        self.assertIs(self.grid.get_occupant((6, 6)), self.entity)
+        self.grid.move_entity(self.entity, (7, 7))
+        self.assertIs(self.grid.get_occupant((6, 6)), other)
+        self.assertIsNone(self.grid.get_occupant((8, 8)))
+
+    def test_move_untracked_entity(self):
+        self.grid.move_entity(self.entity, (6, 6))
+        self.assertNotIn((6, 6), self.grid)
+
+    def test_collision_map_overrides_occupancy(self):
+        self.grid.add_entity(self.entity, (1, 1))
+        self.assertIs(self.grid[(1, 1)], self.region)
+
+    def test_iter_and_len(self):
+        self.grid.add_entity(self.entity, (1, 1))
+        self.grid.add_entity(MagicMock(), (6, 6))
+        self.assertEqual(set(self.grid), {(1, 1), (2, 2), (3, 3), (6, 6)})
+        self.assertEqual(len(self.grid), 4)
+
+    def test_set_region(self):
+        region = RegionProperties([], [], [], None, "door")
+        self.grid.set_region((5, 5), region)
+        self.assertIs(self.collision_map[(5, 5)], region)
+        self.assertEqual(self.grid.get_zone("door"), [(5, 5)])
+
+    def test_set_region_replaces_zone(self):
+        self.grid.set_region((5, 5), RegionProperties([], [], [], None, "a"))
+        self.grid.set_region((5, 5), RegionProperties([], [], [], None, "b"))
+        self.assertEqual(self.grid.get_zone("a"), [])
+        self.assertEqual(self.grid.get_zone("b"), [(5, 5)])
+
+    def test_remove_region(self):
+        self.grid.set_region((5, 5), RegionProperties([], [], [], None, "a"))
+        self.grid.remove_region((5, 5))
+        self.grid.remove_region((5, 5))
+        self.assertNotIn((5, 5), self.collision_map)
+        self.assertEqual(self.grid.get_zone("a"), [])
+
+    def test_zones_indexed_on_load(self):
+        region = RegionProperties([], [], [], None, "door")
+        self.grid.load({(1, 2): region, (3, 4): None}, {})
+        self.assertEqual(self.grid.get_zone("door"), [(1, 2)])
+
+    def test_entity_region_is_reused(self):
+        self.grid.add_entity(self.entity, (6, 6))
+        self.assertIs(self.grid[(6, 6)], self.grid[(6, 6)])
+
+    def test_load_clears_entities(self):
+        self.grid.add_entity(self.entity, (6, 6))
+        self.grid.load({}, {})
+        self.assertEqual(len(self.grid), 0)
+
+
+class TestAStar(unittest.TestCase):
+    def get_exits(self, blocked, size=5):
+        def exits(position):
+            x, y = position
+            for adj in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= adj[0] < size and 0 <= adj[1] < size:
+                    if adj not in blocked:
+                        yield adj
+
+        return exits
+
+    def test_manhattan_distance(self):
+        self.assertEqual(manhattan_distance((0, 0), (3, -2)), 5)
+
+    def test_straight_path(self):
+        path = astar((0, 0), (3, 0), self.get_exits(set()))
+        self.assertEqual(path, [(3, 0), (2, 0), (1, 0)])
+
+    def test_path_around_wall(self):
+        wall = {(1, 0), (1, 1), (1, 2), (1, 3)}
+        path = astar((0, 0), (2, 0), self.get_exits(wall))
+        self.assertEqual(len(path), 10)
+        self.assertEqual(path[0], (2, 0))
+        self.assertEqual(path[-1], (0, 1))
+        self.assertTrue(wall.isdisjoint(path))
+
+    def test_no_path(self):
+        wall = {(1, 0), (1, 1), (1, 2), (1, 3), (1, 4)}
+        self.assertIsNone(astar((0, 0), (2, 0), self.get_exits(wall)))
+
+    def test_start_is_destination(self):
+        self.assertEqual(astar((1, 1), (1, 1), self.get_exits(set())), [])
@@ -125,6 +125,18 @@ class MusicPlayerState:
         return f"MusicPlayerState(status={self.status}, current_song={self.current_song}, previous_song={self.previous_song})"
 
 
+class SilentMusicPlayerState(MusicPlayerState):
+    """Music player keeping track of the songs, without loading them."""
+
+    def load(
+        self, filename: str, volume: float, loop: int, fade_ms: int
+    ) -> None:
+        pass
+
+    def is_playing(self) -> bool:
+        return self.status == MusicStatus.playing
+
+
 class SoundProtocol(Protocol):
     def play(self) -> None:
         pass
@@ -188,3 +200,12 @@ class SoundManager:
     ) -> None:
         sound = self.load_sound(slug, value)
         sound.play()
+
+
+class SilentSoundManager(SoundManager):
+    """Sound manager that never loads nor plays any sound."""
+
+    def load_sound(
+        self, slug: str, value: float = prepare.SOUND_VOLUME
+    ) -> SoundProtocol:
+        return SoundWrapper()
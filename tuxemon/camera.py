@@ -103,6 +103,21 @@ class Camera:
             Vector2(self.entity.position3.x, self.entity.position3.y)
         )
 
+    def get_draw_position(self, time_delta: float) -> Vector2:
+        """
+        Returns the position where the camera is drawn from.
+
+        Parameters:
+            time_delta: Time elapsed since the last update.
+
+        Returns:
+            Vector2: The position of the camera, following the moving
+            entity if the camera is set to follow it.
+        """
+        if self.follows_entity:
+            return self.get_center(self.entity.get_draw_position(time_delta))
+        return self.position
+
     def update(self) -> None:
         """
         Updates the camera's position if it's set to follow the entity.
@@ -12,14 +12,25 @@ from typing import Any, Optional, TypeVar, Union, overload
 import pygame as pg
 
 from tuxemon import networking, prepare, rumble
-from tuxemon.audio import MusicPlayerState, SoundManager
+from tuxemon.audio import (
+    MusicPlayerState,
+    SilentMusicPlayerState,
+    SilentSoundManager,
+    SoundManager,
+)
 from tuxemon.cli.processor import CommandProcessor
+from tuxemon.clock import Scheduler
 from tuxemon.config import TuxemonConfig
 from tuxemon.db import MapType
 from tuxemon.event import EventObject
 from tuxemon.event.eventengine import EventEngine
 from tuxemon.map import TuxemonMap
-from tuxemon.platform.events import PlayerInput
+from tuxemon.platform.events import (
+    EventQueueHandler,
+    HeadlessEventQueueHandler,
+    PlayerInput,
+    VirtualInput,
+)
 from tuxemon.platform.platform_pygame.events import (
     PygameEventQueueHandler,
     PygameGamepadInput,
@@ -33,6 +44,9 @@ from tuxemon.states.world.worldstate import WorldState
 
 StateType = TypeVar("StateType", bound=State)
 
+# longest time simulated in one frame, in seconds
+MAX_FRAME_TIME = 0.25
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,29 +76,23 @@ class LocalPygameClient:
         self.fps = config.fps
         self.show_fps = config.show_fps
         self.current_time = 0.0
+        self.time_step = 1.0 / self.fps
+        # time not simulated yet, drawing can use it to extrapolate motion
+        self.frame_lag = 0.0
+        self.scheduler = Scheduler()
+
+        # states drawn in the last frames, used to present dirty areas
+        self.drawn_states: Sequence[State] = []
+        self._previous_drawn_states: Sequence[State] = []
+        self._previous_dirty_rects: list[pg.rect.Rect] = []
 
         # somehow this value is being patched somewhere
         self.events: Sequence[EventObject] = []
         self.inits: list[EventObject] = []
 
         # setup controls
-        keyboard = PygameKeyboardInput(config.keyboard_button_map)
-        gamepad = PygameGamepadInput(
-            config.gamepad_button_map,
-            config.gamepad_deadzone,
-        )
-        self.input_manager = PygameEventQueueHandler()
-        self.input_manager.add_input(0, keyboard)
-        self.input_manager.add_input(0, gamepad)
-        self.controller_overlay = None
-        if config.controller_overlay:
-            self.controller_overlay = PygameTouchOverlayInput(
-                config.controller_transparency,
-            )
-            self.controller_overlay.load()
-            self.input_manager.add_input(0, self.controller_overlay)
-        if not config.hide_mouse:
-            self.input_manager.add_input(0, PygameMouseInput())
+        self.controller_overlay: Optional[PygameTouchOverlayInput] = None
+        self.input_manager = self.create_input_manager(config)
 
         # movie creation
         self.frame_number = 0
@@ -129,6 +137,36 @@ class LocalPygameClient:
         self.event_data: dict[str, Any] = {}
         self.exit = False
 
+    def create_input_manager(self, config: TuxemonConfig) -> EventQueueHandler:
+        """
+        Create the handler of the input devices.
+
+        Parameters:
+            config: The config for the game.
+
+        Returns:
+            Handler of the events of the keyboard, gamepad, mouse and touch
+            overlay.
+
+        """
+        keyboard = PygameKeyboardInput(config.keyboard_button_map)
+        gamepad = PygameGamepadInput(
+            config.gamepad_button_map,
+            config.gamepad_deadzone,
+        )
+        input_manager = PygameEventQueueHandler()
+        input_manager.add_input(0, keyboard)
+        input_manager.add_input(0, gamepad)
+        if config.controller_overlay:
+            self.controller_overlay = PygameTouchOverlayInput(
+                config.controller_transparency,
+            )
+            self.controller_overlay.load()
+            input_manager.add_input(0, self.controller_overlay)
+        if not config.hide_mouse:
+            input_manager.add_input(0, PygameMouseInput())
+        return input_manager
+
     def on_state_change(self) -> None:
         logger.debug("resetting controls due to state change")
         self.release_controls()
@@ -145,6 +183,8 @@ class LocalPygameClient:
         self.inits = list(map_data.inits)
         self.event_engine.reset()
         self.event_engine.current_map = map_data
+        self.event_engine.compile_events(self.events)
+        self.event_engine.compile_events(self.inits)
         self.maps = map_data.maps
 
         # Map properties
@@ -275,38 +315,52 @@ class LocalPygameClient:
         """
         Initiates the main game loop.
 
-        Since we are using Asteria networking to handle network events,
-        we pass this session.Client instance to networking which in turn
-        executes the "main_loop" method every frame.
-        This leaves the networking component responsible for the main loop.
+        The game is updated with a fixed timestep of ``1 / fps`` seconds,
+        so the game logic does not depend on the frame rate. After the
+        updates that are due, a frame is drawn, using the time not yet
+        simulated (:attr:`frame_lag`) to draw moving things between two
+        updates. Then the loop sleeps until the next update is due.
 
         """
         update = self.update
-        draw = self.draw
         screen = self.screen
-        flip = pg.display.update
-        clock = time.time
-        frame_length = 1.0 / self.fps
-        time_since_draw = 0.0
-        last_update = clock()
+        scheduler = self.scheduler
+        clock = time.perf_counter
+        sleep = time.sleep
+        time_step = self.time_step
         fps_timer = 0.0
         frames = 0
 
+        scheduler.tick()
+        deadline = clock()
         while not self.exit:
-            clock_tick = clock() - last_update
-            last_update = clock()
-            time_since_draw += clock_tick
-            update(clock_tick)
-            if time_since_draw >= frame_length:
-                time_since_draw -= frame_length
-                draw(screen)
-                if self.controller_overlay:
-                    self.controller_overlay.draw(screen)
-                flip()
-                frames += 1
+            clock_tick = scheduler.tick()
+
+            # if the game was stalled, drop the time instead of trying to
+            # catch up with many updates in a row
+            self.frame_lag = min(self.frame_lag + clock_tick, MAX_FRAME_TIME)
+            while self.frame_lag >= time_step and not self.exit:
+                update(time_step)
+                self.frame_lag -= time_step
+
+            self.draw(screen)
+            if self.controller_overlay:
+                self.controller_overlay.draw(screen)
+            self.present()
+            frames += 1
 
             fps_timer, frames = self.handle_fps(clock_tick, fps_timer, frames)
-            time.sleep(0.01)
+
+            deadline += time_step
+            now = clock()
+            if deadline <= now:
+                # running late, do not sleep
+                deadline = now
+                continue
+            idle = scheduler.get_idle_time()
+            if idle is None or idle > deadline - now:
+                idle = deadline - now
+            sleep(idle)
 
     def update(self, time_delta: float) -> None:
         """
@@ -404,6 +458,7 @@ class LocalPygameClient:
         # draw from bottom up for proper layering
         for state in reversed(to_draw):
             state.draw(surface)
+        self.drawn_states = to_draw
 
         if self.config.collision_map:
             self.draw_event_debug()
@@ -413,6 +468,59 @@ class LocalPygameClient:
             self.frame_number += 1
             pg.image.save(self.screen, filename)
 
+    def present(self) -> None:
+        """
+        Show the last drawn frame on the display.
+
+        See :meth:`get_dirty_rects`.
+
+        """
+        rects = self.get_dirty_rects()
+        if rects is None:
+            pg.display.update()
+        elif rects:
+            pg.display.update(rects)
+
+    def get_dirty_rects(self) -> Optional[list[pg.rect.Rect]]:
+        """
+        Get the areas of the screen that changed since the last frame.
+
+        Only used if ``dirty_rects`` is enabled in the config. If the
+        states drawn are the same as in the last frame and only states
+        smaller than the screen are drawn over static states (see
+        :attr:`State.static`), only the areas of those states, now and
+        in the last frame, changed.
+
+        Returns:
+            Areas to update, or ``None`` if the whole screen must be
+            updated.
+
+        """
+        drawn_states = self.drawn_states
+        previous_states = self._previous_drawn_states
+        self._previous_drawn_states = drawn_states
+        previous_rects = self._previous_dirty_rects
+        self._previous_dirty_rects = []
+
+        if (
+            not self.config.dirty_rects
+            or self.config.collision_map
+            or self.controller_overlay
+            or drawn_states != previous_states
+        ):
+            return None
+
+        full_screen = self.screen.get_rect()
+        rects = []
+        for state in drawn_states:
+            if not state.static:
+                if state.rect.contains(full_screen):
+                    return None
+                rects.append(state.rect.copy())
+
+        self._previous_dirty_rects = rects
+        return rects + previous_rects
+
     def handle_fps(
         self,
         clock_tick: float,
@@ -464,8 +572,7 @@ class LocalPygameClient:
 
         """
         world = self.get_state_by_name(WorldState)
-        world.npcs = []
-        world.npcs_off_map = []
+        world.clear_npcs()
         for client in registry:
             if "sprite" in registry[client]:
                 sprite = registry[client]["sprite"]
@@ -475,7 +582,7 @@ class LocalPygameClient:
                 # Add the player to the screen if they are on the same map.
                 if client_map == current_map:
                     if sprite not in world.npcs:
-                        world.npcs.append(sprite)
+                        world.add_entity(sprite)
                     if sprite in world.npcs_off_map:
                         world.npcs_off_map.remove(sprite)
 
@@ -484,7 +591,7 @@ class LocalPygameClient:
                     if sprite not in world.npcs_off_map:
                         world.npcs_off_map.append(sprite)
                     if sprite in world.npcs:
-                        world.npcs.remove(sprite)
+                        world.remove_npc(sprite)
 
     def get_map_filepath(self) -> Optional[str]:
         """
@@ -615,3 +722,56 @@ class LocalPygameClient:
     def active_state_names(self) -> Sequence[str]:
         """List of names of active states"""
         return self.state_manager.get_active_state_names()
+
+
+class HeadlessClient(LocalPygameClient):
+    """
+    Client running the game logic without window, audio or input devices.
+
+    The states, the event engine and the world are updated exactly as in
+    :class:`LocalPygameClient`, but nothing is drawn and the game is not
+    paced by the wall clock: each update advances a fixed timestep of
+    ``1 / config.fps`` seconds, as fast as possible. Inputs can be sent
+    through :attr:`virtual_input`.
+
+    Parameters:
+        config: The config for the game.
+
+    """
+
+    def __init__(self, config: TuxemonConfig) -> None:
+        super().__init__(config)
+        self.frames = 0
+        self.current_music = SilentMusicPlayerState()
+        self.sound_manager = SilentSoundManager()
+
+    def create_input_manager(self, config: TuxemonConfig) -> EventQueueHandler:
+        self.virtual_input = VirtualInput()
+        input_manager = HeadlessEventQueueHandler()
+        input_manager.add_input(0, self.virtual_input)
+        return input_manager
+
+    def main(self) -> None:
+        """Run the game until it quits."""
+        self.run()
+
+    def run(self, max_frames: Optional[int] = None) -> int:
+        """
+        Update the game with a fixed timestep, without drawing it.
+
+        Parameters:
+            max_frames: Maximum number of updates, if any. Otherwise the
+                game runs until it quits.
+
+        Returns:
+            Number of updates done.
+
+        """
+        update = self.update
+        time_step = self.time_step
+        frames = 0
+        while not self.exit and (max_frames is None or frames < max_frames):
+            update(time_step)
+            frames += 1
+        self.frames += frames
+        return frames
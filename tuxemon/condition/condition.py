@@ -5,13 +5,21 @@ from __future__ import annotations
 import logging
 import uuid
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 from tuxemon import plugin
 from tuxemon.condition.condcondition import CondCondition
 from tuxemon.condition.condeffect import CondEffect, CondEffectResult
 from tuxemon.constants import paths
-from tuxemon.db import CategoryCondition, Range, ResponseCondition, db
+from tuxemon.db import (
+    CategoryCondition,
+    ConditionModel,
+    Range,
+    ResponseCondition,
+    StatModel,
+    db,
+)
 from tuxemon.locale import T
 
 if TYPE_CHECKING:
@@ -26,6 +34,50 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+@dataclass(frozen=True)
+class ConditionPrototype:
+    """
+    Definition of a condition, shared by the conditions with its slug.
+
+    It holds what is parsed from the condition database: the translated
+    strings, and the effect and condition objects.
+
+    """
+
+    slug: str = ""
+    name: str = ""
+    description: str = ""
+    sort: str = ""
+    gain_cond: str = ""
+    use_success: str = ""
+    use_failure: str = ""
+    icon: str = ""
+    statspeed: Optional[StatModel] = None
+    stathp: Optional[StatModel] = None
+    statarmour: Optional[StatModel] = None
+    statmelee: Optional[StatModel] = None
+    statranged: Optional[StatModel] = None
+    statdodge: Optional[StatModel] = None
+    duration: int = 0
+    bond: bool = False
+    category: Optional[CategoryCondition] = None
+    repl_pos: Optional[ResponseCondition] = None
+    repl_neg: Optional[ResponseCondition] = None
+    repl_tech: Optional[str] = None
+    repl_item: Optional[str] = None
+    range: Range = Range.melee
+    cond_id: int = 0
+    conditions: Sequence[CondCondition] = ()
+    effects: Sequence[CondEffect] = ()
+    animation: Optional[str] = None
+    flip_axes: str = ""
+    sfx: str = ""
+
+
+EMPTY_PROTOTYPE = ConditionPrototype()
+PROTOTYPE_FIELDS = {f.name for f in fields(ConditionPrototype)}
+
+
 class Condition:
     """
     Particular condition that tuxemon monsters can be affected.
@@ -34,39 +86,51 @@ class Condition:
 
     effects_classes: ClassVar[Mapping[str, type[CondEffect]]] = {}
     conditions_classes: ClassVar[Mapping[str, type[CondCondition]]] = {}
+    prototypes: ClassVar[
+        dict[str, tuple[ConditionModel, ConditionPrototype]]
+    ] = {}
+
+    # read from the prototype of the condition, unless set on the condition
+    slug: str
+    name: str
+    description: str
+    sort: str
+    gain_cond: str
+    use_success: str
+    use_failure: str
+    icon: str
+    statspeed: Optional[StatModel]
+    stathp: Optional[StatModel]
+    statarmour: Optional[StatModel]
+    statmelee: Optional[StatModel]
+    statranged: Optional[StatModel]
+    statdodge: Optional[StatModel]
+    duration: int
+    bond: bool
+    category: Optional[CategoryCondition]
+    repl_pos: Optional[ResponseCondition]
+    repl_neg: Optional[ResponseCondition]
+    repl_tech: Optional[str]
+    repl_item: Optional[str]
+    range: Range
+    cond_id: int
+    conditions: Sequence[CondCondition]
+    effects: Sequence[CondEffect]
+    animation: Optional[str]
+    flip_axes: str
+    sfx: str
 
     def __init__(self, save_data: Optional[Mapping[str, Any]] = None) -> None:
         save_data = save_data or {}
 
+        self.prototype = EMPTY_PROTOTYPE
         self.instance_id = uuid.uuid4()
         self.steps = 0.0
-        self.bond = False
         self.counter = 0
-        self.cond_id = 0
-        self.animation: Optional[str] = None
-        self.category: Optional[CategoryCondition] = None
         self.combat_state: Optional[CombatState] = None
-        self.conditions: Sequence[CondCondition] = []
-        self.description = ""
-        self.effects: Sequence[CondEffect] = []
-        self.flip_axes = ""
-        self.gain_cond = ""
-        self.icon = ""
         self.link: Optional[Monster] = None
-        self.name = ""
         self.nr_turn = 0
-        self.duration = 0
         self.phase: Optional[str] = None
-        self.range = Range.melee
-        self.repl_pos: Optional[ResponseCondition] = None
-        self.repl_neg: Optional[ResponseCondition] = None
-        self.repl_tech: Optional[str] = None
-        self.repl_item: Optional[str] = None
-        self.sfx = ""
-        self.sort = ""
-        self.slug = ""
-        self.use_success = ""
-        self.use_failure = ""
 
         # load effect and condition plugins if it hasn't been done already
         if not Condition.effects_classes:
@@ -83,6 +147,13 @@ class Condition:
 
         self.set_state(save_data)
 
+    def __getattr__(self, name: str) -> Any:
+        # the attributes which aren't set on the condition are shared
+        # by the conditions with the same slug
+        if name == "prototype":
+            raise AttributeError(name)
+        return getattr(self.prototype, name)
+
     def load(self, slug: str) -> None:
         """
         Loads and sets this condition's attributes from the condition
@@ -91,57 +162,75 @@ class Condition:
         Parameters:
             The slug of the condition to look up in the database.
         """
+        self.prototype = self.load_prototype(slug)
+        for name in PROTOTYPE_FIELDS & vars(self).keys():
+            delattr(self, name)
+
+    @classmethod
+    def load_prototype(cls, slug: str) -> ConditionPrototype:
+        """
+        Gets the definition of a condition, shared by its instances.
+
+        The condition is looked up in the database, and its strings and
+        effects are only parsed the first time its slug is loaded.
+
+        Parameters:
+            slug: The slug of the condition to look up in the database.
+
+        Returns:
+            The definition of the condition.
+
+        """
         try:
             results = db.lookup(slug, table="condition")
         except KeyError:
             raise RuntimeError(f"Condition {slug} not found")
 
-        self.slug = results.slug  # a short English identifier
-        self.name = T.translate(self.slug)
-        self.description = T.translate(f"{self.slug}_description")
-
-        self.sort = results.sort
-
-        # condition use notifications (translated!)
-        self.gain_cond = T.maybe_translate(results.gain_cond)
-        self.use_success = T.maybe_translate(results.use_success)
-        self.use_failure = T.maybe_translate(results.use_failure)
-
-        self.icon = results.icon
-        self.counter = self.counter
-        self.steps = self.steps
-
-        # monster stats
-        self.statspeed = results.statspeed
-        self.stathp = results.stathp
-        self.statarmour = results.statarmour
-        self.statmelee = results.statmelee
-        self.statranged = results.statranged
-        self.statdodge = results.statdodge
-        # status fields
-        self.duration = results.duration
-        self.bond = results.bond or self.bond
-        self.category = results.category or self.category
-        self.repl_neg = results.repl_neg or self.repl_neg
-        self.repl_pos = results.repl_pos or self.repl_pos
-        self.repl_tech = results.repl_tech or self.repl_tech
-        self.repl_item = results.repl_item or self.repl_item
-
-        self.range = results.range or Range.melee
-        self.cond_id = results.cond_id or self.cond_id
-
-        self.conditions = self.parse_conditions(results.conditions)
-        self.effects = self.parse_effects(results.effects)
-
-        # Load the animation sprites that will be used for this condition
-        self.animation = results.animation
-        self.flip_axes = results.flip_axes
-
-        # Load the sound effect for this condition
-        self.sfx = results.sfx
+        # the prototype is rebuilt if the database was reloaded
+        cached = cls.prototypes.get(slug)
+        if cached is not None and cached[0] is results:
+            return cached[1]
+
+        prototype = ConditionPrototype(
+            slug=results.slug,  # a short English identifier
+            name=T.translate(results.slug),
+            description=T.translate(f"{results.slug}_description"),
+            sort=results.sort,
+            # condition use notifications (translated!)
+            gain_cond=T.maybe_translate(results.gain_cond),
+            use_success=T.maybe_translate(results.use_success),
+            use_failure=T.maybe_translate(results.use_failure),
+            icon=results.icon,
+            # monster stats
+            statspeed=results.statspeed,
+            stathp=results.stathp,
+            statarmour=results.statarmour,
+            statmelee=results.statmelee,
+            statranged=results.statranged,
+            statdodge=results.statdodge,
+            # status fields
+            duration=results.duration,
+            bond=results.bond or EMPTY_PROTOTYPE.bond,
+            category=results.category or EMPTY_PROTOTYPE.category,
+            repl_neg=results.repl_neg or EMPTY_PROTOTYPE.repl_neg,
+            repl_pos=results.repl_pos or EMPTY_PROTOTYPE.repl_pos,
+            repl_tech=results.repl_tech or EMPTY_PROTOTYPE.repl_tech,
+            repl_item=results.repl_item or EMPTY_PROTOTYPE.repl_item,
+            range=results.range or Range.melee,
+            cond_id=results.cond_id or EMPTY_PROTOTYPE.cond_id,
+            conditions=cls.parse_conditions(results.conditions),
+            effects=cls.parse_effects(results.effects),
+            # Load the animation sprites that will be used for this condition
+            animation=results.animation,
+            flip_axes=results.flip_axes,
+            # Load the sound effect for this condition
+            sfx=results.sfx,
+        )
+        cls.prototypes[slug] = (results, prototype)
+        return prototype
 
+    @staticmethod
     def parse_effects(
-        self,
         raw: Sequence[str],
     ) -> Sequence[CondEffect]:
         """
@@ -173,8 +262,8 @@ class Condition:
 
         return effects
 
+    @staticmethod
     def parse_conditions(
-        self,
         raw: Sequence[str],
     ) -> Sequence[CondCondition]:
         """
@@ -37,6 +37,7 @@ class TuxemonConfig:
         self.fullscreen = cfg.getboolean("display", "fullscreen")
         self.fps = cfg.getfloat("display", "fps")
         self.show_fps = cfg.getboolean("display", "show_fps")
+        self.dirty_rects = cfg.getboolean("display", "dirty_rects")
         self.scaling = cfg.getboolean("display", "scaling")
         self.collision_map = cfg.getboolean("display", "collision_map")
         self.large_gui = cfg.getboolean("display", "large_gui")
@@ -50,6 +51,7 @@ class TuxemonConfig:
         )
         self.hide_mouse = cfg.getboolean("display", "hide_mouse")
         self.window_caption = cfg.get("display", "window_caption")
+        self.merge_tile_layers = cfg.getboolean("display", "merge_tile_layers")
 
         # [game]
         self.data = cfg.get("game", "data")
@@ -68,6 +70,11 @@ class TuxemonConfig:
         self.compress_save: Optional[str] = cfg.get("game", "compress_save")
         if self.compress_save == "None":
             self.compress_save = None
+        self.db_snapshot = cfg.getboolean("game", "db_snapshot")
+        self.db_lazy = cfg.getboolean("game", "db_lazy")
+        self.db_workers = cfg.getint("game", "db_workers")
+        self.preload_maps = cfg.getint("game", "preload_maps")
+        self.map_bundles = cfg.getboolean("game", "map_bundles")
 
         # [gameplay]
         self.items_consumed_on_failure = cfg.getboolean(
@@ -193,6 +200,7 @@ def get_defaults() -> Mapping[str, Any]:
                         ("fullscreen", "False"),
                         ("fps", "60"),
                         ("show_fps", "False"),
+                        ("dirty_rects", "False"),
                         ("scaling", "True"),
                         ("collision_map", "False"),
                         ("large_gui", "False"),
@@ -200,6 +208,7 @@ def get_defaults() -> Mapping[str, Any]:
                         ("controller_transparency", "45"),
                         ("hide_mouse", "True"),
                         ("window_caption", "Tuxemon"),
+                        ("merge_tile_layers", "False"),
                     )
                 ),
             ),
@@ -215,6 +224,11 @@ def get_defaults() -> Mapping[str, Any]:
                         ("dev_tools", "False"),
                         ("recompile_translations", "True"),
                         ("compress_save", "None"),
+                        ("db_snapshot", "True"),
+                        ("db_lazy", "False"),
+                        ("db_workers", "1"),
+                        ("preload_maps", "4"),
+                        ("map_bundles", "True"),
                     )
                 ),
             ),
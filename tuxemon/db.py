@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
 import logging
 import os
+import pickle
+import re
 import sys
-from collections.abc import Mapping, Sequence
+from collections.abc import (
+    Container,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from typing import Annotated, Any, Literal, Optional, Union, overload
 
@@ -27,12 +37,17 @@ from tuxemon.locale import T
 
 logger = logging.getLogger(__name__)
 
-# Load the default translator for data validation
-T.collect_languages(False)
-T.load_translator()
-
 SurfaceKeys = prepare.SURFACE_KEYS
 
+# Bump whenever a data model changes, so that stale snapshots are discarded
+DB_SNAPSHOT_VERSION: int = 1
+DB_SNAPSHOT_PATH = os.path.join(paths.CACHE_DIR, "db_snapshot.pickle")
+# Mod folders holding the sprites and translations checked by the validators
+DB_SNAPSHOT_RESOURCES = ("gfx", "animations", "l18n")
+
+# Matches the slug in the header of a JSON file holding a single entry
+SLUG_HEADER = re.compile(r'"slug"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
 
 class Direction(str, Enum):
     up = "up"
@@ -1454,6 +1469,74 @@ DataModel = Union[
 ]
 
 
+# A lazy index entry is either the path of a JSON file holding a single
+# entry, or the raw entry already parsed from a file holding a list
+IndexEntry = Union[str, Mapping[str, Any]]
+
+
+class LazyTable(MutableMapping[str, Any]):
+    """
+    Database table whose models are built on first access.
+
+    The table is backed by an index of every slug, built by reading only
+    the header of each JSON file, so that looking up a few entries doesn't
+    require parsing and validating the whole table.
+
+    Parameters:
+        db: The database owning the table.
+        table: The name of the table.
+        index: Mapping of each slug to the entry defining it.
+
+    """
+
+    def __init__(
+        self,
+        db: JSONDatabase,
+        table: TableName,
+        index: dict[str, Optional[IndexEntry]],
+    ) -> None:
+        self._db = db
+        self._table = table
+        self._index = index
+        self._models: dict[str, Any] = {}
+
+    def __getitem__(self, slug: str) -> Any:
+        if slug in self._models:
+            return self._models[slug]
+        entry = self._index[slug]
+        model = None
+        if entry is not None:
+            model = self._db.build_lazy_model(entry, self._table, slug)
+        if model is None:
+            # don't retry entries which failed to load
+            del self._index[slug]
+            raise KeyError(slug)
+        self._models[slug] = model
+        return model
+
+    def __setitem__(self, slug: str, model: Any) -> None:
+        self._models[slug] = model
+        self._index.setdefault(slug, None)
+
+    def __delitem__(self, slug: str) -> None:
+        del self._index[slug]
+        self._models.pop(slug, None)
+
+    def __contains__(self, slug: object) -> bool:
+        return slug in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def loaded(self) -> int:
+        """Number of models built so far."""
+        return len(self._models)
+
+
 class JSONDatabase:
     """
     Handles connecting to the game database for resources.
@@ -1482,7 +1565,7 @@ class JSONDatabase:
             "mission",
         ]
         self.preloaded: dict[TableName, dict[str, Any]] = {}
-        self.database: dict[TableName, dict[str, Any]] = {}
+        self.database: dict[TableName, MutableMapping[str, Any]] = {}
         self.path = ""
         for table in self._tables:
             self.preloaded[table] = {}
@@ -1512,6 +1595,9 @@ class JSONDatabase:
         self,
         directory: Union[TableName, Literal["all"]] = "all",
         validate: bool = False,
+        snapshot: bool = False,
+        lazy: bool = False,
+        workers: int = 1,
     ) -> None:
         """
         Loads all data from JSON files located under our data path.
@@ -1521,13 +1607,228 @@ class JSONDatabase:
                 to "all".
             validate: Whether or not we should raise an exception if validation
                 fails
+            snapshot: Whether or not the compiled snapshot of the database
+                should be used (and refreshed if outdated). Only applies when
+                loading "all" tables without validation.
+            lazy: Whether or not only an index of the slugs should be built,
+                deferring the construction of each model to its first lookup.
+                Ignored when validating.
+            workers: Number of worker processes used to parse and validate
+                the JSON files. Defaults to 1, loading them sequentially.
+
+        """
+        if lazy and not validate:
+            tables = self._tables if directory == "all" else [directory]
+            for table in tables:
+                self.database[table] = LazyTable(
+                    self, table, self.index_json(table)
+                )
+            return
+
+        use_snapshot = snapshot and directory == "all" and not validate
+        if use_snapshot:
+            key = self.snapshot_key()
+            if self.load_snapshot(key):
+                return
+
+        if workers > 1:
+            self.load_parallel(directory, validate, workers)
+        else:
+            self.preload(directory)
+            for table, entries in self.preloaded.items():
+                for slug, item in entries.items():
+                    self.load_model(item, table, validate)
+            self.clear_preloaded()
+
+        if use_snapshot:
+            self.save_snapshot(key)
+
+    def load_parallel(
+        self,
+        directory: Union[TableName, Literal["all"]],
+        validate: bool,
+        workers: int,
+    ) -> None:
+        """
+        Loads all data from JSON files on a pool of worker processes.
+
+        Files are parsed and entries are validated in the workers, while the
+        results are merged in the same order as the sequential loader, so
+        that the mods override each other exactly in the same way.
+
+        Parameters:
+            directory: The directory under mods/tuxemon/db/ to load.
+            validate: Whether or not we should raise an exception if validation
+                fails
+            workers: Number of worker processes.
+
+        """
+        tables = self._tables if directory == "all" else [directory]
+        files: list[tuple[TableName, str, str]] = []
+        for table in tables:
+            for mod_directory in prepare.CONFIG.mods:
+                path = os.path.join(
+                    paths.mods_folder, mod_directory, "db", table
+                )
+                if not os.path.isdir(path):
+                    continue
+                for json_item in os.listdir(path):
+                    if json_item.endswith(".json"):
+                        json_path = os.path.join(path, json_item)
+                        files.append((table, path, json_path))
+
+        # compile the translations once, before the workers load them
+        T.build_translations()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(
+                _read_json_file,
+                [json_path for _, _, json_path in files],
+                chunksize=PARALLEL_CHUNK_SIZE,
+            )
+            for (table, path, _), items in zip(files, parsed):
+                for item in items:
+                    self.load_dict(item, table, path)
+
+            # slugs are all the workers need to validate references
+            slugs = {
+                table: set(self.preloaded[table])
+                for table in tables
+                if self.preloaded[table]
+            }
+            chunks: list[tuple[TableName, list[Mapping[str, Any]]]] = []
+            for table in tables:
+                items = list(self.preloaded[table].values())
+                for i in range(0, len(items), PARALLEL_CHUNK_SIZE):
+                    chunks.append((table, items[i : i + PARALLEL_CHUNK_SIZE]))
+            built = executor.map(
+                _build_models,
+                [table for table, _ in chunks],
+                [items for _, items in chunks],
+                [slugs] * len(chunks),
+            )
+            for (table, _), results in zip(chunks, built):
+                for slug, model, error in results:
+                    if model is None:
+                        logger.error(
+                            f"validation failed for '{slug}': {error}"
+                        )
+                        if validate:
+                            raise ValueError(error)
+                    elif slug in self.database[table]:
+                        logger.warning(
+                            "Error: Item with slug %s was already loaded.",
+                            slug,
+                        )
+                    else:
+                        self.database[table][slug] = model
+        self.clear_preloaded()
+
+    def clear_preloaded(self) -> None:
+        """Releases the untyped preloaded entries of every table."""
+        for table in self._tables:
+            self.preloaded[table] = {}
+
+    def snapshot_key(self) -> str:
+        """
+        Computes the key identifying the current state of the JSON files.
+
+        The key covers the snapshot format, the enabled mods, the locale
+        used for validating translations and the name, size and
+        modification time of every JSON file and of every resource file
+        checked by the validators, so any change invalidates the snapshot.
+
+        Returns:
+            Hexadecimal digest of the current database sources.
+
+        """
+        digest = hashlib.sha256()
+        header = (
+            DB_SNAPSHOT_VERSION,
+            sys.version_info[:2],
+            prepare.CONFIG.locale,
+            prepare.CONFIG.mods,
+        )
+        digest.update(repr(header).encode())
+        for mod_directory in prepare.CONFIG.mods:
+            path = os.path.join(paths.mods_folder, mod_directory, "db")
+            for table in self._tables:
+                table_path = os.path.join(path, table)
+                if not os.path.isdir(table_path):
+                    continue
+                entries = sorted(os.scandir(table_path), key=lambda e: e.name)
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    stat = entry.stat()
+                    line = f"{entry.path}:{stat.st_size}:{stat.st_mtime_ns}"
+                    digest.update(line.encode())
+            for resource in DB_SNAPSHOT_RESOURCES:
+                resource_path = os.path.join(
+                    paths.mods_folder, mod_directory, resource
+                )
+                for root, dirs, files in os.walk(resource_path):
+                    dirs.sort()
+                    for name in sorted(files):
+                        file_path = os.path.join(root, name)
+                        stat = os.stat(file_path)
+                        line = f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}"
+                        digest.update(line.encode())
+        return digest.hexdigest()
+
+    def load_snapshot(self, key: str) -> bool:
+        """
+        Loads the validated models from the compiled snapshot.
+
+        Parameters:
+            key: The expected snapshot key, see snapshot_key.
+
+        Returns:
+            Whether the snapshot was up to date and loaded.
+
+        """
+        try:
+            with open(DB_SNAPSHOT_PATH, "rb") as fp:
+                snapshot = pickle.load(fp)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Cannot read database snapshot: {e}")
+            return False
+
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != DB_SNAPSHOT_VERSION
+            or snapshot.get("key") != key
+        ):
+            logger.debug("database snapshot is outdated")
+            return False
+
+        for table in self._tables:
+            self.database[table] = snapshot["database"].get(table, {})
+        logger.debug("database loaded from snapshot")
+        return True
 
+    def save_snapshot(self, key: str) -> None:
         """
-        self.preload(directory)
-        for table, entries in self.preloaded.items():
-            for slug, item in entries.items():
-                self.load_model(item, table, validate)
-        self.preloaded.clear()
+        Writes the loaded models to the compiled snapshot.
+
+        Parameters:
+            key: The snapshot key of the loaded sources.
+
+        """
+        snapshot = {
+            "version": DB_SNAPSHOT_VERSION,
+            "key": key,
+            "database": self.database,
+        }
+        snapshot_path_tmp = DB_SNAPSHOT_PATH + ".tmp"
+        try:
+            os.makedirs(paths.CACHE_DIR, exist_ok=True)
+            with open(snapshot_path_tmp, "wb") as fp:
+                pickle.dump(snapshot, fp, pickle.HIGHEST_PROTOCOL)
+            os.replace(snapshot_path_tmp, DB_SNAPSHOT_PATH)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Cannot write database snapshot: {e}")
 
     def _load_json_files(self, directory: TableName) -> None:
         for json_item in os.listdir(os.path.join(self.path, directory)):
@@ -1570,6 +1871,86 @@ class JSONDatabase:
             ):
                 self._load_json_files(directory)
 
+    def index_json(
+        self, directory: TableName
+    ) -> dict[str, Optional[IndexEntry]]:
+        """
+        Indexes all JSON items under a specified path without building them.
+
+        Files holding a single entry are only scanned for the slug in their
+        header, while files holding a list of entries are parsed. As with
+        load_json, the first mod defining a slug takes precedence.
+
+        Parameters:
+            directory: The directory under mods/mod_name/db/ to look in.
+
+        Returns:
+            Mapping of each slug to the entry defining it.
+
+        """
+        index: dict[str, Optional[IndexEntry]] = {}
+        for mod_directory in prepare.CONFIG.mods:
+            path = os.path.join(paths.mods_folder, mod_directory, "db")
+            table_path = os.path.join(path, directory)
+            if not os.path.isdir(table_path):
+                continue
+            for json_item in os.listdir(table_path):
+                if not json_item.endswith(".json"):
+                    continue
+                json_path = os.path.join(table_path, json_item)
+                with open(json_path) as fp:
+                    text = fp.read()
+                if text.lstrip().startswith("["):
+                    try:
+                        items = json.loads(text)
+                    except ValueError as e:
+                        logger.error(f"Invalid JSON {json_item}: {e}")
+                        continue
+                    for sub in items:
+                        index.setdefault(sub["slug"], sub)
+                else:
+                    match = SLUG_HEADER.search(text)
+                    if match is None:
+                        logger.error(f"No slug found in {json_item}")
+                        continue
+                    slug = json.loads(f'"{match.group(1)}"')
+                    index.setdefault(slug, json_path)
+        return index
+
+    def build_lazy_model(
+        self, entry: IndexEntry, table: TableName, slug: str
+    ) -> Optional[DataModel]:
+        """
+        Builds the model of an entry of the lazy index.
+
+        Parameters:
+            entry: The index entry, see index_json.
+            table: The db table the entry belongs to.
+            slug: The slug the entry was indexed with.
+
+        Returns:
+            The model, or None if the entry couldn't be loaded.
+
+        """
+        if isinstance(entry, str):
+            with open(entry) as fp:
+                try:
+                    item = json.load(fp)
+                except ValueError as e:
+                    logger.error(f"Invalid JSON {entry}: {e}")
+                    return None
+            if item.get("slug") != slug:
+                logger.error(f"Unexpected slug in {entry}, expected {slug}")
+                return None
+        else:
+            item = entry
+
+        try:
+            return self.build_model(item, table)
+        except (ValidationError, ValueError) as e:
+            logger.error(f"validation failed for '{slug}': {e}")
+            return None
+
     def load_dict(
         self, item: Mapping[str, Any], table: TableName, path: str
     ) -> None:
@@ -1617,61 +1998,62 @@ class JSONDatabase:
             return
 
         try:
-            if table == "economy":
-                economy = EconomyModel(**item)
-                self.database[table][economy.slug] = economy
-            elif table == "element":
-                element = ElementModel(**item)
-                self.database[table][element.slug] = element
-            elif table == "shape":
-                shape = ShapeModel(**item)
-                self.database[table][shape.slug] = shape
-            elif table == "template":
-                template = TemplateModel(**item)
-                self.database[table][template.slug] = template
-            elif table == "mission":
-                mission = MissionModel(**item)
-                self.database[table][mission.slug] = mission
-            elif table == "encounter":
-                encounter = EncounterModel(**item)
-                self.database[table][encounter.slug] = encounter
-            elif table == "dialogue":
-                dialogue = DialogueModel(**item)
-                self.database[table][dialogue.slug] = dialogue
-            elif table == "environment":
-                env = EnvironmentModel(**item)
-                self.database[table][env.slug] = env
-            elif table == "item":
-                itm = ItemModel(**item)
-                self.database[table][itm.slug] = itm
-            elif table == "monster":
-                mon = MonsterModel(**item)
-                self.database[table][mon.slug] = mon
-            elif table == "music":
-                music = MusicModel(**item)
-                self.database[table][music.slug] = music
-            elif table == "animation":
-                animation = AnimationModel(**item)
-                self.database[table][animation.slug] = animation
-            elif table == "npc":
-                npc = NpcModel(**item)
-                self.database[table][npc.slug] = npc
-            elif table == "sounds":
-                sfx = SoundModel(**item)
-                self.database[table][sfx.slug] = sfx
-            elif table == "condition":
-                cond = ConditionModel(**item)
-                self.database[table][cond.slug] = cond
-            elif table == "technique":
-                teq = TechniqueModel(**item)
-                self.database[table][teq.slug] = teq
-            else:
-                raise ValueError(f"Unexpected {table =}")
+            model = self.build_model(item, table)
+            self.database[table][model.slug] = model
         except (ValidationError, ValueError) as e:
             logger.error(f"validation failed for '{item['slug']}': {e}")
             if validate:
                 raise e
 
+    def build_model(
+        self, item: Mapping[str, Any], table: TableName
+    ) -> DataModel:
+        """
+        Casts a single json object to the appropriate data model.
+
+        Parameters:
+            item: The json object to cast.
+            table: The db table the object belongs to.
+
+        Returns:
+            The data model.
+
+        """
+        if table == "economy":
+            return EconomyModel(**item)
+        elif table == "element":
+            return ElementModel(**item)
+        elif table == "shape":
+            return ShapeModel(**item)
+        elif table == "template":
+            return TemplateModel(**item)
+        elif table == "mission":
+            return MissionModel(**item)
+        elif table == "encounter":
+            return EncounterModel(**item)
+        elif table == "dialogue":
+            return DialogueModel(**item)
+        elif table == "environment":
+            return EnvironmentModel(**item)
+        elif table == "item":
+            return ItemModel(**item)
+        elif table == "monster":
+            return MonsterModel(**item)
+        elif table == "music":
+            return MusicModel(**item)
+        elif table == "animation":
+            return AnimationModel(**item)
+        elif table == "npc":
+            return NpcModel(**item)
+        elif table == "sounds":
+            return SoundModel(**item)
+        elif table == "condition":
+            return ConditionModel(**item)
+        elif table == "technique":
+            return TechniqueModel(**item)
+        else:
+            raise ValueError(f"Unexpected {table =}")
+
     @overload
     def lookup(self, slug: str) -> MonsterModel:
         pass
@@ -1773,10 +2155,11 @@ class JSONDatabase:
         if not table_entry:
             logger.exception(f"{table} table wasn't loaded")
             sys.exit()
-        if slug not in table_entry:
+        model = table_entry.get(slug)
+        if model is None:
             self.log_missing_entry_and_exit(table, slug)
         else:
-            return table_entry[slug]
+            return model
 
     def lookup_file(self, table: TableName, slug: str) -> str:
         """
@@ -1807,7 +2190,7 @@ class JSONDatabase:
         if not table_entry:
             logger.exception(f"{table} table wasn't loaded")
             sys.exit()
-        return slug in table_entry
+        return table_entry.get(slug) is not None
 
     def log_missing_entry_and_exit(
         self,
@@ -1853,9 +2236,12 @@ class Validator:
 
     """
 
-    def __init__(self) -> None:
-        self.db = JSONDatabase()
-        self.db.preload()
+    def __init__(self, db: JSONDatabase) -> None:
+        self.db = db
+        # slugs indexed from the JSON files, with the table they were read for
+        self._indexes: dict[
+            TableName, tuple[MutableMapping[str, Any], set[str]]
+        ] = {}
 
     def translation(self, msgid: str) -> bool:
         """
@@ -1970,9 +2356,36 @@ class Validator:
 
         """
 
-        if slug in self.db.preloaded[table]:
-            return True
-        return False
+        return slug in self.get_slugs(table)
+
+    def get_slugs(self, table: TableName) -> Container[str]:
+        """
+        Get the slugs of the given table, without building any model.
+
+        While the database is being loaded, the raw preloaded entries are
+        used. Otherwise the slugs are resolved on demand from the lazy
+        table or from an index of the JSON files, built once per loaded
+        table.
+
+        Parameters:
+            table: Which index to do the search in.
+
+        Returns:
+            The slugs of the table.
+
+        """
+        if self.db.preloaded[table]:
+            return self.db.preloaded[table]
+        table_entry = self.db.database[table]
+        if isinstance(table_entry, LazyTable):
+            return table_entry
+        # the index is rebuilt if the database was reloaded
+        cached = self._indexes.get(table)
+        if cached is not None and cached[0] is table_entry:
+            return cached[1]
+        slugs = set(self.db.index_json(table))
+        self._indexes[table] = (table_entry, slugs)
+        return slugs
 
     def validate_variables(self, variables: Sequence[str]) -> Sequence[str]:
         """
@@ -2004,8 +2417,61 @@ class Validator:
         return variables
 
 
-# Validator container
-has = Validator()
+# Number of files, or entries, handed at once to a worker process
+PARALLEL_CHUNK_SIZE: int = 32
+
+
+def _read_json_file(path: str) -> list[Mapping[str, Any]]:
+    """
+    Parses a JSON file of the database in a worker process.
+
+    Parameters:
+        path: The path of the JSON file.
+
+    Returns:
+        The entries of the file.
+
+    """
+    with open(path) as fp:
+        try:
+            item = json.load(fp)
+        except ValueError as e:
+            logger.error(f"Invalid JSON {os.path.basename(path)}: {e}")
+            return []
+    return item if type(item) is list else [item]
+
+
+def _build_models(
+    table: TableName,
+    items: Sequence[Mapping[str, Any]],
+    slugs: Mapping[TableName, set[str]],
+) -> list[tuple[str, Optional[DataModel], str]]:
+    """
+    Casts entries to their data model in a worker process.
+
+    Parameters:
+        table: The db table the entries belong to.
+        items: The json objects to cast.
+        slugs: The preloaded slugs of each table, used by the validators.
+
+    Returns:
+        The slug, the model (None if validation failed) and the validation
+        error of each entry.
+
+    """
+    for slug_table, table_slugs in slugs.items():
+        has._indexes[slug_table] = (db.database[slug_table], table_slugs)
+    results: list[tuple[str, Optional[DataModel], str]] = []
+    for item in items:
+        try:
+            results.append((item["slug"], db.build_model(item, table), ""))
+        except (ValidationError, ValueError) as e:
+            results.append((item["slug"], None, str(e)))
+    return results
+
 
 # Global database container
 db = JSONDatabase()
+
+# Validator container, sharing the entries preloaded by the global database
+has = Validator(db)
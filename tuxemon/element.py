@@ -4,17 +4,34 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from tuxemon import prepare
 from tuxemon.db import ElementItemModel, ElementType, db
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from tuxemon.monster import Monster
+    from tuxemon.technique.technique import Technique
+
 logger = logging.getLogger(__name__)
 
+# id of each element in the element matrix
+ELEMENT_IDS: dict[str, int] = {
+    element: index for index, element in enumerate(ElementType)
+}
+AETHER_ID = ELEMENT_IDS[ElementType.aether]
+
 
 class Element:
     """An Element holds a list of types and multipliers."""
 
     def __init__(self, slug: Optional[str] = None) -> None:
+        self.id: int = -1
         self.name: str = ""
         self.icon: str = ""
         self.types: Sequence[ElementItemModel] = []
@@ -30,6 +47,7 @@ class Element:
             raise RuntimeError(f"Element {slug} not found")
 
         self.slug = results.slug
+        self.id = ELEMENT_IDS[results.slug]
         self.name = results.slug.name
         self.types = results.types
         self.icon = results.icon
@@ -53,3 +71,148 @@ class Element:
             )
             return 1.0
         return mult
+
+
+class ElementMatrix:
+    """
+    Multipliers of every element against every other element.
+
+    The multipliers are indexed by the ids in :data:`ELEMENT_IDS`, so
+    looking up a multiplier doesn't search the types of the element.
+    If NumPy is installed, :meth:`score` computes the multipliers of many
+    techniques and opponents at once.
+
+    Parameters:
+        rows: Multipliers of each attacking element against each target
+            element.
+
+    """
+
+    def __init__(self, rows: Sequence[Sequence[float]]) -> None:
+        low, high = prepare.MULTIPLIER_RANGE
+        self.rows = tuple(tuple(row) for row in rows)
+        self.clamped = tuple(
+            tuple(min(high, max(low, mult)) for mult in row)
+            for row in self.rows
+        )
+        self.array = None if np is None else np.array(self.clamped)
+
+    @classmethod
+    def from_db(cls) -> ElementMatrix:
+        """Build the matrix from the element table."""
+        rows = []
+        for attack in ElementType:
+            try:
+                element = Element(attack)
+            except RuntimeError as e:
+                logger.error(e)
+                rows.append([1.0] * len(ELEMENT_IDS))
+            else:
+                rows.append(
+                    [element.lookup_multiplier(t) for t in ElementType]
+                )
+        return cls(rows)
+
+    @staticmethod
+    def damage_id(types: Sequence[Element]) -> int:
+        """
+        Id of the element of the types that counts for the damage.
+
+        The damage multiplier of a technique only depends on the last of
+        its types and the last of the types of the target, ignoring aether.
+
+        Parameters:
+            types: Types of a technique or monster.
+
+        Returns:
+            The id of the element, or -1 if no type counts.
+
+        """
+        for element in reversed(types):
+            if element and element.id != AETHER_ID:
+                return element.id
+        return -1
+
+    def damage_multiplier(
+        self,
+        attack_types: Sequence[Element],
+        target_types: Sequence[Element],
+    ) -> float:
+        """
+        Multiplier of the attack types against the target types.
+
+        Parameters:
+            attack_types: The types of the technique.
+            target_types: The types of the target.
+
+        Returns:
+            The multiplier, within the multiplier range.
+
+        """
+        attack = self.damage_id(attack_types)
+        target = self.damage_id(target_types)
+        if attack < 0 or target < 0:
+            return 1.0
+        return self.clamped[attack][target]
+
+    def combined_multiplier(
+        self,
+        monster_types: Sequence[Element],
+        opponent_types: Sequence[Element],
+    ) -> float:
+        """
+        Product of the multipliers of every pair of types.
+
+        Parameters:
+            monster_types: The types of the monster.
+            opponent_types: The types of the opponent.
+
+        Returns:
+            The product of the multipliers, ignoring aether and the types
+            without an id.
+
+        """
+        multiplier = 1.0
+        for monster in monster_types:
+            if monster.id < 0 or monster.id == AETHER_ID:
+                continue
+            row = self.rows[monster.id]
+            for opponent in opponent_types:
+                if opponent and opponent.id >= 0 and opponent.id != AETHER_ID:
+                    multiplier *= row[opponent.id]
+        return multiplier
+
+    def score(
+        self,
+        techniques: Sequence[Technique],
+        opponents: Sequence[Monster],
+    ) -> Any:
+        """
+        Damage multipliers of every technique against every opponent.
+
+        Parameters:
+            techniques: The techniques, e.g. of a whole party.
+            opponents: The monsters targeted by the techniques.
+
+        Returns:
+            A table with a row for each technique and a column for each
+            opponent. A NumPy array if NumPy is installed, otherwise a
+            list of lists.
+
+        """
+        if self.array is None:
+            return [
+                [
+                    self.damage_multiplier(tech.types, mon.types)
+                    for mon in opponents
+                ]
+                for tech in techniques
+            ]
+        attack = np.array(
+            [self.damage_id(tech.types) for tech in techniques], dtype=int
+        )[:, None]
+        target = np.array(
+            [self.damage_id(mon.types) for mon in opponents], dtype=int
+        )[None, :]
+        valid = (attack >= 0) & (target >= 0)
+        return np.where(valid, self.array[attack, target], 1.0)
@@ -7,7 +7,7 @@ from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from tuxemon.map import RegionProperties, proj
-from tuxemon.math import Point3, Vector3
+from tuxemon.math import Point3, Vector2, Vector3
 from tuxemon.session import Session
 from tuxemon.tools import vector2_to_tile_pos
 
@@ -39,9 +39,9 @@ class Entity(Generic[SaveDict]):
     ) -> None:
         self.slug = slug
         self.world = world
+        self._tile_pos = (0, 0)
         world.add_entity(self)
         self.instance_id = uuid.uuid4()
-        self.tile_pos = (0, 0)
         self.position3 = Point3(0, 0, 0)
         # not used currently
         self.acceleration3 = Vector3(0, 0, 0)
@@ -49,6 +49,16 @@ class Entity(Generic[SaveDict]):
         self.update_location = False
         self.isplayer: bool = False
 
+    @property
+    def tile_pos(self) -> tuple[int, int]:
+        """Tile where the entity stands."""
+        return self._tile_pos
+
+    @tile_pos.setter
+    def tile_pos(self, value: tuple[int, int]) -> None:
+        self._tile_pos = value
+        self.world.navigation.move_entity(self, value)
+
     # === PHYSICS START =======================================================
     def stop_moving(self) -> None:
         """
@@ -74,6 +84,20 @@ class Entity(Generic[SaveDict]):
         self.position3 += self.velocity3 * td
         self.pos_update()
 
+    def get_draw_position(self, time_delta: float) -> Vector2:
+        """
+        Get the position where the entity is drawn.
+
+        Parameters:
+            time_delta: Time elapsed since the last update. The entity is
+                drawn where it would be by now if it keeps moving.
+
+        Returns:
+            Position of the entity, in tiles.
+
+        """
+        return proj(self.position3 + self.velocity3 * time_delta)
+
     def set_position(self, pos: Sequence[float]) -> None:
         """
         Set the entity's position in the game world.
@@ -117,7 +141,7 @@ class Entity(Generic[SaveDict]):
             )
 
         # Update collision map
-        self.world.collision_map[coords] = prop
+        self.world.navigation.set_region(coords, prop)
 
     def remove_collision(self) -> None:
         """
@@ -136,10 +160,10 @@ class Entity(Generic[SaveDict]):
                 None,
                 region.key,
             )
-            self.world.collision_map[self.tile_pos] = prop
+            self.world.navigation.set_region(self.tile_pos, prop)
         else:
             # Remove region
-            del self.world.collision_map[self.tile_pos]
+            self.world.navigation.remove_region(self.tile_pos)
 
     # === PHYSICS END =========================================================
 
@@ -44,7 +44,7 @@ class AddCollisionAction(EventAction):
             entity=None,
         )
         if self.x and self.y:
-            world.collision_map[(self.x, self.y)] = properties
+            world.navigation.set_region((self.x, self.y), properties)
         if coords:
             for coord in coords:
-                world.collision_map[coord] = properties
+                world.navigation.set_region(coord, properties)
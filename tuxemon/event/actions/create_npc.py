@@ -43,12 +43,11 @@ class CreateNpcAction(EventAction):
 
         slug = self.npc_slug
 
-        for element in world.npcs:
-            if element.slug == slug:
-                logger.error(
-                    f"'{slug}' already exists on the map. Skipping creation."
-                )
-                return
+        if world.get_entity(slug):
+            logger.error(
+                f"'{slug}' already exists on the map. Skipping creation."
+            )
+            return
 
         npc = NPC(slug, world=world)
         client = self.session.client.event_engine
@@ -42,10 +42,9 @@ class LoadYamlAction(EventAction):
         _events = list(client.events)
         _inits = list(client.inits)
         if os.path.exists(yaml_path):
-            yaml_events = YAMLEventLoader().load_events(yaml_path, "event")
+            yaml_events = YAMLEventLoader().load_events(yaml_path)
             _events.extend(yaml_events["event"])
-            yaml_inits = YAMLEventLoader().load_events(yaml_path, "init")
-            _inits.extend(yaml_inits["init"])
+            _inits.extend(yaml_events["init"])
         else:
             raise ValueError(f"{yaml_path} doesn't exist")
 
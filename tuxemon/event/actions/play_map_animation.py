@@ -9,6 +9,7 @@ from typing import Optional, final
 from tuxemon.animation_entity import AnimationEntity
 from tuxemon.event import get_npc
 from tuxemon.event.eventaction import EventAction
+from tuxemon.map import MAP_ANIMATION_LAYER
 from tuxemon.states.world.worldstate import WorldState
 
 logger = logging.getLogger(__name__)
@@ -85,7 +86,7 @@ class PlayMapAnimationAction(EventAction):
             animations[animation_name] = {
                 "animation": _animation.play,
                 "position": position,
-                "layer": 4,
+                "layer": MAP_ANIMATION_LAYER,
             }
 
             _animation.play.play()
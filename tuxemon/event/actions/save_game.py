@@ -35,6 +35,9 @@ class SaveGameAction(EventAction):
     Script parameters:
         index: Selected index.
 
+    Saving without index only writes the parts of the save which changed
+    since the previous save of the game in slot 4, without a screenshot.
+
     eg: "save_game" (slot4.save)
     eg: "save_game 1"
 
@@ -49,12 +52,17 @@ class SaveGameAction(EventAction):
 
         logger.info("Saving!")
         try:
+            # the saves without index are done often by the scripts: only
+            # the changes are saved, and since the slot isn't shown in the
+            # save menu, without redrawing the world for a screenshot
             save_data = save.get_save_data(
                 self.session,
+                screenshot=self.index is not None,
             )
             save.save(
                 save_data,
                 index,
+                incremental=self.index is None,
             )
             save.slot_number = slot
         except Exception as e:
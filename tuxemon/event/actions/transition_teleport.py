@@ -46,9 +46,9 @@ class TransitionTeleportAction(EventAction):
         target_map = fetch("maps", self.map_name)
 
         if self.world.npcs and self.world.current_map.filename != target_map:
-            for _npc in self.world.npcs:
+            for _npc in list(self.world.npcs):
                 if _npc.moving or _npc.path:
-                    self.world.npcs.remove(_npc)
+                    self.world.remove_npc(_npc)
 
         if self.world.teleporter.delayed_teleport:
             self.stop()
@@ -44,3 +44,4 @@ class UpdateTilePropertiesAction(EventAction):
             prop[self.label] = moverate
             for coord in coords:
                 world.surface_map[coord] = prop
+                world.navigation.update_terrain(coord, prop)
@@ -2,6 +2,9 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
+
 from tuxemon.event import MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.platform.const import intentions
@@ -25,6 +28,7 @@ class ButtonPressedCondition(EventCondition):
     """
 
     name = "button_pressed"
+    dependencies = frozenset({"input"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -47,6 +51,17 @@ class ButtonPressedCondition(EventCondition):
         else:
             raise ValueError(f"Cannot support key type: {button}")
 
+        return self._pressed(session, button_id)
+
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
+        if str(condition.parameters[0]) != "K_RETURN":
+            # unsupported, the error is raised when tested
+            return super().compile(condition)
+
+        return partial(self._pressed, button_id=intentions.INTERACT)
+
+    @staticmethod
+    def _pressed(session: Session, button_id: int) -> bool:
         # Loop through each event
         for event in session.client.key_events:
             if event.pressed and event.button == button_id:
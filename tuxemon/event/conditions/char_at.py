@@ -26,6 +26,7 @@ class CharAtCondition(EventCondition):
     """
 
     name = "char_at"
+    dependencies = frozenset({"characters"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
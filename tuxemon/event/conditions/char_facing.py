@@ -27,6 +27,7 @@ class CharFacingCondition(EventCondition):
     """
 
     name = "char_facing"
+    dependencies = frozenset({"characters"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
@@ -28,6 +28,7 @@ class CharFacingCharCondition(EventCondition):
     """
 
     name = "char_facing_char"
+    dependencies = frozenset({"characters"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
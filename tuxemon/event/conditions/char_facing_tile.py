@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 
-from tuxemon.db import SurfaceKeys
 from tuxemon.event import MapCondition, get_npc
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.map import get_coords, get_direction
@@ -32,6 +31,7 @@ class CharFacingTileCondition(EventCondition):
     """
 
     name = "char_facing_tile"
+    dependencies = frozenset({"characters", "map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
@@ -53,11 +53,11 @@ class CharFacingTileCondition(EventCondition):
         world = session.client.get_state_by_name(WorldState)
         if len(condition.parameters) > 1:
             value = condition.parameters[1]
-            if value in SurfaceKeys:
-                label = world.get_all_tile_properties(world.surface_map, value)
-            else:
-                label = world.check_collision_zones(world.collision_map, value)
-            tiles = list(set(npc_tiles).intersection(label))
+            tiles = [
+                coords
+                for coords in npc_tiles
+                if world.tile_has_label(coords, value)
+            ]
 
         # return common coordinates
         tiles = list(set(tiles).intersection(npc_tiles))
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 
-from tuxemon.db import SurfaceKeys
 from tuxemon.event import MapCondition, get_npc
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
@@ -29,6 +28,7 @@ class CharInCondition(EventCondition):
     """
 
     name = "char_in"
+    dependencies = frozenset({"characters", "map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
@@ -37,12 +37,4 @@ class CharInCondition(EventCondition):
             return False
         prop = condition.parameters[1]
         world = session.client.get_state_by_name(WorldState)
-
-        tiles = []
-        if prop in SurfaceKeys:
-            tiles = world.get_all_tile_properties(world.surface_map, prop)
-        else:
-            tiles = world.check_collision_zones(world.collision_map, prop)
-        if tiles:
-            return character.tile_pos in tiles
-        return False
+        return world.tile_has_label(character.tile_pos, prop)
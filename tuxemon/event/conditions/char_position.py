@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 
 from tuxemon.event import MapCondition, get_npc
 from tuxemon.event.eventcondition import EventCondition
@@ -28,13 +29,22 @@ class CharPositionCondition(EventCondition):
     """
 
     name = "char_position"
+    dependencies = frozenset({"characters"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
-        character = get_npc(session, condition.parameters[0])
-        if character is None:
-            logger.error(f"{condition.parameters[0]} not found")
-            return False
+        return self.compile(condition)(session)
+
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
+        slug = condition.parameters[0]
         tile_pos_x = int(condition.parameters[1])
         tile_pos_y = int(condition.parameters[2])
         tile_pos = (tile_pos_x, tile_pos_y)
-        return character.tile_pos == tile_pos
+
+        def test(session: Session) -> bool:
+            character = get_npc(session, slug)
+            if character is None:
+                logger.error(f"{slug} not found")
+                return False
+            return character.tile_pos == tile_pos
+
+        return test
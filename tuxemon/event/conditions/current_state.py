@@ -2,6 +2,8 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from tuxemon.event import MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
@@ -39,7 +41,14 @@ class CurrentStateCondition(EventCondition):
             Whether a combat has started or not.
 
         """
-        current_state = session.client.current_state
-        assert current_state
+        return self.compile(condition)(session)
+
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
         states = condition.parameters[0].split(":")
-        return current_state.name in states
+
+        def test(session: Session) -> bool:
+            current_state = session.client.current_state
+            assert current_state
+            return current_state.name in states
+
+        return test
@@ -21,6 +21,7 @@ class LocationInsideCondition(EventCondition):
     """
 
     name = "location_inside"
+    dependencies = frozenset()
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
@@ -27,6 +27,7 @@ class LocationNameCondition(EventCondition):
     """
 
     name = "location_name"
+    dependencies = frozenset()
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
@@ -27,6 +27,7 @@ class LocationTypeCondition(EventCondition):
     """
 
     name = "location_type"
+    dependencies = frozenset()
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
@@ -2,6 +2,8 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from collections.abc import Callable
+
 from tuxemon.event import MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
@@ -28,17 +30,19 @@ class OneOfCondition(EventCondition):
     """
 
     name = "one_of"
+    dependencies = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
-        player = session.player
+        return self.compile(condition)(session)
+
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
         key = condition.parameters[0]
         values = condition.parameters[1].split(":")
 
-        if key not in player.game_variables:
-            return False
-
-        result = [
-            value for value in values if player.game_variables[key] == value
-        ]
+        def test(session: Session) -> bool:
+            player = session.player
+            if key not in player.game_variables:
+                return False
+            return any(player.game_variables[key] == value for value in values)
 
-        return bool(result)
+        return test
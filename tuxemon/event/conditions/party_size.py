@@ -31,6 +31,7 @@ class PartySizeCondition(EventCondition):
     """
 
     name = "party_size"
+    dependencies = frozenset({"characters", "party"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         _character, _operator, _value = condition.parameters[:3]
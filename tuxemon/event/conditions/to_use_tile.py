@@ -21,6 +21,7 @@ class ToUseTileCondition(EventCondition):
     """
 
     name = "to_use_tile"
+    dependencies = frozenset({"characters", "input", "map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character_facing_tile = CharFacingTileCondition().test(
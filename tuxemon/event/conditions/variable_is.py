@@ -2,6 +2,9 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
+
 from tuxemon.event import MapCondition
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.session import Session
@@ -27,10 +30,24 @@ class VariableIsCondition(EventCondition):
     """
 
     name = "variable_is"
+    dependencies = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
-        # Read the parameters
-        operand1 = number_or_variable(session, condition.parameters[0])
+        return self.compile(condition)(session)
+
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
+        operand1 = _compile_operand(condition.parameters[0])
         operation = condition.parameters[1]
-        operand2 = number_or_variable(session, condition.parameters[2])
-        return compare(operation, operand1, operand2)
+        operand2 = _compile_operand(condition.parameters[2])
+
+        def test(session: Session) -> bool:
+            return compare(operation, operand1(session), operand2(session))
+
+        return test
+
+
+def _compile_operand(value: str) -> Callable[[Session], float]:
+    if value.replace(".", "", 1).isdigit():
+        number = float(value)
+        return lambda session: number
+    return partial(number_or_variable, value=value)
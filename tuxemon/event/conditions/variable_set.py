@@ -2,6 +2,7 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Optional
 
 from tuxemon.event import MapCondition
@@ -27,6 +28,7 @@ class VariableSetCondition(EventCondition):
     """
 
     name = "variable_set"
+    dependencies = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -40,8 +42,9 @@ class VariableSetCondition(EventCondition):
             Whether the variable exists and has that value.
 
         """
-        player = session.player
+        return self.compile(condition)(session)
 
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
         parts = condition.parameters[0].split(":")
         key = parts[0]
         if len(parts) > 1:
@@ -49,9 +52,13 @@ class VariableSetCondition(EventCondition):
         else:
             value = None
 
-        exists = key in player.game_variables
+        def test(session: Session) -> bool:
+            game_variables = session.player.game_variables
+            exists = key in game_variables
 
-        if value is None:
-            return exists
-        else:
-            return exists and player.game_variables[key] == value
+            if value is None:
+                return exists
+            else:
+                return exists and game_variables[key] == value
+
+        return test
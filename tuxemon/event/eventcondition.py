@@ -2,14 +2,36 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from collections.abc import Callable
+from typing import Any, ClassVar, Optional
 
 from tuxemon.event import MapCondition
 from tuxemon.session import Session
 
 
 class EventCondition:
+    """
+    Condition of a map event.
+
+    Conditions may declare which parts of the game state they read in
+    ``dependencies``, so the event engine can skip testing them again
+    while those parts don't change. The known dependencies are:
+
+    * ``"variables"``: the game variables of the player.
+    * ``"characters"``: the characters on the map, their tile and facing.
+    * ``"party"``: the monsters of the characters on the map.
+    * ``"input"``: the buttons pressed this frame.
+    * ``"map"``: the collision and surface tiles of the map.
+
+    An empty set means that the result only changes with the map. The
+    default, ``None``, means that the condition is tested every frame:
+    use it for conditions reading anything else (time, money, music,
+    ...) or with side effects.
+
+    """
+
     name: ClassVar[str] = "GenericCondition"
+    dependencies: ClassVar[Optional[frozenset[str]]] = None
 
     def __init__(self) -> None:
         pass
@@ -28,6 +50,25 @@ class EventCondition:
         """
         return True
 
+    def compile(self, condition: MapCondition) -> Callable[[Session], bool]:
+        """
+        Return a function testing the condition, bound to its parameters.
+
+        The event engine compiles each condition once, when the map is
+        loaded, and calls the result every frame. Conditions may override
+        this method to parse their parameters once instead of on every
+        test.
+
+        Parameters:
+            condition: Condition defined in the map.
+
+        Returns:
+            Function taking the session and returning the value of the
+            condition.
+
+        """
+        return lambda session: self.test(session, condition)
+
     def get_persist(self, session: Session) -> dict[str, Any]:
         """
         Return dictionary for this event class's data.
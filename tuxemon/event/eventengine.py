@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from contextlib import contextmanager
 from textwrap import dedent
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from tuxemon import plugin, prepare
 from tuxemon.constants import paths
@@ -16,8 +16,21 @@ from tuxemon.event.eventcondition import EventCondition
 from tuxemon.map import TuxemonMap
 from tuxemon.session import Session
 
+if TYPE_CHECKING:
+    from tuxemon.npc import NPC
+    from tuxemon.states.world.worldstate import WorldState
+
 logger = logging.getLogger(__name__)
 
+# parts of the game state the conditions of the map events may depend on
+DEPENDENCY_NAMES = ("variables", "characters", "party", "input", "map")
+
+# results of the conditions of an event: the event, the versions of its
+# dependencies when the conditions were tested and the result
+EventResult = tuple[EventObject, tuple[int, ...], bool]
+CompiledCondition = tuple[MapCondition, Callable[[], bool]]
+CompiledAction = tuple[MapAction, Callable[[], Optional[EventAction]]]
+
 
 class RunningEvent:
     """
@@ -113,6 +126,19 @@ class EventEngine:
         # debug
         self.partial_events: list[Sequence[tuple[bool, MapCondition]]] = list()
 
+        # condition dependency tracking, see EventCondition.dependencies
+        self.dependency_versions: dict[str, int] = {}
+        self._dependency_states: dict[str, Any] = {}
+        self._condition_instances: dict[str, EventCondition] = {}
+        self._event_dependencies: dict[
+            int, tuple[EventObject, Optional[tuple[str, ...]]]
+        ] = {}
+        self._event_results: dict[int, EventResult] = {}
+
+        # conditions and actions of the map, compiled when it is loaded
+        self._compiled_conditions: dict[int, CompiledCondition] = {}
+        self._compiled_actions: dict[int, CompiledAction] = {}
+
         self.conditions = plugin.load_plugins(
             paths.CONDITIONS_PATH,
             "conditions",
@@ -136,6 +162,12 @@ class EventEngine:
         self.timer = 0.0
         self.wait = 0.0
         self.button = None
+        self.dependency_versions = {}
+        self._dependency_states = {}
+        self._event_dependencies = {}
+        self._event_results = {}
+        self._compiled_conditions = {}
+        self._compiled_actions = {}
 
     def get_action(
         self,
@@ -168,6 +200,13 @@ class EventEngine:
             logger.warning(error)
             return None
 
+        return self._instantiate_action(action, parameters)
+
+    def _instantiate_action(
+        self,
+        action: type[EventAction],
+        parameters: Sequence[Any],
+    ) -> Optional[EventAction]:
         if parameters == [""]:
             return action()
 
@@ -184,6 +223,50 @@ class EventEngine:
             )
             return None
 
+    def compile_action(
+        self,
+        map_action: MapAction,
+    ) -> Callable[[], Optional[EventAction]]:
+        """
+        Get a function creating new instances of a map action.
+
+        The action is looked up and its parameters are prepared once, so
+        running the action again does not repeat that work.
+
+        Parameters:
+            map_action: The action defined in the map.
+
+        Returns:
+            Function returning a new instance of the action, or ``None``
+            if the action is not loaded or its parameters are invalid.
+
+        """
+        action = self.actions.get(map_action.type)
+        if action is None:
+            return lambda: self.get_action(
+                map_action.type, map_action.parameters
+            )
+
+        parameters = list(map_action.parameters or [])
+        return lambda: self._instantiate_action(action, parameters)
+
+    def create_action(self, map_action: MapAction) -> Optional[EventAction]:
+        """
+        Create a new instance of a map action, compiling it if needed.
+
+        Parameters:
+            map_action: The action defined in the map.
+
+        Returns:
+            New instance of the action, or ``None`` if it can't be created.
+
+        """
+        compiled = self._compiled_actions.get(id(map_action))
+        if compiled is None or compiled[0] is not map_action:
+            compiled = (map_action, self.compile_action(map_action))
+            self._compiled_actions[id(map_action)] = compiled
+        return compiled[1]()
+
     def get_actions(self) -> list[type[EventAction]]:
         """
         Return list of EventActions.
@@ -237,18 +320,68 @@ class EventEngine:
             The value of the condition.
 
         """
-        map_condition = self.get_condition(cond_data.type)
+        compiled = self._compiled_conditions.get(id(cond_data))
+        if compiled is None or compiled[0] is not cond_data:
+            compiled = (cond_data, self.compile_condition(cond_data))
+            self._compiled_conditions[id(cond_data)] = compiled
+
+        result = compiled[1]()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f'map condition "{cond_data.type}": {result} ({cond_data})'
+            )
+        return result
+
+    def compile_condition(self, cond_data: MapCondition) -> Callable[[], bool]:
+        """
+        Get a function checking a condition, bound to its parameters.
+
+        See :meth:`EventCondition.compile`.
+
+        Parameters:
+            cond_data: The condition to compile.
+
+        Returns:
+            Function returning the value of the condition.
+
+        """
+        map_condition = self._condition_instances.get(cond_data.type)
         if map_condition is None:
-            logger.debug(f'map condition "{cond_data.type}" is not loaded')
-            return False
+            map_condition = self.get_condition(cond_data.type)
+            if map_condition is None:
+                logger.debug(f'map condition "{cond_data.type}" is not loaded')
+                return lambda: False
+            self._condition_instances[cond_data.type] = map_condition
 
-        result = map_condition.test(self.session, cond_data) == (
-            cond_data.operator == "is"
-        )
-        logger.debug(
-            f'map condition "{map_condition.name}": {result} ({cond_data})'
-        )
-        return result
+        try:
+            test = map_condition.compile(cond_data)
+        except Exception:
+            # report the error when the condition is tested, as before
+            test = EventCondition.compile(map_condition, cond_data)
+
+        session = self.session
+        expected = cond_data.operator == "is"
+        return lambda: test(session) == expected
+
+    def compile_events(self, events: Iterable[EventObject]) -> None:
+        """
+        Compile the conditions and actions of events ahead of time.
+
+        Parameters:
+            events: Events whose conditions and actions are compiled.
+
+        """
+        for event in events:
+            for cond in event.conds:
+                self._compiled_conditions[id(cond)] = (
+                    cond,
+                    self.compile_condition(cond),
+                )
+            for act in event.acts:
+                self._compiled_actions[id(act)] = (
+                    act,
+                    self.compile_action(act),
+                )
 
     def execute_action(
         self,
@@ -328,9 +461,146 @@ class EventEngine:
                 self.start_event(map_event)
         else:
             # Optimal mode: start event if all conditions are met
-            if all(self.check_condition(cond) for cond in map_event.conds):
+            if self.check_event_conditions(map_event):
                 self.start_event(map_event)
 
+    def check_event_conditions(self, map_event: EventObject) -> bool:
+        """
+        Check if all the conditions of an event are met.
+
+        If every condition of the event declares its dependencies, the
+        result is kept and reused until one of them changes.
+
+        Parameters:
+            map_event: Event to check.
+
+        Returns:
+            Whether all the conditions are met.
+
+        """
+        dependencies = self.get_event_dependencies(map_event)
+        if dependencies is None:
+            return all(self.check_condition(cond) for cond in map_event.conds)
+
+        versions = tuple(
+            self.dependency_versions.get(name, 0) for name in dependencies
+        )
+        cached = self._event_results.get(id(map_event))
+        if cached and cached[0] is map_event and cached[1] == versions:
+            return cached[2]
+
+        result = all(self.check_condition(cond) for cond in map_event.conds)
+        self._event_results[id(map_event)] = (map_event, versions, result)
+        return result
+
+    def get_event_dependencies(
+        self,
+        map_event: EventObject,
+    ) -> Optional[tuple[str, ...]]:
+        """
+        Get the dependencies of all the conditions of an event.
+
+        Parameters:
+            map_event: Event whose conditions are inspected.
+
+        Returns:
+            The names of the dependencies, or ``None`` if any condition
+            must be tested every frame.
+
+        """
+        cached = self._event_dependencies.get(id(map_event))
+        if cached and cached[0] is map_event:
+            return cached[1]
+
+        names: Optional[set[str]] = set()
+        for cond in map_event.conds:
+            condition = self.conditions.get(cond.type)
+            if condition is None:
+                # not loaded, so always False
+                continue
+            if condition.dependencies is None or names is None:
+                names = None
+                break
+            names.update(condition.dependencies)
+
+        dependencies = None if names is None else tuple(sorted(names))
+        self._event_dependencies[id(map_event)] = (map_event, dependencies)
+        return dependencies
+
+    def update_dependencies(self) -> None:
+        """
+        Increase the version of the dependencies that changed since the
+        last frame.
+
+        """
+        if self.session.player is None or not (
+            self.session.client.inits or self.session.client.events
+        ):
+            # no game or map events yet: the state is unknown, so every
+            # event is tested again once there is one
+            for name in DEPENDENCY_NAMES:
+                self.dependency_versions[name] = (
+                    self.dependency_versions.get(name, 0) + 1
+                )
+            self._dependency_states.clear()
+            return
+
+        for name in DEPENDENCY_NAMES:
+            state = self.get_dependency_state(name)
+            if self._dependency_states.get(name, state) != state:
+                self.dependency_versions[name] = (
+                    self.dependency_versions.get(name, 0) + 1
+                )
+            self._dependency_states[name] = state
+
+    def get_dependency_state(self, name: str) -> Any:
+        """
+        Get a snapshot of the part of the game state of a dependency.
+
+        Parameters:
+            name: Name of the dependency.
+
+        Returns:
+            A value which changes when the game state changes.
+
+        """
+        if name == "variables":
+            return tuple(self.session.player.game_variables.items())
+        elif name == "characters":
+            return tuple(
+                (id(char), char.slug, char.tile_pos, char.facing)
+                for char in self._get_characters()
+            )
+        elif name == "party":
+            return tuple(
+                (id(char), tuple((id(mon), mon.slug) for mon in char.monsters))
+                for char in self._get_characters()
+            )
+        elif name == "input":
+            return tuple(
+                (event.button, event.pressed)
+                for event in self.session.client.key_events
+            )
+        elif name == "map":
+            world = self._get_world()
+            return None if world is None else world.navigation.version
+        raise ValueError(f"Unknown condition dependency: {name}")
+
+    def _get_world(self) -> Optional[WorldState]:
+        from tuxemon.states.world.worldstate import WorldState
+
+        try:
+            return self.session.client.get_state_by_name(WorldState)
+        except ValueError:
+            return None
+
+    def _get_characters(self) -> list[NPC]:
+        world = self._get_world()
+        characters: list[NPC] = [self.session.player]
+        if world is not None:
+            characters.extend(world.get_all_entities())
+        return characters
+
     def process_map_events(self, events: Iterable[EventObject]) -> None:
         """
         Process all events in an iterable.
@@ -364,6 +634,8 @@ class EventEngine:
         Actions may be started during this function.
 
         """
+        self.update_dependencies()
+
         # do the "init" events.  this will be done just once
         # TODO: make event engine generic, so can be used in global scope,
         # not just maps
@@ -427,10 +699,7 @@ class EventEngine:
 
                     else:
                         # got an action, so start it
-                        action = self.get_action(
-                            next_action.type,
-                            next_action.parameters,
-                        )
+                        action = self.create_action(next_action)
 
                         if action is None:
                             # action was not loaded, so, break?  raise
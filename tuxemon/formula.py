@@ -12,15 +12,13 @@ from typing import TYPE_CHECKING, Optional
 from tuxemon import prepare as pre
 
 if TYPE_CHECKING:
-    from tuxemon.db import ElementType
-    from tuxemon.element import Element
+    from tuxemon.db import ElementModel
+    from tuxemon.element import Element, ElementMatrix
     from tuxemon.monster import Monster
     from tuxemon.technique.technique import Technique
 
 logger = logging.getLogger(__name__)
 
-multiplier_cache: dict[tuple[ElementType, ElementType], float] = {}
-
 range_map: dict[str, tuple[str, str]] = {
     "melee": ("melee", "armour"),
     "touch": ("melee", "dodge"),
@@ -53,6 +51,31 @@ taste_maps: dict[str, dict[tuple[str, str], float]] = {
 }
 
 
+# element models the matrix was built from, and the matrix
+_element_matrix: Optional[
+    tuple[tuple[Optional[ElementModel], ...], ElementMatrix]
+] = None
+
+
+def get_element_matrix() -> ElementMatrix:
+    """
+    Element matrix of the loaded element table.
+
+    The matrix is rebuilt when the models of the element table change,
+    e.g. after the database was reloaded.
+
+    """
+    global _element_matrix
+    from tuxemon.db import ElementType, db
+    from tuxemon.element import ElementMatrix
+
+    table = db.database["element"]
+    models = tuple(table.get(element) for element in ElementType)
+    if _element_matrix is None or _element_matrix[0] != models:
+        _element_matrix = (models, ElementMatrix.from_db())
+    return _element_matrix[1]
+
+
 def simple_damage_multiplier(
     attack_types: Sequence[Element],
     target_types: Sequence[Element],
@@ -71,24 +94,9 @@ def simple_damage_multiplier(
         The attack multiplier.
 
     """
-    multiplier = 1.0
-    for attack_type in attack_types:
-        for target_type in target_types:
-            if target_type and not (
-                attack_type.slug == "aether" or target_type.slug == "aether"
-            ):
-                key = (attack_type.slug, target_type.slug)
-                if key in multiplier_cache:
-                    multiplier = multiplier_cache[key]
-                else:
-                    multiplier = attack_type.lookup_multiplier(
-                        target_type.slug
-                    )
-                    multiplier_cache[key] = multiplier
-                multiplier = min(
-                    pre.MULTIPLIER_RANGE[1],
-                    max(pre.MULTIPLIER_RANGE[0], multiplier),
-                )
+    multiplier = get_element_matrix().damage_multiplier(
+        attack_types, target_types
+    )
     # Apply additional factors
     if additional_factors:
         factor_multiplier = math.prod(additional_factors.values())
@@ -112,14 +120,9 @@ def calculate_multiplier(
         float: The final multiplier that represents the effectiveness of
         the monster'stypes against the opponent's types.
     """
-    multiplier = 1.0
-    for _monster in monster_types:
-        for _opponent in opponent_types:
-            if _opponent and not (
-                _monster.slug == "aether" or _opponent.slug == "aether"
-            ):
-                multiplier *= _monster.lookup_multiplier(_opponent.slug)
-    return multiplier
+    return get_element_matrix().combined_multiplier(
+        monster_types, opponent_types
+    )
 
 
 def simple_damage_calculate(
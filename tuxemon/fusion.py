@@ -11,14 +11,27 @@
 # serve only as examples of potential fusions.
 from __future__ import annotations
 
-from collections.abc import Mapping
+import copy
+import json
+import logging
+import multiprocessing
+import os
+from collections.abc import Mapping, Sequence
 from typing import Any, Optional
 
 try:
     from PIL import Image
 except ImportError:
     Image = Any
-import json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+Color = tuple[int, int, int]
 
 
 class Body:
@@ -208,8 +221,8 @@ class Body:
 
 def replace_color(
     image: Image,
-    original_color: tuple[int, int, int],
-    replacement_color: tuple[int, int, int],
+    original_color: Color,
+    replacement_color: Color,
 ) -> Image:
     """
     Replaces an RGB color in an image with a different RGB _color.
@@ -225,25 +238,56 @@ def replace_color(
         A PIL Image() object of the image with the given colors replaced.
 
     """
-    img = image.convert("RGBA")
-    datas = img.getdata()
+    return replace_colors(image, [(original_color, replacement_color)])
+
 
-    r = original_color[0]
-    g = original_color[1]
-    b = original_color[2]
+def replace_colors(
+    image: Image,
+    replacements: Sequence[tuple[Color, Color]],
+) -> Image:
+    """
+    Replaces several RGB colors in an image, one after the other.
 
-    new_r = replacement_color[0]
-    new_g = replacement_color[1]
-    new_b = replacement_color[2]
+    The replacements are applied in order, so a color replaced by an
+    earlier replacement can be replaced again by a later one. Replaced
+    pixels become opaque.
 
-    newData = []
-    for item in datas:
-        if item[0] == r and item[1] == g and item[2] == b:
-            newData.append((new_r, new_g, new_b, 255))
-        else:
-            newData.append(item)
+    Parameters:
+        image: A PIL Image() object of the image to replace colors.
+        replacements: Pairs of RGB (r, g, b) values of the color to
+            replace and of the new color.
 
-    img.putdata(newData)
+    Returns:
+        A PIL Image() object of the image with the given colors replaced.
+
+    """
+    img = image.convert("RGBA")
+
+    if np is not None:
+        pixels = np.array(img)
+        # pack the RGB values so a color is compared with one operation
+        rgb = pixels[..., :3].astype(np.uint32)
+        keys = rgb[..., 0] << 16 | rgb[..., 1] << 8 | rgb[..., 2]
+        for original_color, replacement_color in replacements:
+            r, g, b = original_color
+            new_r, new_g, new_b = replacement_color
+            mask = keys == (r << 16 | g << 8 | b)
+            pixels[mask] = (new_r, new_g, new_b, 255)
+            keys[mask] = new_r << 16 | new_g << 8 | new_b
+        return Image.fromarray(pixels, "RGBA")
+
+    datas = list(img.getdata())
+    for original_color, replacement_color in replacements:
+        r, g, b = original_color
+        new_color = (*replacement_color, 255)
+        datas = [
+            new_color
+            if item[0] == r and item[1] == g and item[2] == b
+            else item
+            for item in datas
+        ]
+
+    img.putdata(datas)
 
     return img
 
@@ -291,22 +335,14 @@ def fuse(
     body_image = body.body_image.copy()
 
     # Replace the _color of the body with the colors of the face.
+    replacements = []
     for i, _ in enumerate(body.primary_colors):
-        body_image = replace_color(
-            body_image,
-            body.primary_colors[i],
-            face.primary_colors[i],
-        )
-        body_image = replace_color(
-            body_image,
-            body.secondary_colors[i],
-            face.secondary_colors[i],
-        )
-        body_image = replace_color(
-            body_image,
-            body.tertiary_colors[i],
-            face.tertiary_colors[i],
+        replacements.append((body.primary_colors[i], face.primary_colors[i]))
+        replacements.append(
+            (body.secondary_colors[i], face.secondary_colors[i])
         )
+        replacements.append((body.tertiary_colors[i], face.tertiary_colors[i]))
+    body_image = replace_colors(body_image, replacements)
 
     # Set a scale for the images so we can resize them.
     # Scaling results in a better image result.
@@ -357,21 +393,21 @@ def fuse(
 
     # Paste the face onto the body
     position = (
-        body.face_position[0] - (face.face_size[0] / 2),
-        body.face_position[1] - (face.face_size[1] / 2),
+        body.face_position[0] - (face.face_size[0] // 2),
+        body.face_position[1] - (face.face_size[1] // 2),
     )
     body_image.paste(face.face_image, position, face.face_image)
 
     # For some reason this looks really good.
-    # Scale the image back down using Image.ANTIALIAS
-    x = body_image.getdata().size[0] / (scale / 2)
-    y = body_image.getdata().size[1] / (scale / 2)
+    # Scale the image back down using Image.LANCZOS
+    x = body_image.getdata().size[0] // (scale // 2)
+    y = body_image.getdata().size[1] // (scale // 2)
     newsize = (x, y)
-    body_image = body_image.resize(newsize, Image.ANTIALIAS)
+    body_image = body_image.resize(newsize, Image.Resampling.LANCZOS)
 
-    # Scale the image down further to its original size without ANTIALIAS
-    x /= scale / 2
-    y /= scale / 2
+    # Scale the image down further to its original size without LANCZOS
+    x //= scale // 2
+    y //= scale // 2
     newsize = (x, y)
     body_image = body_image.resize(newsize)
 
@@ -382,3 +418,54 @@ def fuse(
         body_image.save(filename)
 
     return body_image
+
+
+def _fuse_pair(job: tuple[Body, Body, str]) -> Optional[str]:
+    body, face, filename = job
+    try:
+        fuse(copy.copy(body), copy.copy(face), filename=filename)
+    except Exception as e:
+        logger.error(f"Fusion of {body.name} and {face.name} failed: {e!r}")
+        return None
+    return filename
+
+
+def fuse_all(
+    bodies: Sequence[Body],
+    directory: str,
+    processes: Optional[int] = None,
+) -> list[str]:
+    """
+    Fuses every pair of different bodies, in parallel.
+
+    Each body is fused with the face of every other body. Fusions already
+    in the directory are not generated again.
+
+    Parameters:
+        bodies: The Body() instances to fuse.
+        directory: The directory where the fusions are saved.
+        processes: Number of worker processes. Defaults to the number of
+            CPUs. If 1, the fusions are generated in this process.
+
+    Returns:
+        The filenames of the fusions generated.
+
+    """
+    os.makedirs(directory, exist_ok=True)
+    jobs = []
+    for body in bodies:
+        for face in bodies:
+            if body is face:
+                continue
+            filename = os.path.join(
+                directory, f"{body.prefix}{face.suffix}.png"
+            )
+            if not os.path.exists(filename):
+                jobs.append((body, face, filename))
+
+    if processes == 1:
+        results = list(map(_fuse_pair, jobs))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_fuse_pair, jobs, chunksize=8)
+    return [filename for filename in results if filename is not None]
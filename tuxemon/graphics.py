@@ -11,8 +11,10 @@ from __future__ import annotations
 import logging
 import os
 import re
-from collections.abc import Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Optional, Protocol, Union
+from weakref import WeakValueDictionary
 
 import pygame
 from pytmx.pytmx import TileFlags
@@ -31,12 +33,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Resolved path, scale factor and conversion of a cached surface
+SurfaceKey = tuple[str, float, str]
+
+# Memory budget of the shared surface cache, in bytes
+SURFACE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
 ColorLike = Union[
     pygame.color.Color,
     tuple[int, int, int],
     tuple[int, int, int, int],
 ]
 
+# Tileset image path, rect of the tile and its flags
+TileKey = tuple[str, Optional[tuple[int, int, int, int]], Optional[TileFlags]]
+# RGBA pixels of the tile at native size, its size, if it is opaque and
+# the colorkey of the tileset image
+TileData = tuple[bytes, tuple[int, int], bool, Optional[ColorLike]]
+
 
 class LoaderProtocol(Protocol):
     def __call__(
@@ -114,6 +128,111 @@ def cursor_from_image(image: pygame.surface.Surface) -> Sequence[str]:
     return icon_string
 
 
+class SurfaceCache:
+    """
+    Process-wide cache of the images loaded from the resources.
+
+    The cached surfaces are shared by every caller, so they must be
+    treated as read only: copy them before drawing on them. The most
+    recently used surfaces are kept up to a memory budget, and surfaces
+    evicted while still referenced elsewhere can still be reused, so an
+    image in use is never decoded twice.
+
+    Parameters:
+        max_bytes: Memory budget of the surfaces kept alive by the cache.
+
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces: OrderedDict[
+            SurfaceKey, pygame.surface.Surface
+        ] = OrderedDict()
+        self._alive: WeakValueDictionary[
+            SurfaceKey, pygame.surface.Surface
+        ] = WeakValueDictionary()
+
+    def get(self, key: SurfaceKey) -> Optional[pygame.surface.Surface]:
+        """
+        Get a cached surface, marking it as the most recently used.
+
+        Parameters:
+            key: Resolved path, scale factor and conversion of the surface.
+
+        Returns:
+            The surface, or None if it isn't cached.
+
+        """
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        surface = self._alive.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._keep(key, surface)
+            return surface
+        self.misses += 1
+        return None
+
+    def put(self, key: SurfaceKey, surface: pygame.surface.Surface) -> None:
+        """
+        Add a surface to the cache.
+
+        Parameters:
+            key: Resolved path, scale factor and conversion of the surface.
+            surface: The loaded surface.
+
+        """
+        self._alive[key] = surface
+        self._keep(key, surface)
+
+    def clear(self) -> None:
+        """Empty the cache, e.g. when the resources changed on disk."""
+        self._surfaces.clear()
+        self._alive.clear()
+        self.size = 0
+
+    def get_stats(self) -> Mapping[str, int]:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            Number of hits, misses and evictions, number of surfaces and
+            bytes kept alive by the cache.
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "surfaces": len(self._surfaces),
+            "bytes": self.size,
+        }
+
+    def _keep(self, key: SurfaceKey, surface: pygame.surface.Surface) -> None:
+        self._surfaces[key] = surface
+        self.size += surface_bytes(surface)
+        while self.size > self.max_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.size -= surface_bytes(evicted)
+            self.evictions += 1
+
+
+def surface_bytes(surface: pygame.surface.Surface) -> int:
+    """Memory used by the pixels of a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+# Cache shared by every image loaded from the resources
+surface_cache = SurfaceCache(SURFACE_CACHE_MAX_BYTES)
+
+
 def load_and_scale(filename: str) -> pygame.surface.Surface:
     """
     Load an image and scale it according to game settings.
@@ -121,6 +240,7 @@ def load_and_scale(filename: str) -> pygame.surface.Surface:
     * Filename will be transformed to be loaded from game resource folder
     * Will be converted if needed
     * Scale factor will match game setting
+    * The surface is cached and shared, it must not be modified
 
     Parameters:
         filename: Path of the image file.
@@ -129,7 +249,7 @@ def load_and_scale(filename: str) -> pygame.surface.Surface:
         Loaded and scaled image.
 
     """
-    return scale_surface(load_image(filename), prepare.SCALE)
+    return load_cached_image(filename, prepare.SCALE)
 
 
 def load_image(filename: str) -> pygame.surface.Surface:
@@ -137,6 +257,7 @@ def load_image(filename: str) -> pygame.surface.Surface:
 
     * Filename will be transformed to be loaded from game resource folder
     * Will be converted if needed.
+    * The surface is cached and shared, it must not be modified
 
     This is a "smart" loader, and will convert files in the best way,
     but is slightly slower than just loading.  Its important that
@@ -148,9 +269,31 @@ def load_image(filename: str) -> pygame.surface.Surface:
     Returns:
         Loaded image.
 
+    """
+    return load_cached_image(filename, 1)
+
+
+def load_cached_image(filename: str, factor: float) -> pygame.surface.Surface:
+    """
+    Load an image through the surface cache.
+
+    Parameters:
+        filename: Path of the image file.
+        factor: Scale factor of the image.
+
+    Returns:
+        Loaded image, shared with every other caller.
+
     """
     filename = transform_resource_filename(filename)
-    return smart_convert(pygame.image.load(filename), None, True)
+    key = (filename, factor, "smart")
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = smart_convert(pygame.image.load(filename), None, True)
+        if factor != 1:
+            surface = scale_surface(surface, factor)
+        surface_cache.put(key, surface)
+    return surface
 
 
 def load_sprite(
@@ -174,7 +317,8 @@ def load_sprite(
         Loaded sprite.
 
     """
-    sprite = Sprite(image=load_and_scale(filename))
+    # sprites are often drawn on, so they can't share the cached image
+    sprite = Sprite(image=load_and_scale(filename).copy())
     sprite.rect = sprite.image.get_rect(**rect_kwargs)
     return sprite
 
@@ -182,6 +326,7 @@ def load_sprite(
 def load_animated_sprite(
     filenames: Iterable[str],
     delay: float,
+    overlays: Sequence[pygame.surface.Surface] = (),
 ) -> Sprite:
     """
     Load a set of images and return an animated sprite.
@@ -195,6 +340,7 @@ def load_animated_sprite(
     Parameters:
         filenames: Filenames to load.
         delay: Frame interval; time between each frame.
+        overlays: Images drawn over each frame, such as flairs.
 
     Returns:
         Loaded animated sprite.
@@ -204,6 +350,11 @@ def load_animated_sprite(
     for filename in filenames:
         if os.path.exists(filename):
             image = load_and_scale(filename)
+            if overlays:
+                # the loaded image is shared, so draw on a copy of it
+                image = image.copy()
+                for overlay in overlays:
+                    image.blit(overlay, (0, 0))
             anim.append((image, delay))
 
     tech = SurfaceAnimation(anim, True)
@@ -422,6 +573,126 @@ def scaled_image_loader(
     return load_image
 
 
+def recording_image_loader(
+    tiles: dict[TileKey, TileData],
+) -> Callable[..., LoaderProtocol]:
+    """
+    Pytmx image loader that records the tiles it loads.
+
+    The tiles are loaded by :func:`scaled_image_loader`; their pixels are
+    also stored at native size in ``tiles``, to be loaded later by
+    :func:`cached_image_loader` without reading and scaling the tileset.
+
+    Parameters:
+        tiles: Where to store the tiles.
+
+    Returns:
+        The image loader.
+
+    """
+
+    def loader(
+        filename: str,
+        colorkey: Optional[str],
+        *,
+        pixelalpha: bool = True,
+        **kwargs: Any,
+    ) -> LoaderProtocol:
+        load_scaled = scaled_image_loader(
+            filename, colorkey, pixelalpha=pixelalpha, **kwargs
+        )
+        image = pygame.image.load(filename)
+        image_colorkey = image.get_colorkey()
+        # the pixels of the colorkey of the image are stored as transparent
+        image = image.convert_alpha()
+
+        def load_image(
+            rect: Optional[tuple[int, int, int, int]] = None,
+            flags: Optional[TileFlags] = None,
+        ) -> pygame.surface.Surface:
+            tile = load_scaled(rect, flags)
+            native = image.subsurface(rect) if rect else image
+            size = native.get_size()
+            # same test as smart_convert, on the tile before scaling
+            opaque = (
+                pygame.mask.from_surface(native, 254).count()
+                == size[0] * size[1]
+            )
+            pixels = pygame.image.tobytes(native, "RGBA")
+            tiles[(filename, rect, flags)] = (
+                pixels,
+                size,
+                opaque,
+                image_colorkey,
+            )
+            return tile
+
+        return load_image
+
+    return loader
+
+
+def cached_image_loader(
+    tiles: Mapping[TileKey, TileData],
+) -> Callable[..., LoaderProtocol]:
+    """
+    Pytmx image loader using tiles recorded by :func:`recording_image_loader`.
+
+    Tiles which weren't recorded are loaded by :func:`scaled_image_loader`.
+
+    Parameters:
+        tiles: The recorded tiles.
+
+    Returns:
+        The image loader.
+
+    """
+
+    def loader(
+        filename: str,
+        colorkey: Optional[str],
+        *,
+        pixelalpha: bool = True,
+        **kwargs: Any,
+    ) -> LoaderProtocol:
+        colorkey_color = pygame.Color(f"#{colorkey}") if colorkey else None
+        fallback: Optional[LoaderProtocol] = None
+
+        def load_image(
+            rect: Optional[tuple[int, int, int, int]] = None,
+            flags: Optional[TileFlags] = None,
+        ) -> pygame.surface.Surface:
+            nonlocal fallback
+            data = tiles.get((filename, rect, flags))
+            if data is None:
+                if fallback is None:
+                    fallback = scaled_image_loader(
+                        filename, colorkey, pixelalpha=pixelalpha, **kwargs
+                    )
+                return fallback(rect, flags)
+
+            pixels, size, opaque, image_colorkey = data
+            tile = pygame.image.frombytes(pixels, size, "RGBA")
+            tile = pygame.transform.scale(tile, scale_sequence(size))
+            if flags:
+                tile = handle_transformation(tile, flags)
+            if colorkey_color:
+                tile = tile.convert()
+                tile.set_colorkey(colorkey_color, pygame.RLEACCEL)
+            elif opaque or not pixelalpha:
+                # the converted tileset image keeps its colorkey
+                tile = tile.convert()
+                if image_colorkey:
+                    tile.set_colorkey(image_colorkey)
+            else:
+                tile = tile.convert_alpha()
+            return tile
+
+        return load_image
+
+    return loader
+
+
 def capture_screenshot(game: LocalPygameClient) -> pygame.surface.Surface:
     """
     Capture a screenshot of the current map.
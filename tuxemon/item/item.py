@@ -5,13 +5,14 @@ from __future__ import annotations
 import logging
 import uuid
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 import pygame
 
 from tuxemon import graphics, plugin, prepare
 from tuxemon.constants import paths
-from tuxemon.db import ItemCategory, State, db
+from tuxemon.db import ItemBehaviors, ItemCategory, ItemModel, State, db
 from tuxemon.item.itemcondition import ItemCondition
 from tuxemon.item.itemeffect import ItemEffect, ItemEffectResult
 from tuxemon.locale import T
@@ -29,38 +30,80 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+@dataclass(frozen=True)
+class ItemPrototype:
+    """
+    Definition of an item, shared by the items with its slug.
+
+    It holds what is loaded from the item database: the translated
+    strings, the effect and condition objects, and the sprite.
+
+    """
+
+    slug: str = ""
+    name: str = ""
+    description: str = ""
+    use_item: str = ""
+    use_success: str = ""
+    use_failure: str = ""
+    world_menu: tuple[int, str, str] = (0, "", "")
+    # built from the defaults of the fields, unknown to the type checker
+    behaviors: ItemBehaviors = field(
+        default_factory=lambda: ItemBehaviors.model_validate({})
+    )
+    sort: str = ""
+    category: ItemCategory = ItemCategory.none
+    # The path to the sprite to load.
+    sprite: str = ""
+    usable_in: Sequence[State] = ()
+    effects: Sequence[ItemEffect] = ()
+    conditions: Sequence[ItemCondition] = ()
+    # The surface is shared, it must not be modified
+    surface: Optional[pygame.surface.Surface] = None
+    surface_size_original: tuple[int, int] = (0, 0)
+    animation: Optional[str] = None
+    flip_axes: str = ""
+
+
+EMPTY_PROTOTYPE = ItemPrototype()
+PROTOTYPE_FIELDS = {f.name for f in fields(ItemPrototype)}
+
+
 class Item:
     """An item object is an item that can be used either in or out of combat."""
 
     effects_classes: ClassVar[Mapping[str, type[ItemEffect]]] = {}
     conditions_classes: ClassVar[Mapping[str, type[ItemCondition]]] = {}
+    prototypes: ClassVar[dict[str, tuple[ItemModel, ItemPrototype]]] = {}
+
+    # read from the prototype of the item, unless set on the item
+    slug: str
+    name: str
+    description: str
+    use_item: str
+    use_success: str
+    use_failure: str
+    world_menu: tuple[int, str, str]
+    behaviors: ItemBehaviors
+    sort: str
+    category: ItemCategory
+    sprite: str
+    usable_in: Sequence[State]
+    effects: Sequence[ItemEffect]
+    conditions: Sequence[ItemCondition]
+    surface: Optional[pygame.surface.Surface]
+    surface_size_original: tuple[int, int]
+    animation: Optional[str]
+    flip_axes: str
 
     def __init__(self, save_data: Optional[Mapping[str, Any]] = None) -> None:
         save_data = save_data or {}
 
-        self.slug = ""
-        self.name = ""
-        self.description = ""
+        self.prototype = EMPTY_PROTOTYPE
         self.instance_id = uuid.uuid4()
         self.quantity = 1
-        self.animation: Optional[str] = None
-        self.flip_axes = ""
-        # The path to the sprite to load.
-        self.sprite = ""
-        self.category = ItemCategory.none
-        self.surface: Optional[pygame.surface.Surface] = None
-        self.surface_size_original = (0, 0)
-
-        self.effects: Sequence[ItemEffect] = []
-        self.conditions: Sequence[ItemCondition] = []
         self.combat_state: Optional[CombatState] = None
 
-        self.sort = ""
-        self.use_item = ""
-        self.use_success = ""
-        self.use_failure = ""
-        self.usable_in: Sequence[State] = []
-
         # load effect and condition plugins if it hasn't been done already
         if not Item.effects_classes:
             Item.effects_classes = plugin.load_plugins(
@@ -76,6 +119,13 @@ class Item:
 
         self.set_state(save_data)
 
+    def __getattr__(self, name: str) -> Any:
+        # the attributes which aren't set on the item are shared by the
+        # items with the same slug
+        if name == "prototype":
+            raise AttributeError(name)
+        return getattr(self.prototype, name)
+
     def load(self, slug: str) -> None:
         """Loads and sets this item's attributes from the item.db database.
 
@@ -84,40 +134,65 @@ class Item:
         Parameters:
             slug: The item slug to look up in the monster.item database.
 
+        """
+        self.prototype = self.load_prototype(slug)
+        for name in PROTOTYPE_FIELDS & vars(self).keys():
+            delattr(self, name)
+        self.quantity = 1
+
+    @classmethod
+    def load_prototype(cls, slug: str) -> ItemPrototype:
+        """Gets the definition of an item, shared by its instances.
+
+        The item is looked up in the database, and its strings, effects and
+        sprite are only loaded the first time its slug is loaded.
+
+        Parameters:
+            slug: The item slug to look up in the monster.item database.
+
+        Returns:
+            The definition of the item.
+
         """
         try:
             results = db.lookup(slug, table="item")
         except KeyError:
             raise RuntimeError(f"Item {slug} not found")
 
-        self.slug = results.slug
-        self.name = T.translate(self.slug)
-        self.description = T.translate(f"{self.slug}_description")
-        self.quantity = 1
-
-        # item use notifications (translated!)
-        self.use_item = T.translate(results.use_item)
-        self.use_success = T.translate(results.use_success)
-        self.use_failure = T.translate(results.use_failure)
-
-        # misc attributes (not translated!)
-        self.world_menu = results.world_menu
-        self.behaviors = results.behaviors
-        self.sort = results.sort
-        self.category = results.category or ItemCategory.none
-        self.sprite = results.sprite
-        self.usable_in = results.usable_in
-        self.effects = self.parse_effects(results.effects)
-        self.conditions = self.parse_conditions(results.conditions)
-        self.surface = graphics.load_and_scale(self.sprite)
-        self.surface_size_original = self.surface.get_size()
-
-        # Load the animation sprites that will be used for this technique
-        self.animation = results.animation
-        self.flip_axes = results.flip_axes
+        # the prototype is rebuilt if the database was reloaded
+        cached = cls.prototypes.get(slug)
+        if cached is not None and cached[0] is results:
+            return cached[1]
+
+        surface = graphics.load_and_scale(results.sprite)
+        prototype = ItemPrototype(
+            slug=results.slug,
+            name=T.translate(results.slug),
+            description=T.translate(f"{results.slug}_description"),
+            # item use notifications (translated!)
+            use_item=T.translate(results.use_item),
+            use_success=T.translate(results.use_success),
+            use_failure=T.translate(results.use_failure),
+            # misc attributes (not translated!)
+            world_menu=results.world_menu,
+            behaviors=results.behaviors,
+            sort=results.sort,
+            category=results.category or ItemCategory.none,
+            sprite=results.sprite,
+            usable_in=results.usable_in,
+            effects=cls.parse_effects(results.effects),
+            conditions=cls.parse_conditions(results.conditions),
+            surface=surface,
+            surface_size_original=surface.get_size(),
+            # Load the animation sprites that will be used for this technique
+            animation=results.animation,
+            flip_axes=results.flip_axes,
+        )
+        cls.prototypes[slug] = (results, prototype)
+        return prototype
 
+    @staticmethod
     def parse_effects(
-        self,
         raw: Sequence[str],
     ) -> Sequence[ItemEffect]:
         """
@@ -149,8 +224,8 @@ class Item:
 
         return effects
 
+    @staticmethod
     def parse_conditions(
-        self,
         raw: Sequence[str],
     ) -> Sequence[ItemCondition]:
         """
@@ -43,7 +43,12 @@ class TranslatorPo:
     """
 
     def __init__(self) -> None:
-        self.translate: Callable[[str], str] = lambda x: x
+        self.translate: Callable[[str], str] = self._translate_on_demand
+
+    def _translate_on_demand(self, msgid: str) -> str:
+        """Load the translator on first use, so that importing is free."""
+        self.collect_languages()
+        return self.translate(msgid)
 
     @staticmethod
     def search_locales() -> Generator[LocaleInfo, None, None]:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional, no_type_check
+from typing import Optional
 
 from tuxemon import log, prepare
 from tuxemon.session import local_session
@@ -92,12 +92,44 @@ def main(
     pygame.quit()
 
 
-@no_type_check  # FIXME: dead code
-def headless() -> None:
-    """Sets up out headless server and start the game."""
+def headless(
+    load_slot: Optional[int] = None,
+    max_frames: Optional[int] = None,
+) -> None:
+    """
+    Configure and start the game without window, audio or input devices.
+
+    The game is updated with a fixed timestep as fast as possible, and
+    nothing is drawn. Intended for servers and scripted runs.
+
+    Parameters:
+        load_slot: Number of the save slot to load, if any. Otherwise
+            the starting map of the first mod is loaded.
+        max_frames: Number of updates after which the game stops, if any.
+
+    """
+    log.configure()
+    prepare.init(headless=True)
+    config = prepare.CONFIG
+
+    import pygame
+
     from tuxemon.client import HeadlessClient
 
-    control = HeadlessClient()
-    control.auto_state_discovery()
-    control.push_state("HeadlessServerState")
-    control.main()
+    client = HeadlessClient(config)
+
+    # global/singleton hack for now
+    setattr(prepare, "GLOBAL_CONTROL", client)
+    local_session.client = client
+
+    client.push_state(BackgroundState())
+    if load_slot:
+        client.push_state(LoadMenuState(load_slot=load_slot))
+        client.pop_state()
+    else:
+        destination = f"{prepare.STARTING_MAP}{config.mods[0]}.tmx"
+        map_name = prepare.fetch("maps", destination)
+        client.push_state(WorldState(map_name=map_name))
+
+    client.run(max_frames)
+    pygame.quit()
@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Generator,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from heapq import heappop, heappush
 from itertools import product
 from math import atan2, pi
 from typing import TYPE_CHECKING, Any, NamedTuple, Optional, TypeVar, Union
 
+import pygame
 import pyscroll
+from pyscroll.common import RectLike, rect_to_bb
 from pytmx import pytmx
 from pytmx.pytmx import TiledMap
 
@@ -29,6 +38,9 @@ logger = logging.getLogger(__name__)
 
 RectTypeVar = TypeVar("RectTypeVar", bound=ReadOnlyRect)
 
+# layer of the animations played on the map
+MAP_ANIMATION_LAYER: int = 4
+
 
 class RegionProperties(NamedTuple):
     enter_from: Sequence[Direction]
@@ -562,6 +574,175 @@ class PathfindNode:
         return s
 
 
+class MergedTileData(pyscroll.data.TiledMapData):
+    """
+    Map data for pyscroll, with the tile layers merged between sprite layers.
+
+    The visible tile layers are split in groups at the sprite layers: the
+    layers up to the first sprite layer, the layers up to the next one, and
+    so on. The renderer draws one merged tile per group instead of one tile
+    per layer, and each group is drawn as its last layer, so the sprites
+    are drawn over and under the same tiles as with the separate layers.
+
+    The merged tile of each position is kept until one of its animated
+    tiles changes frame, and merged tiles are shared between positions made
+    of the same images.
+    """
+
+    def __init__(self, tmx: TiledMap, sprite_layers: Iterable[int]) -> None:
+        self.groups: dict[int, list[int]] = {}
+        group: list[int] = []
+        splits = sorted(sprite_layers)
+        for layer in tmx.visible_tile_layers:
+            while splits and layer > splits[0]:
+                splits.pop(0)
+                if group:
+                    self.groups[group[-1]] = group
+                    group = []
+            group.append(layer)
+        if group:
+            self.groups[group[-1]] = group
+        self.base_group = min(self.groups, default=0)
+        self.merged_tiles: dict[tuple[Any, ...], pygame.surface.Surface] = {}
+        # merged tile and animated tiles of each position of each group
+        self.cells: dict[
+            tuple[int, int, int],
+            tuple[Optional[pygame.surface.Surface], list[tuple[int, int]]],
+        ] = {}
+        super().__init__(tmx)
+
+    @property
+    def visible_tile_layers(self) -> Iterable[int]:
+        return self.groups.keys()
+
+    def clear_merged_tiles(self) -> None:
+        """Forget the merged tiles, after the tile images change."""
+        self.merged_tiles.clear()
+        self.cells.clear()
+
+    def merge_tiles(
+        self,
+        group: int,
+        images: Sequence[pygame.surface.Surface],
+    ) -> pygame.surface.Surface:
+        """
+        Merge the tiles of a group of layers into one tile.
+
+        Parameters:
+            group: Group of layers of the tiles.
+            images: Tiles to merge, from the lowest layer.
+
+        Returns:
+            The merged tile.
+
+        """
+        if len(images) == 1:
+            return images[0]
+        key = (group == self.base_group, *images)
+        tile = self.merged_tiles.get(key)
+        if tile is None:
+            if group == self.base_group:
+                # same as drawing the layers on the cleared renderer buffer
+                tile = pygame.Surface(self.tile_size)
+                tile.fill(prepare.BLACK_COLOR)
+            else:
+                tile = pygame.Surface(self.tile_size, pygame.SRCALPHA)
+            tile.blits([(image, (0, 0)) for image in images], doreturn=False)
+            self.merged_tiles[key] = tile
+        return tile
+
+    def get_cell(
+        self, x: int, y: int, group: int
+    ) -> tuple[Optional[pygame.surface.Surface], list[tuple[int, int]]]:
+        """
+        Get the merged tile of a position, with the current animations.
+
+        Parameters:
+            x: X coordinate.
+            y: Y coordinate.
+            group: Group of layers.
+
+        Returns:
+            The merged tile, or None if the layers are empty, and the gid
+            and layer of the animated tiles of the position.
+
+        """
+        cell = self.cells.get((x, y, group))
+        if cell is None:
+            images = []
+            animated = []
+            for layer in self.groups[group]:
+                gid = self.tmx.layers[layer].data[y][x]
+                if not gid:
+                    continue
+                if gid in self._tracked_gids:
+                    animated.append((gid, layer))
+                image = self._animated_tile.get((x, y, layer))
+                if image is None:
+                    image = self.tmx.images[gid]
+                if image:
+                    images.append(image)
+            tile = self.merge_tiles(group, images) if images else None
+            cell = self.cells[(x, y, group)] = (tile, animated)
+        return cell
+
+    def get_tile_image(
+        self, x: int, y: int, l: int
+    ) -> Optional[pygame.surface.Surface]:
+        if 0 <= x < self.tmx.width and 0 <= y < self.tmx.height:
+            return self.get_cell(x, y, l)[0]
+        return None
+
+    def get_tile_images_by_rect(
+        self, rect: RectLike
+    ) -> Generator[tuple[int, int, int, pygame.surface.Surface], None, None]:
+        left, top, right, bottom = rect_to_bb(rect)
+        xs = range(max(left, 0), min(right, self.tmx.width - 1) + 1)
+        ys = range(max(top, 0), min(bottom, self.tmx.height - 1) + 1)
+        animation_map = self._animation_map
+        for group in self.groups:
+            for y, x in product(ys, xs):
+                tile, animated = self.get_cell(x, y, group)
+                # the animations of the tiles on screen are tracked
+                for gid, layer in animated:
+                    animation_map[gid].positions.add((x, y, layer))
+                if tile:
+                    yield x, y, group, tile
+
+    def process_animation_queue(
+        self, tile_view: RectLike
+    ) -> list[tuple[int, int, int, pygame.surface.Surface]]:
+        new_tiles: list[tuple[int, int, int, pygame.surface.Surface]] = []
+        self._update_time()
+        queue = self._animation_queue
+        if not queue or queue[0].next > self._last_time:
+            return new_tiles
+
+        positions = set()
+        while queue[0].next <= self._last_time:
+            token = heappop(queue)
+            next_frame = token.advance(self._last_time)
+            heappush(queue, token)
+            for position in token.positions.copy():
+                x, y, l = position
+                if tile_view.collidepoint(x, y):
+                    self._animated_tile[position] = next_frame.image
+                    positions.add((x, y))
+                else:
+                    token.positions.remove(position)
+
+        for group in self.groups:
+            for x, y in positions:
+                self.cells.pop((x, y, group), None)
+        # redraw the changed positions, from the lowest group
+        for group in self.groups:
+            for x, y in positions:
+                tile = self.get_cell(x, y, group)[0]
+                if tile:
+                    new_tiles.append((x, y, group, tile))
+        return new_tiles
+
+
 class TuxemonMap:
     """
     Contains collisions geometry and events loaded from a file.
@@ -656,7 +837,13 @@ class TuxemonMap:
             Renderer for the map.
 
         """
-        visual_data = pyscroll.data.TiledMapData(self.data)
+        visual_data: pyscroll.data.TiledMapData
+        if prepare.CONFIG.merge_tile_layers:
+            visual_data = MergedTileData(
+                self.data, (self.sprite_layer, MAP_ANIMATION_LAYER)
+            )
+        else:
+            visual_data = pyscroll.data.TiledMapData(self.data)
         # Behaviour at the edges.
         clamp = self.edges == "clamped"
         self.renderer = pyscroll.BufferedRenderer(
@@ -675,4 +862,6 @@ class TuxemonMap:
         )
         assert self.renderer
         self.renderer.data.tmx.images = data.images
+        if isinstance(self.renderer.data, MergedTileData):
+            self.renderer.data.clear_merged_tiles()
         self.renderer.redraw_tiles(self.renderer._buffer)
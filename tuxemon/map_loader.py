@@ -1,8 +1,15 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import hashlib
 import logging
+import os
+import pickle
+import tempfile
 import uuid
-from collections.abc import Generator
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+from collections.abc import Generator, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from math import cos, pi, sin
 from typing import Any, Optional
 
@@ -12,9 +19,16 @@ from natsort import natsorted
 
 from tuxemon import prepare
 from tuxemon.compat import Rect
+from tuxemon.constants import paths
 from tuxemon.db import Direction, Orientation, SurfaceKeys
 from tuxemon.event import EventObject, MapAction, MapCondition
-from tuxemon.graphics import scaled_image_loader
+from tuxemon.graphics import (
+    TileData,
+    TileKey,
+    cached_image_loader,
+    recording_image_loader,
+    scaled_image_loader,
+)
 from tuxemon.lib.bresenham import bresenham
 from tuxemon.map import (
     RegionProperties,
@@ -47,6 +61,17 @@ region_properties = [
     "key",
 ]
 
+# Bump when the structures stored in the map bundles change
+MAP_BUNDLE_VERSION: int = 1
+MAP_BUNDLE_DIR = os.path.join(paths.CACHE_DIR, "maps")
+
+# position of the map name in the parameters of the actions changing map
+teleport_actions = {
+    "teleport": 0,
+    "transition_teleport": 0,
+    "delayed_teleport": 1,
+}
+
 
 class YAMLEventLoader:
     """
@@ -54,7 +79,7 @@ class YAMLEventLoader:
     """
 
     def load_events(
-        self, path: str, source: str
+        self, path: str, source: Optional[str] = None
     ) -> dict[str, list[EventObject]]:
         """
         Load EventObjects from a YAML file.
@@ -65,7 +90,8 @@ class YAMLEventLoader:
 
         Parameters:
             path: Path to the file.
-            source: The type of events to load (either "event" or "init").
+            source: The type of events to load (either "event" or "init"),
+                or None to load both with a single read of the file.
 
         Returns:
             A dictionary with "events" and "inits" as keys, each containing a list
@@ -121,7 +147,9 @@ class YAMLEventLoader:
                 _acts = MapAction("behav", _squeeze, f"behav{str(key*10)}")
                 acts.insert(0, _acts)
 
-            if event_type == source:
+            if event_type == source or (
+                source is None and event_type in events_dict
+            ):
                 event = EventObject(_id, name, x, y, w, h, conds, acts)
                 events_dict[event_type].append(event)
 
@@ -171,11 +199,7 @@ class TMXMapLoader:
             The loaded map.
 
         """
-        data = pytmx.TiledMap(
-            filename=filename,
-            image_loader=self.image_loader,
-            pixelalpha=True,
-        )
+        data = self.load_tiled_map(filename)
         tile_size = (data.tilewidth, data.tileheight)
         data.tilewidth, data.tileheight = prepare.TILE_SIZE
         events = []
@@ -260,6 +284,23 @@ class TMXMapLoader:
             filename,
         )
 
+    def load_tiled_map(self, filename: str) -> pytmx.TiledMap:
+        """
+        Load the tiles and objects of a tmx map file.
+
+        Parameters:
+            filename: The path to the tmx map file to load.
+
+        Returns:
+            The map parsed by pytmx, with the tileset images loaded.
+
+        """
+        return pytmx.TiledMap(
+            filename=filename,
+            image_loader=self.image_loader,
+            pixelalpha=True,
+        )
+
     def extract_tile_collisions(
         self,
         tiled_object: pytmx.TiledObject,
@@ -398,3 +439,290 @@ class TMXMapLoader:
                 )
 
         return EventObject(event_id, obj.name, x, y, w, h, conditions, actions)
+
+
+def load_map(path: str) -> TuxemonMap:
+    """
+    Load a map and the events of its YAML files.
+
+    If the map bundle of the map is up to date, the collisions, surfaces
+    and events are taken from it instead of being derived again, and the
+    tiles are taken from it instead of being cut from the tileset images.
+
+    Parameters:
+        path: Path of the map to load.
+
+    Returns:
+        Loaded map.
+
+    """
+    loader = TMXMapLoader()
+    tiles: dict[TileKey, TileData] = {}
+    if prepare.CONFIG.map_bundles:
+        bundle = load_map_bundle(path)
+        if bundle is not None:
+            loader.image_loader = cached_image_loader(bundle["tiles"])
+            tiled_map = loader.load_tiled_map(path)
+            tiled_map.tilewidth, tiled_map.tileheight = prepare.TILE_SIZE
+            return TuxemonMap(
+                tiled_map=tiled_map, filename=path, **bundle["map"]
+            )
+        loader.image_loader = recording_image_loader(tiles)
+
+    txmn_map = loader.load(path)
+    yaml_files = [path.replace(".tmx", ".yaml")]
+
+    if txmn_map.scenario:
+        _scenario = prepare.fetch("maps", f"{txmn_map.scenario}.yaml")
+        yaml_files.append(_scenario)
+
+    _events = list(txmn_map.events)
+    _inits = list(txmn_map.inits)
+    events = {"event": _events, "init": _inits}
+
+    yaml_loader = YAMLEventLoader()
+
+    for yaml_file in yaml_files:
+        if os.path.exists(yaml_file):
+            yaml_data = yaml_loader.load_events(yaml_file)
+            events["event"].extend(yaml_data["event"])
+            events["init"].extend(yaml_data["init"])
+        else:
+            logger.warning(f"YAML file {yaml_file} not found")
+
+    txmn_map.events = events["event"]
+    txmn_map.inits = events["init"]
+
+    if prepare.CONFIG.map_bundles:
+        sources = [path, *yaml_files, *tileset_sources(path)]
+        sources.extend({filename for filename, _, _ in tiles})
+        save_map_bundle(txmn_map, tiles, sources)
+    return txmn_map
+
+
+def get_map_bundle_path(path: str) -> str:
+    """
+    Path of the bundle of a map in the cache.
+
+    Parameters:
+        path: Path of the map.
+
+    Returns:
+        Path of the bundle, unique to the map file.
+
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:8]
+    return os.path.join(MAP_BUNDLE_DIR, f"{name}-{digest}.pickle")
+
+
+def hash_file(path: str) -> Optional[str]:
+    """
+    Hash the content of a file.
+
+    Parameters:
+        path: Path of the file.
+
+    Returns:
+        The hash, or None if the file doesn't exist.
+
+    """
+    try:
+        with open(path, "rb") as fp:
+            return hashlib.sha1(fp.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_map_bundle(path: str) -> Optional[dict[str, Any]]:
+    """
+    Load the bundle of a map, if its sources didn't change.
+
+    Parameters:
+        path: Path of the map.
+
+    Returns:
+        The bundle, or None if it is missing or outdated.
+
+    """
+    try:
+        with open(get_map_bundle_path(path), "rb") as fp:
+            bundle = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Cannot read map bundle of {path}: {e}")
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get("version") != (
+        MAP_BUNDLE_VERSION
+    ):
+        return None
+    for source, digest in bundle["sources"].items():
+        if hash_file(source) != digest:
+            logger.debug(f"map bundle of {path} is outdated")
+            return None
+    return bundle
+
+
+def tileset_sources(path: str) -> list[str]:
+    """
+    Get the external tileset files used by a map.
+
+    Parameters:
+        path: Path of the map.
+
+    Returns:
+        Paths of the tsx files of the map.
+
+    """
+    root = ElementTree.parse(path).getroot()
+    dirname = os.path.dirname(path)
+    return [
+        os.path.abspath(os.path.join(dirname, tileset.attrib["source"]))
+        for tileset in root.findall("tileset")
+        if "source" in tileset.attrib
+    ]
+
+
+def save_map_bundle(
+    txmn_map: TuxemonMap,
+    tiles: Mapping[TileKey, TileData],
+    sources: Sequence[str],
+) -> None:
+    """
+    Save the structures derived from the map files to the map bundle.
+
+    Parameters:
+        txmn_map: The loaded map.
+        tiles: The tiles of the tilesets used by the map.
+        sources: Paths of the files the map was loaded from.
+
+    """
+    bundle = {
+        "version": MAP_BUNDLE_VERSION,
+        "sources": {source: hash_file(source) for source in sources},
+        "tiles": tiles,
+        "map": {
+            "events": txmn_map.events,
+            "inits": txmn_map.inits,
+            "surface_map": txmn_map.surface_map,
+            "collision_map": txmn_map.collision_map,
+            "collisions_lines_map": txmn_map.collision_lines_map,
+            "maps": txmn_map.maps,
+        },
+    }
+    bundle_path = get_map_bundle_path(txmn_map.filename)
+    try:
+        os.makedirs(MAP_BUNDLE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=MAP_BUNDLE_DIR, delete=False
+        ) as fp:
+            pickle.dump(bundle, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fp.name, bundle_path)
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning(f"Cannot write map bundle of {txmn_map.filename}: {e}")
+
+
+def linked_maps(txmn_map: TuxemonMap) -> list[str]:
+    """
+    Get the maps reachable from a map through its teleport actions.
+
+    Parameters:
+        txmn_map: The map.
+
+    Returns:
+        Paths of the other maps, in the order of the events.
+
+    """
+    paths: list[str] = []
+    for event in (*txmn_map.inits, *txmn_map.events):
+        for act in event.acts:
+            index = teleport_actions.get(act.type)
+            if index is None or len(act.parameters) <= index:
+                continue
+            try:
+                path = prepare.fetch("maps", act.parameters[index])
+            except OSError:
+                continue
+            if path != txmn_map.filename and path not in paths:
+                paths.append(path)
+    return paths
+
+
+def _preload_map(path: str) -> TuxemonMap:
+    txmn_map = load_map(path)
+    txmn_map.initialize_renderer()
+    return txmn_map
+
+
+class MapPreloader:
+    """
+    Load maps on a worker thread before they are needed.
+
+    A preloaded map is handed out only once, as the game modifies the map
+    it plays on.
+
+    Parameters:
+        max_maps: Number of maps kept ready. The maps preloaded first are
+            dropped.
+
+    """
+
+    def __init__(self, max_maps: int) -> None:
+        self.max_maps = max_maps
+        self._maps: OrderedDict[str, Future[TuxemonMap]] = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """
+        Start loading maps, unless they are loading or ready already.
+
+        Parameters:
+            paths: Paths of the maps, the most likely to be needed first.
+
+        """
+        if self.max_maps <= 0:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="map_preloader"
+            )
+        for path in list(paths)[: self.max_maps]:
+            future = self._maps.pop(path, None)
+            if future is None:
+                logger.debug(f"Preloading map '{path}'")
+                future = self._executor.submit(_preload_map, path)
+            self._maps[path] = future
+        while len(self._maps) > self.max_maps:
+            _, future = self._maps.popitem(last=False)
+            future.cancel()
+
+    def take(self, path: str) -> Optional[TuxemonMap]:
+        """
+        Get a preloaded map, waiting for it if it is still loading.
+
+        Parameters:
+            path: Path of the map.
+
+        Returns:
+            The map, or None if it wasn't preloaded or failed to load.
+
+        """
+        future = self._maps.pop(path, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Preloading map '{path}' failed: {e!r}")
+            return None
+
+    def clear(self) -> None:
+        """Drop the preloaded maps and stop the worker thread."""
+        for future in self._maps.values():
+            future.cancel()
+        self._maps.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
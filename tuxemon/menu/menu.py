@@ -28,7 +28,7 @@ from tuxemon.sprite import (
     SpriteGroup,
     VisualSpriteList,
 )
-from tuxemon.ui.draw import GraphicBox
+from tuxemon.ui.draw import GraphicBox, load_font
 from tuxemon.ui.text import TextArea
 
 logger = logging.getLogger(__name__)
@@ -727,7 +727,7 @@ class Menu(Generic[T], state.State):
         else:
             self.font_size = tools.scale(size)
 
-        self.font = pygame.font.Font(font, self.font_size)
+        self.font = load_font(font, self.font_size)
 
     def calc_internal_rect(self) -> pygame.rect.Rect:
         """
@@ -306,3 +306,8 @@ class Manager:
                     f"Zip contents are bigger than available disk space ({zipsize} > {free})"
                 )
             zipf.extractall(path=os.path.join(outfolder, name))
+
+        # the resources of the new mod must be visible to a running game
+        from tuxemon import prepare
+
+        prepare.refresh_asset_index()
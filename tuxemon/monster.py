@@ -576,27 +576,32 @@ class Monster:
         if sprite not in sprite_mapping:
             raise ValueError(f"Cannot find sprite for: {sprite}")
 
+        # Flairs drawn over the monster sprite
+        flair_images = []
+        for flair in self.flairs.values():
+            flair_path = self.get_sprite_path(
+                f"gfx/sprites/battle/{self.slug}-{sprite}-{flair.name}"
+            )
+            if flair_path != prepare.MISSING_IMAGE:
+                flair_sprite = graphics.load_sprite(flair_path, **kwargs)
+                flair_images.append(flair_sprite.image)
+
         if sprite == "menu":
             assert (
                 not kwargs
             ), "kwargs aren't supported for loading menu sprites"
             surface = graphics.load_animated_sprite(
-                [self.menu_sprite_1, self.menu_sprite_2], 0.25
+                [self.menu_sprite_1, self.menu_sprite_2],
+                0.25,
+                overlays=flair_images,
             )
         else:
             sprite_path = sprite_mapping[sprite]
             if sprite_path is None:
                 raise ValueError(f"Sprite path for {sprite} is not set")
             surface = graphics.load_sprite(sprite_path, **kwargs)
-
-        # Apply flairs to the monster sprite
-        for flair in self.flairs.values():
-            flair_path = self.get_sprite_path(
-                f"gfx/sprites/battle/{self.slug}-{sprite}-{flair.name}"
-            )
-            if flair_path != prepare.MISSING_IMAGE:
-                flair_sprite = graphics.load_sprite(flair_path, **kwargs)
-                surface.image.blit(flair_sprite.image, (0, 0))
+            for flair_image in flair_images:
+                surface.image.blit(flair_image, (0, 0))
 
         return surface
 
@@ -7,7 +7,8 @@ import os
 import uuid
 from collections.abc import Iterable, Mapping, Sequence
 from math import hypot
-from typing import TYPE_CHECKING, Any, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Optional, TypedDict, cast
+from weakref import WeakValueDictionary
 
 from tuxemon import prepare, surfanim
 from tuxemon.battle import Battle, decode_battle, encode_battle
@@ -22,7 +23,9 @@ from tuxemon.math import Vector2
 from tuxemon.mission import Mission, decode_mission, encode_mission
 from tuxemon.monster import Monster, decode_monsters, encode_monsters
 from tuxemon.prepare import CONFIG
+from tuxemon.save_upgrader import upgrade_monsters
 from tuxemon.session import Session
+from tuxemon.storage import EncodedBox, StorageBoxes
 from tuxemon.technique.technique import Technique
 from tuxemon.tools import vector2_to_tile_pos
 
@@ -51,11 +54,100 @@ class NPCState(TypedDict):
     monsters: Sequence[Mapping[str, Any]]
     player_name: str
     player_steps: float
-    monster_boxes: dict[str, Sequence[Mapping[str, Any]]]
-    item_boxes: dict[str, Sequence[Mapping[str, Any]]]
+    monster_boxes: Mapping[str, EncodedBox]
+    item_boxes: Mapping[str, EncodedBox]
     tile_pos: tuple[int, int]
 
 
+def decode_monster_box(
+    json_data: Sequence[Mapping[str, Any]],
+) -> list[Monster]:
+    # the monsters are decoded from JSON, so they can be updated in place
+    upgrade_monsters(cast(Sequence[dict[str, Any]], json_data))
+    return decode_monsters(json_data)
+
+
+class SpriteSheet:
+    """
+    Standing and walking frames of an NPC sprite.
+
+    The sheets are shared by all the NPCs with the same sprite; the
+    surfaces and animations must not be modified, NPCs play copies of
+    the walking animations.
+
+    Parameters:
+        sprite_name: Name of the sprite, from the NPC template.
+        interactive_obj: Whether the sprite is an interactive object,
+            with a single image in "sprites_obj".
+
+    """
+
+    def __init__(self, sprite_name: str, interactive_obj: bool) -> None:
+        # Get all of the player's standing animation images.
+        self.standing: dict[str, pygame.surface.Surface] = {}
+        for standing_type in list(EntityFacing):
+            # if the template slug is interactive_obj, then it needs _front
+            if interactive_obj:
+                filename = f"{sprite_name}.png"
+                path = os.path.join("sprites_obj", filename)
+            else:
+                filename = f"{sprite_name}_{standing_type.value}.png"
+                path = os.path.join("sprites", filename)
+            self.standing[standing_type] = load_and_scale(path)
+        self.size = self.standing[EntityFacing.front].get_size()
+
+        # avoid cutoff frames when steps don't line up with tile movement
+        n_frames = 3
+        frame_duration = (1000 / CONFIG.player_walkrate) / n_frames / 1000 * 2
+
+        # Load all of the player's sprite animations
+        self.walking: dict[str, surfanim.SurfaceAnimation] = {}
+        if interactive_obj:
+            return
+        for anim_type in list(EntityFacing):
+            images: list[str] = []
+            anim_0 = f"sprites/{sprite_name}_{anim_type.value}_walk"
+            anim_1 = f"sprites/{sprite_name}_{anim_type.value}.png"
+            images.append(f"{anim_0}.{str(0).zfill(3)}.png")
+            images.append(anim_1)
+            images.append(f"{anim_0}.{str(1).zfill(3)}.png")
+            images.append(anim_1)
+
+            frames: list[tuple[pygame.surface.Surface, float]] = []
+            for image in images:
+                surface = load_and_scale(image)
+                frames.append((surface, frame_duration))
+
+            _surfanim = surfanim.SurfaceAnimation(frames, loop=True)
+            self.walking[f"{anim_type.value}_walk"] = _surfanim
+
+
+# Sprite sheets in use, a sheet is released with the last NPC using it
+sprite_sheets: WeakValueDictionary[
+    tuple[str, bool], SpriteSheet
+] = WeakValueDictionary()
+
+
+def get_sprite_sheet(sprite_name: str, interactive_obj: bool) -> SpriteSheet:
+    """
+    Get the sprite sheet of an NPC sprite, loading it if no NPC uses it.
+
+    Parameters:
+        sprite_name: Name of the sprite, from the NPC template.
+        interactive_obj: Whether the sprite is an interactive object.
+
+    Returns:
+        The shared sprite sheet.
+
+    """
+    key = (sprite_name, interactive_obj)
+    sheet = sprite_sheets.get(key)
+    if sheet is None:
+        sheet = SpriteSheet(sprite_name, interactive_obj)
+        sprite_sheets[key] = sheet
+    return sheet
+
+
 def tile_distance(tile0: Iterable[float], tile1: Iterable[float]) -> float:
     x0, y0 = tile0
     x1, y1 = tile1
@@ -119,8 +211,13 @@ class NPC(Entity[NPCState]):
         # Variables for long-term item and monster storage
         # Keeping these separate so other code can safely
         # assume that all values are lists
-        self.monster_boxes: dict[str, list[Monster]] = {}
-        self.item_boxes: dict[str, list[Item]] = {}
+        # The boxes are decoded from the save when they are first used
+        self.monster_boxes: StorageBoxes[Monster] = StorageBoxes(
+            decode_monster_box, encode_monsters
+        )
+        self.item_boxes: StorageBoxes[Item] = StorageBoxes(
+            decode_items, encode_items
+        )
         self.pending_evolutions: list[tuple[Monster, Monster]] = []
         # nr tuxemon fight
         self.max_position: int = 1
@@ -199,17 +296,11 @@ class NPC(Entity[NPCState]):
             "monsters": encode_monsters(self.monsters),
             "player_name": self.name,
             "player_steps": self.steps,
-            "monster_boxes": dict(),
-            "item_boxes": dict(),
+            "monster_boxes": self.monster_boxes.get_sections(),
+            "item_boxes": self.item_boxes.get_sections(),
             "tile_pos": self.tile_pos,
         }
 
-        for monsterkey, monstervalue in self.monster_boxes.items():
-            state["monster_boxes"][monsterkey] = encode_monsters(monstervalue)
-
-        for itemkey, itemvalue in self.item_boxes.items():
-            state["item_boxes"][itemkey] = encode_items(itemvalue)
-
         return state
 
     def set_state(self, session: Session, save_data: NPCState) -> None:
@@ -240,10 +331,8 @@ class NPC(Entity[NPCState]):
             self.missions.append(mission)
         self.name = save_data["player_name"]
         self.steps = save_data["player_steps"]
-        for monsterkey, monstervalue in save_data["monster_boxes"].items():
-            self.monster_boxes[monsterkey] = decode_monsters(monstervalue)
-        for itemkey, itemvalue in save_data["item_boxes"].items():
-            self.item_boxes[itemkey] = decode_items(itemvalue)
+        self.monster_boxes.load_sections(save_data["monster_boxes"])
+        self.item_boxes.load_sections(save_data["item_boxes"])
 
         _template = save_data["template"]
         self.template.slug = _template["slug"]
@@ -254,51 +343,21 @@ class NPC(Entity[NPCState]):
     def load_sprites(self) -> None:
         """Load sprite graphics."""
         # TODO: refactor animations into renderer
-        # Get all of the player's standing animation images.
         self.interactive_obj: bool = False
         if self.template.slug == "interactive_obj":
             self.interactive_obj = True
 
-        self.standing = {}
-        for standing_type in list(EntityFacing):
-            # if the template slug is interactive_obj, then it needs _front
-            if self.interactive_obj:
-                filename = f"{self.template.sprite_name}.png"
-                path = os.path.join("sprites_obj", filename)
-            else:
-                filename = (
-                    f"{self.template.sprite_name}_{standing_type.value}.png"
-                )
-                path = os.path.join("sprites", filename)
-            self.standing[standing_type] = load_and_scale(path)
+        # The frames are shared by every NPC with the same sprite, the NPC
+        # only keeps the playback state of its animations.
+        self.sprite_sheet = get_sprite_sheet(
+            self.template.sprite_name, self.interactive_obj
+        )
+        self.standing = self.sprite_sheet.standing
         # The player's sprite size in pixels
-        self.playerWidth, self.playerHeight = self.standing[
-            EntityFacing.front
-        ].get_size()
+        self.playerWidth, self.playerHeight = self.sprite_sheet.size
 
-        # avoid cutoff frames when steps don't line up with tile movement
-        n_frames = 3
-        frame_duration = (1000 / CONFIG.player_walkrate) / n_frames / 1000 * 2
-
-        # Load all of the player's sprite animations
-        anim_types = list(EntityFacing)
-        for anim_type in anim_types:
-            if not self.interactive_obj:
-                images: list[str] = []
-                anim_0 = f"sprites/{self.template.sprite_name}_{anim_type.value}_walk"
-                anim_1 = f"sprites/{self.template.sprite_name}_{anim_type.value}.png"
-                images.append(f"{anim_0}.{str(0).zfill(3)}.png")
-                images.append(anim_1)
-                images.append(f"{anim_0}.{str(1).zfill(3)}.png")
-                images.append(anim_1)
-
-                frames: list[tuple[pygame.surface.Surface, float]] = []
-                for image in images:
-                    surface = load_and_scale(image)
-                    frames.append((surface, frame_duration))
-
-                _surfanim = surfanim.SurfaceAnimation(frames, loop=True)
-                self.sprite[f"{anim_type.value}_walk"] = _surfanim
+        for name, animation in self.sprite_sheet.walking.items():
+            self.sprite[name] = animation.copy()
 
         # Have the animation objects managed by a SurfaceAnimationCollection.
         # With the SurfaceAnimationCollection, we can call play() and stop() on
@@ -595,6 +654,16 @@ class NPC(Entity[NPCState]):
         self.tile_pos = vector2_to_tile_pos(proj(self.position3))
         self.network_notify_location_change()
 
+    def get_draw_position(self, time_delta: float) -> Vector2:
+        position = super().get_draw_position(time_delta)
+        if self.path_origin is not None and len(self.path) == 1:
+            # do not draw the npc past the end of its path
+            target = self.path[-1]
+            expected = tile_distance(self.path_origin, target)
+            if tile_distance(position, self.path_origin) > expected:
+                return Vector2(target)
+        return position
+
     def network_notify_start_moving(self, direction: Direction) -> None:
         r"""WIP guesswork ¯\_(ツ)_/¯"""
         if self.world.client.isclient or self.world.client.ishost:
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from collections.abc import Generator, Mapping, Sequence
 from typing import Any, ClassVar, Generic, Optional, TypeVar
 
+from tuxemon.platform.const import buttons
+
 _InputEventType = TypeVar("_InputEventType", contravariant=True)
 
 
@@ -32,6 +35,23 @@ class EventQueueHandler(ABC):
             for inp in value:
                 yield from inp.virtual_stop_events()
 
+    @abstractmethod
+    def set_input(
+        self,
+        player: int,
+        element: int,
+        handler: InputHandler[Any],
+    ) -> None:
+        """
+        Sets an input handler to process.
+
+        Parameters:
+            player: Number of the player the handler belongs to.
+            element: Index to modify
+            handler: Handler whose events will be processed from now on.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def process_events(self) -> Generator[PlayerInput, None, None]:
         """
@@ -140,6 +160,68 @@ class InputHandler(ABC, Generic[_InputEventType]):
         inp.triggered = True
 
 
+class VirtualInput(InputHandler[Any]):
+    """
+    Input handler whose buttons are only pressed and released by code.
+
+    Used when there is no input device, such as by the headless client.
+    Scripts drive it with :meth:`InputHandler.press` and
+    :meth:`InputHandler.release`.
+
+    Parameters:
+        event_map: Mapping of original identifiers to button identifiers.
+
+    """
+
+    default_input_map = {
+        buttons.UP: buttons.UP,
+        buttons.DOWN: buttons.DOWN,
+        buttons.LEFT: buttons.LEFT,
+        buttons.RIGHT: buttons.RIGHT,
+        buttons.A: buttons.A,
+        buttons.B: buttons.B,
+        buttons.BACK: buttons.BACK,
+    }
+
+    def process_event(self, input_event: Any) -> None:
+        pass
+
+
+class HeadlessEventQueueHandler(EventQueueHandler):
+    """Collect the events of input handlers, without a platform queue."""
+
+    def __init__(self) -> None:
+        self._inputs: defaultdict[int, list[InputHandler[Any]]] = defaultdict(
+            list
+        )
+
+    def add_input(self, player: int, handler: InputHandler[Any]) -> None:
+        """
+        Add an input handler to process.
+
+        Parameters:
+            player: Number of the player the handler belongs to.
+            handler: Handler whose events will be processed from now on.
+
+        """
+        self._inputs[player].append(handler)
+
+    def set_input(
+        self,
+        player: int,
+        element: int,
+        handler: InputHandler[Any],
+    ) -> None:
+        # the virtual input of a headless client is never replaced by the
+        # devices configured for a window
+        pass
+
+    def process_events(self) -> Generator[PlayerInput, None, None]:
+        for inputs in self._inputs.values():
+            for player_input in inputs:
+                yield from player_input.get_events()
+
+
 class PlayerInput:
     """
     Represents a single player input.
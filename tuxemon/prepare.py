@@ -9,7 +9,8 @@ from __future__ import annotations
 import logging
 import os.path
 import re
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Optional
 
 from tuxemon import config
 from tuxemon.constants import paths
@@ -392,8 +393,15 @@ SAVE_METHOD = "JSON"
 DEV_TOOLS = CONFIG.dev_tools
 
 
-def pygame_init() -> None:
-    """Eventually refactor out of prepare."""
+def pygame_init(headless: bool = False) -> None:
+    """
+    Eventually refactor out of prepare.
+
+    Parameters:
+        headless: Whether to run without a window, audio output or input
+            devices, using the SDL dummy drivers.
+
+    """
     global JOYSTICKS
     global FONTS
     global MUSIC
@@ -410,7 +418,16 @@ def pygame_init() -> None:
     T.collect_languages(CONFIG.recompile_translations)
     from tuxemon.db import db
 
-    db.load()
+    db.load(
+        snapshot=CONFIG.db_snapshot,
+        lazy=CONFIG.db_lazy,
+        workers=CONFIG.db_workers,
+    )
+
+    if headless:
+        # must be set before pygame is initialized
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
 
     logger.debug("pygame init")
     pg.init()
@@ -427,13 +444,16 @@ def pygame_init() -> None:
     SCREEN = pg.display.set_mode(SCREEN_SIZE, flags)
     SCREEN_RECT = SCREEN.get_rect()
 
+    JOYSTICKS = list()
+    if headless:
+        return
+
     # Disable the mouse cursor visibility
     pg.mouse.set_visible(not CONFIG.hide_mouse)
 
     # Set up any gamepads that we detect
     # The following event types will be generated by the joysticks:
     # JOYAXISMOTION JOYBALLMOTION JOYBUTTONDOWN JOYBUTTONUP JOYHATMOTION
-    JOYSTICKS = list()
     pg.joystick.init()
     devices = [pg.joystick.Joystick(x) for x in range(pg.joystick.get_count())]
 
@@ -451,39 +471,126 @@ def pygame_init() -> None:
 
 
 # Initialize the game framework
-def init() -> None:
+def init(headless: bool = False) -> None:
+    """
+    Initialize the platform and the game framework.
+
+    Parameters:
+        headless: Whether to run without a window, audio output or input
+            devices.
+
+    """
     from tuxemon import platform
 
     platform.init()
     if PLATFORM == "pygame":
-        pygame_init()
+        pygame_init(headless)
 
 
-# Fetches a resource file
-# note: this has the potential of being a bottle neck doing to all the checking of paths
-# eventually, this should be configured at game launch, or in a config file instead
-# of looking all over creation for the required files.
-def fetch(*args: str) -> str:
-    relative_path = os.path.join(*args)
+# Index of the resources of the enabled mods, see build_asset_index
+_asset_index: Optional[dict[str, Optional[str]]] = None
+# Held while building the index, as maps are also loaded on a worker thread
+_asset_index_lock = threading.Lock()
 
-    for mod_name in CONFIG.mods:
-        # when assets are in folder with the source
-        path = os.path.join(paths.mods_folder, mod_name, relative_path)
-        logger.debug("searching asset: %s", path)
-        if os.path.exists(path):
-            return path
 
-        # when assets are in a system path (like for os packages and android)
+def get_asset_roots() -> list[str]:
+    """
+    Get the folders searched for resources, by order of precedence.
+
+    For each enabled mod, the assets can be in the folder with the source,
+    in a system path (like for os packages and android) or in the mods
+    folder in the same folder as the launch script.
+
+    Returns:
+        The existing mod folders.
+
+    """
+    roots: list[str] = []
+    seen: set[str] = set()
+    for mod_name in CONFIG.mods:
+        candidates = [os.path.join(paths.mods_folder, mod_name)]
         for root_path in paths.system_installed_folders:
-            path = os.path.join(root_path, "mods", mod_name, relative_path)
-            logger.debug("searching asset: %s", path)
-            if os.path.exists(path):
-                return path
+            candidates.append(os.path.join(root_path, "mods", mod_name))
+        candidates.append(os.path.join(paths.BASEDIR, "mods", mod_name))
+        for path in candidates:
+            real_path = os.path.realpath(path)
+            if real_path not in seen and os.path.isdir(path):
+                seen.add(real_path)
+                roots.append(path)
+    return roots
+
+
+def build_asset_index() -> dict[str, Optional[str]]:
+    """
+    Walk the folders of the enabled mods once, indexing every resource.
+
+    Linked folders are followed, but each folder is only walked once, so
+    that a link to a parent folder doesn't loop forever.
+
+    Returns:
+        Mapping of the normalized relative path of each file and folder to
+        the mod folder it must be loaded from.
+
+    """
+    index: dict[str, Optional[str]] = {}
+    for root in get_asset_roots():
+        visited: set[str] = set()
+        for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+            real_path = os.path.realpath(dirpath)
+            if real_path in visited:
+                dirnames.clear()
+                continue
+            visited.add(real_path)
+            relative_dir = os.path.relpath(dirpath, root)
+            for name in dirnames + filenames:
+                relative_path = os.path.normpath(
+                    os.path.join(relative_dir, name)
+                )
+                index.setdefault(relative_path, root)
+    logger.debug("indexed %d assets", len(index))
+    return index
+
+
+def refresh_asset_index() -> None:
+    """
+    Discard the resource index, so it's rebuilt on the next fetch.
+
+    Must be called whenever mods are installed or the assets are modified
+    while the game is running.
+
+    """
+    global _asset_index
+    _asset_index = None
+
+
+# Fetches a resource file
+# note: resources are looked up in an index built once, checking the paths
+# only the first time a file is missing from it (e.g. created after the
+# index was built), so missing files are only searched again after
+# refresh_asset_index
+def fetch(*args: str) -> str:
+    global _asset_index
+    relative_path = os.path.join(*args)
 
-        # mods folder is in same folder as the launch script
-        path = os.path.join(paths.BASEDIR, "mods", mod_name, relative_path)
+    index = _asset_index
+    if index is None:
+        with _asset_index_lock:
+            if _asset_index is None:
+                _asset_index = build_asset_index()
+            index = _asset_index
+    key = os.path.normpath(relative_path)
+    if key in index:
+        root = index[key]
+        if root is not None:
+            return os.path.join(root, relative_path)
+        raise OSError(f"cannot load file {relative_path}")
+
+    for root in get_asset_roots():
+        path = os.path.join(root, relative_path)
         logger.debug("searching asset: %s", path)
         if os.path.exists(path):
+            index[key] = root
             return path
 
+    index[key] = None
     raise OSError(f"cannot load file {relative_path}")
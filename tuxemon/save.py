@@ -5,12 +5,22 @@ from __future__ import annotations
 import base64
 import datetime
 import importlib
+import io
 import json
 import logging
 import os
+import uuid
 from collections.abc import Callable, Mapping
 from operator import itemgetter
-from typing import Any, Literal, NewType, Optional, TextIO, TypeVar
+from typing import (
+    Any,
+    Literal,
+    NewType,
+    Optional,
+    TextIO,
+    TypedDict,
+    TypeVar,
+)
 
 import pygame
 
@@ -20,6 +30,7 @@ from tuxemon.npc import NPCState
 from tuxemon.save_upgrader import SAVE_VERSION, upgrade_save
 from tuxemon.session import Session
 from tuxemon.states.world.worldstate import WorldState
+from tuxemon.storage import EncodedBox
 
 try:
     import cbor
@@ -37,14 +48,44 @@ TIME_FORMAT = "%Y-%m-%d %H:%M"
 config = prepare.CONFIG
 
 EncodedScreenshot = NewType("EncodedScreenshot", str)
+# size of the thumbnails of the save headers, relative to the screenshot
+THUMBNAIL_SCALE = 0.25
+# keys of the screenshot of the save data, not part of the sections
+SCREENSHOT_KEYS = ("screenshot", "screenshot_width", "screenshot_height")
 
+# id of the last full save of each slot, and the text of its sections
+saved_sections: dict[int, tuple[str, dict[str, str]]] = {}
 
-class SaveData(NPCState):
+
+class SaveScreenshot(TypedDict, total=False):
     screenshot: EncodedScreenshot
     screenshot_width: int
     screenshot_height: int
+
+
+class SaveError(TypedDict, total=False):
+    # set by load when the save file is broken
+    error: str
+
+
+class SaveData(NPCState, SaveScreenshot, SaveError):
+    time: str
+    version: int
+
+
+class SaveHeader(TypedDict, total=False):
+    player_name: str
     time: str
     version: int
+    current_map: str
+    # base64 encoded PNG image
+    thumbnail: str
+    # size and modification time of the save the header describes, and
+    # size of its journal
+    save_size: int
+    save_mtime: int
+    journal_size: int
+    error: str
 
 
 def capture_screenshot(client: LocalPygameClient) -> pygame.surface.Surface:
@@ -64,29 +105,32 @@ def capture_screenshot(client: LocalPygameClient) -> pygame.surface.Surface:
     return screenshot
 
 
-def get_save_data(session: Session) -> SaveData:
+def get_save_data(session: Session, screenshot: bool = True) -> SaveData:
     """
     Gets a dictionary which represents the state of the session.
 
     Parameters:
         session: Game session.
+        screenshot: Whether to capture a screenshot of the world, which
+            redraws it.
 
     Returns:
         Game data to save, must be JSON encodable.
 
     """
-    screenshot = capture_screenshot(session.client)
     npc_state = session.player.get_state(session)
     save_data: SaveData = {
-        "screenshot": base64.b64encode(
-            pygame.image.tobytes(screenshot, "RGB")
-        ).decode(),
-        "screenshot_width": screenshot.get_width(),
-        "screenshot_height": screenshot.get_height(),
         "time": datetime.datetime.now().strftime(TIME_FORMAT),
         "version": SAVE_VERSION,
-        **npc_state,  # type: ignore[misc]
+        **npc_state,
     }
+    if screenshot:
+        image = capture_screenshot(session.client)
+        save_data["screenshot"] = EncodedScreenshot(
+            base64.b64encode(pygame.image.tobytes(image, "RGB")).decode()
+        )
+        save_data["screenshot_width"] = image.get_width()
+        save_data["screenshot_height"] = image.get_height()
     return save_data
 
 
@@ -191,15 +235,24 @@ def open_save_file(save_path: str) -> Optional[dict[str, Any]]:
 def save(
     save_data: SaveData,
     slot: int,
+    incremental: bool = False,
 ) -> None:
     """
     Saves the current game state to a file using gzip compressed JSON.
 
+    An incremental save only appends the sections of the save which
+    changed since the last save of the slot to the journal of the save,
+    see :func:`save_incremental`.
+
     Parameters:
         save_data: The data to save.
         slot: The save slot to save the data to.
+        incremental: Whether to only save the changed sections.
 
     """
+    if incremental and save_incremental(save_data, slot):
+        return
+
     # Save a screenshot of the current frame
 
     save_path = get_save_path(slot)
@@ -208,17 +261,177 @@ def save(
         "indent": 4,
         "separators": (",", ": "),
     }
+    # the journal records of other versions of the save are ignored
+    save_id = uuid.uuid4().hex
+    package = {**save_data, "save_id": save_id}
 
     logger.info("Saving data to save file: %s", save_path)
     if config.compress_save is None and prepare.SAVE_METHOD == "CBOR":
-        cbor.dump(save_data, save_path_tmp)
+        cbor.dump(package, save_path_tmp)
     else:
-        json_dump(save_data, save_path_tmp, json_kwargs=json_kwargs)
+        json_dump(package, save_path_tmp, json_kwargs=json_kwargs)
 
     # Don't dump straight to the file: if we crash it would corrupt
     # the save_data
     # We use a temporal file plus atomic replacement instead
     os.replace(save_path_tmp, save_path)
+    try:
+        os.remove(get_journal_path(slot))
+    except FileNotFoundError:
+        pass
+    saved_sections[slot] = (save_id, get_sections(save_data))
+    update_header(save_data, slot)
+
+
+def save_incremental(save_data: SaveData, slot: int) -> bool:
+    """
+    Appends the sections of the save which changed to its journal.
+
+    The sections are compared to the ones of the last save of the slot
+    done by this game. The journal is a file of JSON lines next to the
+    save, which records are applied over the save when it is loaded; a
+    record interrupted by a crash is ignored. The screenshot is only
+    updated in the header of the save.
+
+    If the journal can't be written, the slot is forgotten, so that its
+    next save is a full save.
+
+    Parameters:
+        save_data: The data to save.
+        slot: The save slot to save the data to.
+
+    Returns:
+        False if a full save is needed instead: the slot wasn't saved
+        since the game started, or the journal got larger than the save.
+
+    """
+    if slot not in saved_sections:
+        return False
+    save_id, saved = saved_sections[slot]
+    save_path = get_save_path(slot)
+    journal_path = get_journal_path(slot)
+    try:
+        save_size = os.path.getsize(save_path)
+    except OSError:
+        return False
+    if os.path.exists(journal_path):
+        if os.path.getsize(journal_path) > save_size:
+            return False
+
+    sections = get_sections(save_data)
+    changed = {
+        name: text
+        for name, text in sections.items()
+        if saved.get(name) != text
+    }
+    removed = set(saved) - set(sections)
+    for name in removed:
+        changed[name] = "null"
+
+    logger.info(
+        "Saving %d sections to journal: %s", len(changed), journal_path
+    )
+    fields = ",".join(
+        f"{json.dumps(name)}:{text}" for name, text in changed.items()
+    )
+    record = f'{{"save_id":"{save_id}","sections":{{{fields}}}}}\n'
+    try:
+        with open(journal_path, "a", encoding="utf-8") as file:
+            file.write(record)
+            file.flush()
+            os.fsync(file.fileno())
+    except OSError:
+        # the changes may not be on disk, and the journal may end with a
+        # partial record: the next save replaces it with a full save
+        del saved_sections[slot]
+        raise
+
+    # the sections are only saved once they are on disk
+    for name in removed:
+        del saved[name]
+        del changed[name]
+    saved.update(changed)
+    update_header(save_data, slot)
+    return True
+
+
+def get_sections(save_data: SaveData) -> dict[str, str]:
+    """
+    Split the save in sections, for the incremental saves.
+
+    The storage boxes are a section each, named after the key of the boxes
+    and the name of the box, such as "monster_boxes/Kennel".
+
+    Parameters:
+        save_data: The data to save.
+
+    Returns:
+        The JSON text of each section, by name.
+
+    """
+    # the storage boxes are saved as a section per box
+    boxes: dict[str, Mapping[str, EncodedBox]] = {
+        "monster_boxes": save_data["monster_boxes"],
+        "item_boxes": save_data["item_boxes"],
+    }
+    sections = {}
+    for key, value in save_data.items():
+        if key not in SCREENSHOT_KEYS and key not in boxes:
+            sections[key] = json.dumps(value, separators=(",", ":"))
+    for key, key_boxes in boxes.items():
+        for box, section in key_boxes.items():
+            # the boxes are JSON text already, encoded again as a string,
+            # which is how the save stores them
+            sections[f"{key}/{box}"] = json.dumps(
+                section, separators=(",", ":")
+            )
+    return sections
+
+
+def get_journal_path(slot: int) -> str:
+    return f"{get_save_path(slot)}.journal"
+
+
+def get_journal_size(slot: int) -> int:
+    try:
+        return os.path.getsize(get_journal_path(slot))
+    except OSError:
+        return 0
+
+
+def apply_journal(save_data: dict[str, Any], slot: int) -> None:
+    """
+    Applies the records of the journal of a save.
+
+    Parameters:
+        save_data: The data of the save, which is modified.
+        slot: The save slot of the save.
+
+    """
+    try:
+        with open(get_journal_path(slot), encoding="utf-8") as file:
+            lines = file.readlines()
+    except OSError:
+        return
+
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            logger.warning(
+                "Ignoring incomplete journal record of slot %d", slot
+            )
+            break
+        if record.get("save_id") != save_data.get("save_id"):
+            continue
+        for name, value in record["sections"].items():
+            key, _, box = name.partition("/")
+            if not box:
+                save_data[key] = value
+            elif value is None:
+                save_data[key].pop(box, None)
+            else:
+                save_data[key][box] = value
 
 
 def load(slot: int) -> Optional[SaveData]:
@@ -236,6 +449,7 @@ def load(slot: int) -> Optional[SaveData]:
     save_data = open_save_file(save_path)
 
     if save_data:
+        apply_journal(save_data, slot)
         return upgrade_save(save_data)
     elif save_data is None:
         # File not found; it probably wasn't ever created, so don't panic
@@ -250,11 +464,10 @@ def load(slot: int) -> Optional[SaveData]:
 def get_index_of_latest_save() -> Optional[int]:
     times = []
     for slot_index in range(3):
-        save_path = get_save_path(slot_index + 1)
-        save_data = open_save_file(save_path)
-        if save_data is not None:
+        header = load_header(slot_index + 1)
+        if header is not None and "time" in header:
             time_of_save = datetime.datetime.strptime(
-                save_data["time"],
+                header["time"],
                 TIME_FORMAT,
             )
             times.append((slot_index, time_of_save))
@@ -263,3 +476,172 @@ def get_index_of_latest_save() -> Optional[int]:
         return s[0]
     else:
         return None
+
+
+def get_header_path(slot: int) -> str:
+    return f"{get_save_path(slot)}.header"
+
+
+def make_header(save_data: SaveData) -> SaveHeader:
+    """
+    Make the header of a save, with a thumbnail of its screenshot.
+
+    Parameters:
+        save_data: The saved data.
+
+    Returns:
+        The header describing the save.
+
+    """
+    header: SaveHeader = {
+        "player_name": save_data["player_name"],
+        "time": save_data["time"],
+        "version": save_data.get("version", 0),
+        "current_map": save_data["current_map"],
+    }
+    if "screenshot" in save_data:
+        size = (save_data["screenshot_width"], save_data["screenshot_height"])
+        screenshot = pygame.image.frombuffer(
+            base64.b64decode(save_data["screenshot"]),
+            size,
+            "RGB",
+        )
+        thumbnail = pygame.transform.smoothscale(
+            screenshot,
+            (int(size[0] * THUMBNAIL_SCALE), int(size[1] * THUMBNAIL_SCALE)),
+        )
+        buffer = io.BytesIO()
+        pygame.image.save(thumbnail, buffer, "thumbnail.png")
+        header["thumbnail"] = base64.b64encode(buffer.getvalue()).decode()
+    return header
+
+
+def update_header(save_data: SaveData, slot: int) -> SaveHeader:
+    """
+    Write the header of a save which was just written.
+
+    A save without screenshot keeps the thumbnail of the previous header
+    of the slot.
+
+    Parameters:
+        save_data: The saved data.
+        slot: The save slot of the save.
+
+    Returns:
+        The header describing the save.
+
+    """
+    header = make_header(save_data)
+    if "thumbnail" not in header:
+        previous = read_header(slot)
+        if previous is not None and "thumbnail" in previous:
+            header["thumbnail"] = previous["thumbnail"]
+    save_header(header, slot)
+    return header
+
+
+def read_header(slot: int) -> Optional[SaveHeader]:
+    """
+    Read the header file of a save, without checking it matches the save.
+
+    Parameters:
+        slot: The save slot of the save.
+
+    Returns:
+        The header, or None if it can't be read.
+
+    """
+    try:
+        with open(get_header_path(slot), encoding="utf-8") as file:
+            header: SaveHeader = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return header
+
+
+def save_header(header: SaveHeader, slot: int) -> None:
+    """
+    Save the header of a save, next to the save file.
+
+    Parameters:
+        header: The header describing the save.
+        slot: The save slot of the save.
+
+    """
+    header_path = get_header_path(slot)
+    header_path_tmp = header_path + ".tmp"
+    stat = os.stat(get_save_path(slot))
+    header = header.copy()
+    header["save_size"] = stat.st_size
+    header["save_mtime"] = stat.st_mtime_ns
+    header["journal_size"] = get_journal_size(slot)
+    try:
+        with open(header_path_tmp, "w", encoding="utf-8") as file:
+            json.dump(header, file)
+        os.replace(header_path_tmp, header_path)
+    except OSError as e:
+        logger.warning("Cannot write save header: %s", e)
+
+
+def load_header(slot: int) -> Optional[SaveHeader]:
+    """
+    Loads the header of a save, without loading the save.
+
+    If the header is missing or doesn't match the save file, the save is
+    loaded and its header is written again.
+
+    Parameters:
+        slot: The save slot of the save.
+
+    Returns:
+        The header describing the save, or None if there is no save.
+
+    """
+    try:
+        stat = os.stat(get_save_path(slot))
+    except OSError:
+        return None
+
+    header = read_header(slot)
+    stamp = (stat.st_size, stat.st_mtime_ns, get_journal_size(slot))
+    if (
+        header is not None
+        and (
+            header.get("save_size"),
+            header.get("save_mtime"),
+            header.get("journal_size", 0),
+        )
+        == stamp
+    ):
+        return header
+
+    save_data = load(slot)
+    if save_data is None:
+        return None
+    if "error" in save_data:
+        # stamped like the other headers, so a broken save is only loaded
+        # again once it changes
+        header = SaveHeader(
+            player_name=save_data["player_name"],
+            error=save_data["error"],
+        )
+        save_header(header, slot)
+        return header
+    return update_header(save_data, slot)
+
+
+def load_thumbnail(header: SaveHeader) -> Optional[pygame.surface.Surface]:
+    """
+    Loads the thumbnail of a save.
+
+    Parameters:
+        header: The header describing the save.
+
+    Returns:
+        The thumbnail, or None if the save has no screenshot.
+
+    """
+    if "thumbnail" not in header:
+        return None
+    data = io.BytesIO(base64.b64decode(header["thumbnail"]))
+    return pygame.image.load(data, "thumbnail.png")
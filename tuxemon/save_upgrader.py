@@ -2,7 +2,7 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
 from tuxemon import db
@@ -34,7 +34,7 @@ be loaded)
     - Amend the `upgrade_save` function as necessary
 """
 
-SAVE_VERSION = 2
+SAVE_VERSION = 3
 MAP_RENAMES: Mapping[int, Mapping[str, str]] = {
     # 0: {'before1.tmx': 'after1.tmx', 'before2.tmx': 'after2.tmx'},
 }
@@ -77,49 +77,73 @@ def upgrade_save(save_data: dict[str, Any]) -> SaveData:
     return save_data  # type: ignore[return-value]
 
 
-def _handle_change_plague(save_data: dict[str, Any]) -> None:
+def _change_plague(monster: dict[str, Any]) -> None:
     """
-    Updates monster plague field in the save data.
+    Updates the plague field of a monster.
+    """
+    if not isinstance(monster["plague"], dict):
+        if monster["plague"] == "infected":
+            monster["plague"] = {"spyderbite": db.PlagueType.infected}
+        elif monster["plague"] == "inoculated":
+            monster["plague"] = {"spyderbite": db.PlagueType.inoculated}
+        else:
+            monster["plague"] = {}
+
+
+def _update_monster_name(monster: dict[str, Any]) -> None:
+    """
+    Updates the name and slug of a monster based on MONSTER_RENAMES.
+    """
+    if monster["slug"] in MONSTER_RENAMES:
+        new_name = MONSTER_RENAMES[monster["slug"]]
+        monster["name"] = T.translate(new_name)
+        monster["slug"] = new_name
+
+
+def upgrade_monsters(monsters: Sequence[dict[str, Any]]) -> None:
+    """
+    Updates saved monsters.
+
+    The monster boxes saved as sections are updated when they are
+    decoded, instead of when the save is loaded.
+
+    Parameters:
+        monsters: The saved monsters.
+
     """
+    for monster in monsters:
+        _change_plague(monster)
+        _update_monster_name(monster)
 
-    def change_plague(monster: dict[str, Any]) -> None:
-        if not isinstance(monster["plague"], dict):
-            if monster["plague"] == "infected":
-                monster["plague"] = {"spyderbite": db.PlagueType.infected}
-            elif monster["plague"] == "inoculated":
-                monster["plague"] = {"spyderbite": db.PlagueType.inoculated}
-            else:
-                monster["plague"] = {}
 
+def _handle_change_plague(save_data: dict[str, Any]) -> None:
+    """
+    Updates monster plague field in the save data.
+    """
     # Update monsters in the save data
     for monster in save_data["monsters"]:
-        change_plague(monster)
+        _change_plague(monster)
 
     # Update monsters in the monster boxes
     for value in save_data["monster_boxes"].values():
-        for element in value:
-            change_plague(element)
+        if not isinstance(value, str):
+            for element in value:
+                _change_plague(element)
 
 
 def _handle_change_monster_name(save_data: dict[str, Any]) -> None:
     """
     Updates monster names and slugs in the save data based on the MONSTER_RENAMES dictionary.
     """
-
-    def update_monster(monster: dict[str, Any]) -> None:
-        if monster["slug"] in MONSTER_RENAMES:
-            new_name = MONSTER_RENAMES[monster["slug"]]
-            monster["name"] = T.translate(new_name)
-            monster["slug"] = new_name
-
     # Update monsters in the save data
     for monster in save_data["monsters"]:
-        update_monster(monster)
+        _update_monster_name(monster)
 
     # Update monsters in the monster boxes
     for value in save_data["monster_boxes"].values():
-        for element in value:
-            update_monster(element)
+        if not isinstance(value, str):
+            for element in value:
+                _update_monster_name(element)
 
     # Update monster names in the tuxepedia
     save_data["tuxepedia"] = {
@@ -0,0 +1,541 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+
+Battles between AI controlled trainers, without the combat state.
+
+The battles use the same techniques, conditions, formulas and AI as
+:class:`tuxemon.states.combat.combat.CombatState`, but there are no
+animations, menus or dialogs, so no window nor running client is needed.
+This allows to run many battles quickly, e.g. to check the balance of
+the monsters.
+
+Effects that need the game world (such as the "money" effect) can't be
+used in a simulated battle; the battle fails with an error.
+
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import random
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from tuxemon import formula, prepare
+from tuxemon.ai import AI
+from tuxemon.combat import (
+    alive_party,
+    defeated,
+    fainted,
+    get_awake_monsters,
+)
+from tuxemon.condition.condition import Condition
+from tuxemon.db import db
+from tuxemon.item.item import Item
+from tuxemon.monster import Monster
+from tuxemon.states.combat.combat_classes import (
+    ActionQueue,
+    DamageReport,
+    EnqueuedAction,
+)
+from tuxemon.technique.technique import Technique
+
+if TYPE_CHECKING:
+    from tuxemon.npc import NPC
+
+logger = logging.getLogger(__name__)
+
+# battles still running after this number of turns are a draw
+MAX_TURNS = 100
+
+
+class SimulatedTrainer:
+    """
+    Character taking part in a simulated battle.
+
+    Has only the attributes of :class:`tuxemon.npc.NPC` used in combat.
+
+    Parameters:
+        name: Name of the trainer.
+        monsters: Party of the trainer.
+
+    """
+
+    isplayer = False
+
+    def __init__(self, name: str, monsters: Sequence[Monster] = ()) -> None:
+        self.name = name
+        self.slug = name
+        self.monsters: list[Monster] = []
+        self.items: list[Item] = []
+        self.game_variables: dict[str, Any] = {}
+        self.max_position = 1
+        self.steps = 0.0
+        for monster in monsters:
+            self.add_monster(monster)
+
+    def add_monster(self, monster: Monster) -> None:
+        """
+        Add a monster to the party of the trainer.
+
+        Parameters:
+            monster: Monster to add.
+
+        """
+        monster.owner = self  # type: ignore[assignment]
+        self.monsters.append(monster)
+
+
+class BattleResult(NamedTuple):
+    winner: Optional[int]
+    turns: int
+    error: Optional[str] = None
+
+
+class BattleSimulator:
+    """
+    Run a battle between two AI controlled trainers.
+
+    Provides the attributes and methods of the combat state that are used
+    by the AI, the techniques and the conditions.
+
+    Parameters:
+        players: Trainers taking part in the battle.
+        combat_type: Type of battle, "monster" or "trainer".
+        max_turns: Turns after which the battle is a draw.
+
+    """
+
+    def __init__(
+        self,
+        players: tuple[SimulatedTrainer, SimulatedTrainer],
+        combat_type: str = "trainer",
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        self.players = list(players)
+        self.is_trainer_battle = combat_type == "trainer"
+        self.max_turns = max_turns
+        self.monsters_in_play: defaultdict[
+            SimulatedTrainer, list[Monster]
+        ] = defaultdict(list)
+        self._action_queue = ActionQueue()
+        self._pending_queue: list[EnqueuedAction] = []
+        self._damage_map: list[DamageReport] = []
+        self._random_tech_hit: dict[Monster, float] = {}
+        self._monster_sprite_map: dict[Monster, Any] = {}
+        self._turn = 0
+        self._run = False
+        self._new_tuxepedia = False
+
+    @property
+    def active_players(self) -> Iterator[SimulatedTrainer]:
+        for player in self.players:
+            if not defeated(player):  # type: ignore[arg-type]
+                yield player
+
+    @property
+    def human_players(self) -> Iterator[SimulatedTrainer]:
+        yield from ()
+
+    @property
+    def ai_players(self) -> Iterator[SimulatedTrainer]:
+        yield from self.active_players
+
+    @property
+    def active_monsters(self) -> Sequence[Monster]:
+        return list(chain.from_iterable(self.monsters_in_play.values()))
+
+    @property
+    def monsters_in_play_right(self) -> Sequence[Monster]:
+        return self.monsters_in_play[self.players[0]]
+
+    @property
+    def monsters_in_play_left(self) -> Sequence[Monster]:
+        return self.monsters_in_play[self.players[1]]
+
+    @property
+    def defeated_players(self) -> Sequence[SimulatedTrainer]:
+        return [p for p in self.players if defeated(p)]  # type: ignore[arg-type]
+
+    @property
+    def remaining_players(self) -> Sequence[SimulatedTrainer]:
+        return [p for p in self.players if not defeated(p)]  # type: ignore[arg-type]
+
+    def run(self) -> BattleResult:
+        """
+        Run the battle until a trainer wins or the turns run out.
+
+        Returns:
+            Index of the winner in the players, if any, and number of turns.
+
+        """
+        players = list(self.players)
+        while self._turn < self.max_turns:
+            self._turn += 1
+            self.fill_battlefield_positions()
+            self.decide_actions()
+            self._action_queue.sort()
+            self.handle_action_queue()
+            self.apply_conditions()
+            self.handle_action_queue()
+
+            remaining = self.remaining_players
+            if self._run or len(remaining) != len(players):
+                break
+
+        self.clean_combat()
+        remaining = [p for p in players if not defeated(p)]  # type: ignore[arg-type]
+        winner = players.index(remaining[0]) if len(remaining) == 1 else None
+        return BattleResult(winner, self._turn)
+
+    def fill_battlefield_positions(self) -> None:
+        """Send out monsters to fill the empty battlefield positions."""
+        for player in list(self.active_players):
+            if len(alive_party(player)) == 1:  # type: ignore[arg-type]
+                player.max_position = 1
+            positions_available = player.max_position - len(
+                self.monsters_in_play[player]
+            )
+            if positions_available:
+                available = get_awake_monsters(
+                    player,  # type: ignore[arg-type]
+                    self.monsters_in_play[player],
+                    self._turn,
+                )
+                for _ in range(positions_available):
+                    self.add_monster_into_play(player, next(available))
+
+    def decide_actions(self) -> None:
+        """Let the AI choose the action of each monster in play."""
+        for player in list(self.ai_players):
+            for monster in self.monsters_in_play[player]:
+                self._random_tech_hit[monster] = random.random()
+                for tech in monster.moves:
+                    tech.recharge()
+                AI(self, monster, player)  # type: ignore[arg-type]
+
+    def apply_conditions(self) -> None:
+        """Queue the pending actions and the conditions of the monsters."""
+        self._pending_queue = [
+            pend
+            for pend in self._pending_queue
+            if pend.user
+            and isinstance(pend.user, Monster)
+            and not (fainted(pend.user) or fainted(pend.target))
+        ]
+        for monster in self.active_monsters:
+            while self._pending_queue:
+                pend = self._pending_queue.pop(0)
+                self.enqueue_action(pend.user, pend.method, pend.target)  # type: ignore[arg-type]
+
+            for condition in monster.status:
+                if condition.validate(monster):
+                    condition.combat_state = self  # type: ignore[assignment]
+                    condition.nr_turn += 1
+                    self.enqueue_action(None, condition, monster)
+                monster.set_stats()
+
+    def handle_action_queue(self) -> None:
+        """Perform the queued actions, checking the monsters after each."""
+        while not self._action_queue.is_empty():
+            action = self._action_queue.pop()
+            self.perform_action(*action)  # type: ignore[arg-type]
+            self.check_party_hp()
+
+    def add_monster_into_play(
+        self,
+        player: SimulatedTrainer,
+        monster: Monster,
+        removed: Optional[Monster] = None,
+    ) -> None:
+        self.monsters_in_play[player].append(monster)
+
+        for mon in self.active_monsters:
+            mon.status = [sta for sta in mon.status if not sta.bond]
+
+        if removed is not None and removed.status:
+            removed.status[0].combat_state = self  # type: ignore[assignment]
+            removed.status[0].phase = "add_monster_into_play"
+            removed.status[0].use(removed)
+
+    def remove_monster_from_play(self, monster: Monster) -> None:
+        self.remove_monster_actions_from_queue(monster)
+        for monsters in self.monsters_in_play.values():
+            if monster in monsters:
+                monsters.remove(monster)
+
+    def remove_monster_actions_from_queue(self, monster: Monster) -> None:
+        action_queue = self._action_queue.queue
+        action_queue[:] = [
+            action
+            for action in action_queue
+            if action.user is not monster and action.target is not monster
+        ]
+
+    def enqueue_action(
+        self,
+        user: Union[SimulatedTrainer, Monster, None],
+        technique: Union[Item, Technique, Condition, None],
+        target: Monster,
+    ) -> None:
+        action = EnqueuedAction(user, technique, target)  # type: ignore[arg-type]
+        self._action_queue.enqueue(action, self._turn)
+
+    def enqueue_damage(
+        self, attacker: Monster, defender: Monster, damage: int
+    ) -> None:
+        self._damage_map.append(DamageReport(attacker, defender, damage))
+
+    def task(self, func: Any, *args: Any, **kwargs: Any) -> None:
+        """Run a delayed callback of an effect right away."""
+        func()
+
+    def reset_status_icons(self) -> None:
+        pass
+
+    def perform_action(
+        self,
+        user: Union[Monster, SimulatedTrainer, None],
+        method: Union[Technique, Item, Condition, None],
+        target: Monster,
+    ) -> None:
+        """
+        Perform the action, as the combat state does but without messages.
+
+        Parameters:
+            user: Monster or trainer that does the action.
+            method: Technique or item or condition used.
+            target: Monster that receives the action.
+
+        """
+        if isinstance(method, Technique) and isinstance(user, Monster):
+            method.advance_round()
+            method.combat_state = self  # type: ignore[assignment]
+            result = method.use(user, target)
+            if user.status:
+                user.status[0].combat_state = self  # type: ignore[assignment]
+                user.status[0].phase = "perform_action_tech"
+                result_status = user.status[0].use(user)
+                if result_status["condition"]:
+                    user.apply_status(result_status["condition"])
+            if result["should_tackle"]:
+                self.enqueue_damage(user, target, result["damage"])
+        elif isinstance(method, Item) and isinstance(user, SimulatedTrainer):
+            method.combat_state = self  # type: ignore[assignment]
+            method.use(user, target)  # type: ignore[arg-type]
+        elif isinstance(method, Condition):
+            method.combat_state = self  # type: ignore[assignment]
+            method.phase = "perform_action_status"
+            method.advance_round()
+            method.use(target)
+
+    def check_party_hp(self) -> None:
+        """Apply the status effects and remove the fainted monsters."""
+        for monsters in list(self.monsters_in_play.values()):
+            for monster in list(monsters):
+                if monster.status:
+                    monster.status[0].combat_state = self  # type: ignore[assignment]
+                    monster.status[0].phase = "check_party_hp"
+                    monster.status[0].use(monster)
+                if fainted(monster):
+                    self.remove_monster_actions_from_queue(monster)
+                    monster.faint()
+                    self._damage_map = [
+                        element
+                        for element in self._damage_map
+                        if element.defense != monster
+                        and element.attack != monster
+                    ]
+                    monsters.remove(monster)
+
+    def clean_combat(self) -> None:
+        for player in self.players:
+            player.max_position = 1
+            for mon in player.monsters:
+                mon.set_stats()
+                mon.end_combat()
+                mon.reset_types()
+                for tech in mon.moves:
+                    tech.set_stats()
+
+        self._action_queue.clear_queue()
+        self._action_queue.clear_history()
+        self._pending_queue = []
+        self._damage_map = []
+
+
+def create_monster(slug: str, level: int) -> Monster:
+    """
+    Create a monster, as the "add_monster" action does.
+
+    Parameters:
+        slug: Slug of the monster.
+        level: Level of the monster.
+
+    Returns:
+        The monster, with full health.
+
+    """
+    monster = Monster()
+    monster.load_from_db(slug)
+    monster.set_level(level)
+    monster.set_moves(level)
+    monster.set_capture(formula.today_ordinal())
+    monster.current_hp = monster.hp
+    return monster
+
+
+def simulate_battle(
+    party0: Sequence[str],
+    party1: Sequence[str],
+    level: int = 20,
+    seed: Optional[int] = None,
+    max_turns: int = MAX_TURNS,
+) -> BattleResult:
+    """
+    Simulate a battle between two trainers.
+
+    The global random generator is seeded before the monsters are created,
+    so a battle with the same parameters and seed has the same result.
+
+    Parameters:
+        party0: Slugs of the monsters of the first trainer.
+        party1: Slugs of the monsters of the second trainer.
+        level: Level of all the monsters.
+        seed: Seed of the battle.
+        max_turns: Turns after which the battle is a draw.
+
+    Returns:
+        The result of the battle.
+
+    """
+    random.seed(seed)
+    players = (
+        SimulatedTrainer(
+            "trainer0", [create_monster(s, level) for s in party0]
+        ),
+        SimulatedTrainer(
+            "trainer1", [create_monster(s, level) for s in party1]
+        ),
+    )
+    return BattleSimulator(players, max_turns=max_turns).run()
+
+
+@dataclass
+class MatchupStats:
+    """Results of the battles between two parties."""
+
+    wins: list[int] = field(default_factory=lambda: [0, 0])
+    draws: int = 0
+    errors: int = 0
+    turns: int = 0
+
+    @property
+    def battles(self) -> int:
+        return sum(self.wins) + self.draws + self.errors
+
+    @property
+    def win_rate(self) -> float:
+        """Rate of the battles won by the first party."""
+        finished = self.battles - self.errors
+        return self.wins[0] / finished if finished else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        finished = self.battles - self.errors
+        return self.turns / finished if finished else 0.0
+
+    def add(self, result: BattleResult) -> None:
+        if result.error is not None:
+            self.errors += 1
+            return
+        if result.winner is None:
+            self.draws += 1
+        else:
+            self.wins[result.winner] += 1
+        self.turns += result.turns
+
+
+Matchup = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _load_database() -> None:
+    # done once before starting the workers, refreshing the snapshot
+    if not db.database["monster"]:
+        db.load(snapshot=prepare.CONFIG.db_snapshot)
+
+
+def _init_worker() -> None:
+    # forked workers inherit the database, spawned workers read the
+    # snapshot refreshed by the parent without writing it again
+    if not db.database["monster"]:
+        snapshot = prepare.CONFIG.db_snapshot
+        if not (snapshot and db.load_snapshot(db.snapshot_key())):
+            db.load()
+
+
+def _run_battle(
+    job: tuple[Matchup, int, int, int]
+) -> tuple[Matchup, BattleResult]:
+    matchup, level, seed, max_turns = job
+    try:
+        result = simulate_battle(*matchup, level, seed, max_turns)
+    except Exception as e:
+        logger.debug(f"Battle {matchup} with seed {seed} failed: {e!r}")
+        result = BattleResult(None, 0, repr(e))
+    return matchup, result
+
+
+def simulate_battles(
+    matchups: Iterable[tuple[Sequence[str], Sequence[str]]],
+    battles: int = 10,
+    level: int = 20,
+    seed: int = 0,
+    processes: Optional[int] = None,
+    max_turns: int = MAX_TURNS,
+) -> dict[Matchup, MatchupStats]:
+    """
+    Simulate many battles, in parallel.
+
+    Each battle gets its own seed, derived from ``seed``, so the results
+    don't depend on the number of processes.
+
+    Parameters:
+        matchups: Pairs of parties, as slugs of monsters.
+        battles: Number of battles for each pair of parties.
+        level: Level of all the monsters.
+        seed: Seed of the first battle.
+        processes: Number of worker processes. Defaults to the number of
+            CPUs. If 1, the battles run in this process.
+        max_turns: Turns after which a battle is a draw.
+
+    Returns:
+        Results of the battles of each pair of parties.
+
+    """
+    jobs = []
+    for matchup in matchups:
+        key = (tuple(matchup[0]), tuple(matchup[1]))
+        for _ in range(battles):
+            jobs.append((key, level, seed, max_turns))
+            seed += 1
+
+    stats: dict[Matchup, MatchupStats] = defaultdict(MatchupStats)
+    _load_database()
+    if processes == 1:
+        results: Iterable[tuple[Matchup, BattleResult]] = map(
+            _run_battle, jobs
+        )
+        for key, result in results:
+            stats[key].add(result)
+    else:
+        with multiprocessing.Pool(processes, _init_worker) as pool:
+            results = pool.imap_unordered(_run_battle, jobs, chunksize=16)
+            for key, result in results:
+                stats[key].add(result)
+    return dict(stats)
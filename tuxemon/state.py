@@ -47,6 +47,7 @@ class State:
     rect = Rect((0, 0), prepare.SCREEN_SIZE)
     transparent = False  # ignore all background/borders
     force_draw = False  # draw even if completely under another state
+    static = False  # draws the same image every frame
 
     def __init__(self) -> None:
         """
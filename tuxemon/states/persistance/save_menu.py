@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 import os
-from base64 import b64decode
 from typing import Optional
 
 import pygame
@@ -70,20 +69,12 @@ class SaveMenuState(PopUpMenu[None]):
     ) -> pygame.surface.Surface:
         slot_image = pygame.Surface(rect.size, pygame.SRCALPHA)
 
-        # Try and load the save game and draw details about the save
-        save_data = save.load(slot_num)
+        # Try and load the save header and draw details about the save
+        save_data = save.load_header(slot_num)
         assert save_data
-        if "screenshot" in save_data:
-            screenshot = b64decode(save_data["screenshot"])
-            size = (
-                save_data["screenshot_width"],
-                save_data["screenshot_height"],
-            )
-            thumb_image = pygame.image.frombuffer(
-                screenshot,
-                size,
-                "RGB",
-            ).convert()
+        thumbnail = save.load_thumbnail(save_data)
+        if thumbnail:
+            thumb_image = thumbnail.convert()
             thumb_rect = thumb_image.get_rect().fit(rect)
             thumb_image = pygame.transform.smoothscale(
                 thumb_image,
@@ -161,7 +152,7 @@ class SaveMenuState(PopUpMenu[None]):
             var_menu.append(("keep", _keep, negative_answer))
             tools.open_choice_dialog(local_session, var_menu, True)
 
-        save_data = save.load(self.selected_index + 1)
+        save_data = save.load_header(self.selected_index + 1)
         if save_data:
             ask_confirmation()
         else:
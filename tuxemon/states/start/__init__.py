@@ -39,6 +39,8 @@ class BackgroundState(State):
     Eventually the need for this will be phased out.
     """
 
+    static = True
+
     def draw(self, surface: pygame.surface.Surface) -> None:
         surface.fill(prepare.BLACK_COLOR)
 
@@ -2,6 +2,22 @@
 # Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+import heapq
+import itertools
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from typing import TYPE_CHECKING, Any, Optional
+
+from tuxemon.map import RegionProperties
+
+if TYPE_CHECKING:
+    from tuxemon.entity import Entity
+
 
 class BoundaryChecker:
     """
@@ -61,3 +77,294 @@ class BoundaryChecker:
 
     def __repr__(self) -> str:
         return f"BoundaryChecker(invalid_x={self.invalid_x}, invalid_y={self.invalid_y})"
+
+
+class NavigationGrid(Mapping[tuple[int, int], Optional[RegionProperties]]):
+    """
+    Collision view of the current map, used for movement and pathfinding.
+
+    The grid layers three sources, from lowest to highest priority: the
+    tiles occupied by entities, the tiles whose surface can't be walked
+    (moverate 0) and the regions of the map collision map. Each source is
+    updated in place when it changes (see :meth:`set_region`,
+    :meth:`update_terrain` and :meth:`move_entity`), so a lookup never
+    rebuilds the whole map.
+
+    Attributes:
+        collision_map: The collision map of the current map.
+        terrain: The tiles blocked by their surface.
+        occupants: The entities standing on each tile.
+        zones: The tiles of the collision map, grouped by key.
+        version: Counter increased each time the collision map or the
+            terrain changes.
+    """
+
+    def __init__(self) -> None:
+        self.collision_map: MutableMapping[
+            tuple[int, int], Optional[RegionProperties]
+        ] = {}
+        self.terrain: dict[tuple[int, int], RegionProperties] = {}
+        self.occupants: dict[tuple[int, int], list[Entity[Any]]] = {}
+        self.zones: dict[str, dict[tuple[int, int], None]] = {}
+        self._positions: dict[Entity[Any], tuple[int, int]] = {}
+        self._entity_regions: dict[Entity[Any], RegionProperties] = {}
+        self.version = 0
+
+    def load(
+        self,
+        collision_map: MutableMapping[
+            tuple[int, int], Optional[RegionProperties]
+        ],
+        surface_map: Mapping[tuple[int, int], Mapping[str, float]],
+    ) -> None:
+        """
+        Prepares the grid for a new map.
+
+        Parameters:
+            collision_map: The collision map of the map.
+            surface_map: The surface map of the map.
+        """
+        self.collision_map = collision_map
+        self.zones = {}
+        for coords, region in collision_map.items():
+            self._add_to_zone(coords, region)
+        self.terrain = {}
+        for coords, surface in surface_map.items():
+            self.update_terrain(coords, surface)
+        self.clear_entities()
+        self.version += 1
+
+    def set_region(
+        self, coords: tuple[int, int], region: Optional[RegionProperties]
+    ) -> None:
+        """
+        Sets the collision map entry of a tile.
+
+        Parameters:
+            coords: The coordinates of the tile.
+            region: The region properties, ``None`` for a blocked tile.
+        """
+        self.remove_region(coords)
+        self.collision_map[coords] = region
+        self._add_to_zone(coords, region)
+        self.version += 1
+
+    def remove_region(self, coords: tuple[int, int]) -> None:
+        """
+        Removes the collision map entry of a tile, if any.
+
+        Parameters:
+            coords: The coordinates of the tile.
+        """
+        if coords not in self.collision_map:
+            return
+        region = self.collision_map.pop(coords)
+        self.version += 1
+        if region and region.key is not None:
+            zone = self.zones.get(region.key)
+            if zone is not None:
+                zone.pop(coords, None)
+                if not zone:
+                    del self.zones[region.key]
+
+    def get_zone(self, label: str) -> list[tuple[int, int]]:
+        """
+        Returns the tiles of the collision map with a specific key.
+
+        Parameters:
+            label: The key of the regions.
+
+        Returns:
+            The coordinates of the tiles.
+        """
+        return list(self.zones.get(label, ()))
+
+    def _add_to_zone(
+        self, coords: tuple[int, int], region: Optional[RegionProperties]
+    ) -> None:
+        if region and region.key is not None:
+            self.zones.setdefault(region.key, {})[coords] = None
+
+    def update_terrain(
+        self, coords: tuple[int, int], surface: Mapping[str, float]
+    ) -> None:
+        """
+        Updates the terrain of a tile after its surface changed.
+
+        Parameters:
+            coords: The coordinates of the tile.
+            surface: The surface properties of the tile.
+        """
+        label = None
+        for key, value in surface.items():
+            if float(value) == 0:
+                label = key
+        if label is None:
+            self.terrain.pop(coords, None)
+        else:
+            self.terrain[coords] = RegionProperties([], [], [], None, label)
+        self.version += 1
+
+    def add_entity(self, entity: Entity[Any], coords: tuple[int, int]) -> None:
+        """
+        Starts tracking the position of an entity.
+
+        Parameters:
+            entity: The entity to track.
+            coords: The tile where the entity stands.
+        """
+        self.remove_entity(entity)
+        self._positions[entity] = coords
+        self._entity_regions[entity] = RegionProperties(
+            [], [], [], entity, None
+        )
+        self.occupants.setdefault(coords, []).append(entity)
+
+    def move_entity(
+        self, entity: Entity[Any], coords: tuple[int, int]
+    ) -> None:
+        """
+        Updates the position of a tracked entity.
+
+        Entities which aren't tracked by the grid are ignored.
+
+        Parameters:
+            entity: The entity that moved.
+            coords: The tile where the entity stands now.
+        """
+        old_coords = self._positions.get(entity)
+        if old_coords is None or old_coords == coords:
+            return
+        self._discard_occupant(entity, old_coords)
+        self._positions[entity] = coords
+        self.occupants.setdefault(coords, []).append(entity)
+
+    def get_occupant(self, coords: tuple[int, int]) -> Optional[Entity[Any]]:
+        """
+        Returns the entity standing on a tile.
+
+        If several entities share the tile, the first one to get there is
+        returned.
+
+        Parameters:
+            coords: The coordinates of the tile.
+
+        Returns:
+            The entity, if there is one. ``None`` otherwise.
+        """
+        entities = self.occupants.get(coords)
+        return entities[0] if entities else None
+
+    def remove_entity(self, entity: Entity[Any]) -> None:
+        """
+        Stops tracking the position of an entity.
+
+        Parameters:
+            entity: The entity to forget.
+        """
+        coords = self._positions.pop(entity, None)
+        if coords is not None:
+            self._discard_occupant(entity, coords)
+            del self._entity_regions[entity]
+
+    def clear_entities(self) -> None:
+        """Stops tracking all the entities."""
+        self.occupants = {}
+        self._positions = {}
+        self._entity_regions = {}
+
+    def _discard_occupant(
+        self, entity: Entity[Any], coords: tuple[int, int]
+    ) -> None:
+        entities = self.occupants[coords]
+        entities.remove(entity)
+        if not entities:
+            del self.occupants[coords]
+
+    def __getitem__(
+        self, coords: tuple[int, int]
+    ) -> Optional[RegionProperties]:
+        try:
+            return self.collision_map[coords]
+        except KeyError:
+            pass
+        terrain = self.terrain.get(coords)
+        if terrain is not None:
+            return terrain
+        entities = self.occupants.get(coords)
+        if entities:
+            return self._entity_regions[entities[-1]]
+        raise KeyError(coords)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        yield from self.collision_map
+        for coords in self.terrain:
+            if coords not in self.collision_map:
+                yield coords
+        for coords in self.occupants:
+            if coords not in self.collision_map and coords not in self.terrain:
+                yield coords
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def manhattan_distance(tile0: tuple[int, int], tile1: tuple[int, int]) -> int:
+    """
+    Returns the Manhattan distance between two tiles.
+
+    Parameters:
+        tile0: The first tile.
+        tile1: The second tile.
+
+    Returns:
+        The number of orthogonal steps between the tiles.
+    """
+    return abs(tile0[0] - tile1[0]) + abs(tile0[1] - tile1[1])
+
+
+def astar(
+    start: tuple[int, int],
+    dest: tuple[int, int],
+    get_exits: Callable[[tuple[int, int]], Iterable[tuple[int, int]]],
+) -> Optional[list[tuple[int, int]]]:
+    """
+    A* search over the tiles of a map.
+
+    Every step costs the same, so the Manhattan distance is an admissible
+    and consistent heuristic and the path found is a shortest one.
+
+    Parameters:
+        start: Initial tile position.
+        dest: Target tile position.
+        get_exits: Returns the tiles that can be reached from a tile.
+
+    Returns:
+        The tiles of the path from the destination back to the first step
+        (the start is excluded), if a path exists. ``None`` otherwise.
+    """
+    counter = itertools.count()
+    queue = [(manhattan_distance(start, dest), next(counter), start)]
+    came_from: dict[tuple[int, int], tuple[int, int]] = {}
+    costs = {start: 0}
+    closed: set[tuple[int, int]] = set()
+    while queue:
+        _, _, node = heapq.heappop(queue)
+        if node == dest:
+            path = []
+            while node != start:
+                path.append(node)
+                node = came_from[node]
+            return path
+        if node in closed:
+            continue
+        closed.add(node)
+        cost = costs[node] + 1
+        for adj_pos in get_exits(node):
+            if adj_pos in closed or cost >= costs.get(adj_pos, cost + 1):
+                continue
+            costs[adj_pos] = cost
+            came_from[adj_pos] = node
+            priority = cost + manhattan_distance(adj_pos, dest)
+            heapq.heappush(queue, (priority, next(counter), adj_pos))
+    return None
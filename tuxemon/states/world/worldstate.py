@@ -4,19 +4,17 @@ from __future__ import annotations
 
 import itertools
 import logging
-import os
 import uuid
-from collections import defaultdict
 from collections.abc import Mapping, MutableMapping, Sequence
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
-    DefaultDict,
     NamedTuple,
     Optional,
     TypedDict,
     Union,
+    cast,
     no_type_check,
 )
 
@@ -25,11 +23,10 @@ from pygame.rect import Rect
 
 from tuxemon import networking, prepare, state
 from tuxemon.camera import Camera, project
-from tuxemon.db import Direction
+from tuxemon.db import Direction, SurfaceKeys
 from tuxemon.entity import Entity
 from tuxemon.graphics import ColorLike
 from tuxemon.map import (
-    PathfindNode,
     RegionProperties,
     TuxemonMap,
     dirs2,
@@ -37,12 +34,16 @@ from tuxemon.map import (
     pairs,
     proj,
 )
-from tuxemon.map_loader import TMXMapLoader, YAMLEventLoader
+from tuxemon.map_loader import MapPreloader, linked_maps, load_map
 from tuxemon.math import Vector2
 from tuxemon.platform.const import buttons, events, intentions
 from tuxemon.platform.events import PlayerInput
 from tuxemon.session import local_session
-from tuxemon.states.world.world_classes import BoundaryChecker
+from tuxemon.states.world.world_classes import (
+    BoundaryChecker,
+    NavigationGrid,
+    astar,
+)
 from tuxemon.states.world.world_menus import WorldMenuState
 from tuxemon.surfanim import SurfaceAnimation
 from tuxemon.teleporter import Teleporter
@@ -124,7 +125,9 @@ class WorldState(state.State):
         from tuxemon.player import Player
 
         self.boundary_checker = BoundaryChecker()
+        self.navigation = NavigationGrid()
         self.teleporter = Teleporter()
+        self.preloader = MapPreloader(prepare.CONFIG.preload_maps)
         # Provide access to the screen surface
         self.screen = self.client.screen
         self.screen_rect = self.screen.get_rect()
@@ -133,6 +136,8 @@ class WorldState(state.State):
         # default variables for layer
         self.layer = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         self.layer_color: ColorLike = prepare.TRANSPARENT_COLOR
+        # color the layer is currently filled with
+        self.layer_fill: Optional[pygame.Color] = None
 
         #####################################################################
         #                           Player Details                           #
@@ -140,6 +145,7 @@ class WorldState(state.State):
 
         self.npcs: list[NPC] = []
         self.npcs_off_map: list[NPC] = []
+        self.npcs_by_slug: dict[str, NPC] = {}
         self.wants_to_move_char: dict[str, Direction] = {}
         self.allow_char_movement: list[str] = []
 
@@ -189,6 +195,10 @@ class WorldState(state.State):
         self.lock_controls(self.player)
         self.stop_char(self.player)
 
+    def shutdown(self) -> None:
+        """Called when the state is removed from the stack"""
+        self.preloader.clear()
+
     def fade_and_teleport(self, duration: float, color: ColorLike) -> None:
         """
         Fade out, teleport, fade in.
@@ -419,6 +429,7 @@ class WorldState(state.State):
                 return None
 
             if event.pressed and event.button == intentions.RELOAD_MAP:
+                prepare.refresh_asset_index()
                 self.current_map.reload_tiles()
                 return None
 
@@ -539,7 +550,12 @@ class WorldState(state.State):
                 screen_surfaces.append(bubble)
 
     def set_layer(self, surface: pygame.surface.Surface) -> None:
-        self.layer.fill(self.layer_color)
+        color = pygame.Color(self.layer_color)
+        if color.a == 0:
+            return
+        if color != self.layer_fill:
+            self.layer.fill(color)
+            self.layer_fill = color
         surface.blit(self.layer, (0, 0))
 
     def map_drawing(self, surface: pygame.surface.Surface) -> None:
@@ -549,7 +565,7 @@ class WorldState(state.State):
             self.current_map.initialize_renderer()
 
         # Get player coordinates to center map
-        cx, cy = self.camera.position
+        cx, cy = self.camera.get_draw_position(self.client.frame_lag)
         assert self.current_map.renderer
         self.current_map.renderer.center((cx, cy))
 
@@ -611,7 +627,9 @@ class WorldState(state.State):
         moving = "walking" if npc.moving else "idle"
         state = animation_mapping[moving][npc.facing]
         world = WorldSurfaces(
-            get_frame(frame_dict, state), proj(npc.position3), layer
+            get_frame(frame_dict, state),
+            npc.get_draw_position(self.client.frame_lag),
+            layer,
         )
         return [world]
 
@@ -649,6 +667,8 @@ class WorldState(state.State):
         # Maybe in the future the world should have a dict of entities instead?
         if isinstance(entity, NPC):
             self.npcs.append(entity)
+            self.npcs_by_slug.setdefault(entity.slug, entity)
+            self.navigation.add_entity(entity, entity.tile_pos)
 
     def get_entity(self, slug: str) -> Optional[NPC]:
         """
@@ -658,7 +678,7 @@ class WorldState(state.State):
             slug: The entity slug.
 
         """
-        return next((npc for npc in self.npcs if npc.slug == slug), None)
+        return self.npcs_by_slug.get(slug)
 
     def get_entity_by_iid(self, iid: uuid.UUID) -> Optional[NPC]:
         """
@@ -678,7 +698,7 @@ class WorldState(state.State):
             pos: The entity position.
 
         """
-        return next((npc for npc in self.npcs if npc.tile_pos == pos), None)
+        return cast(Optional["NPC"], self.navigation.get_occupant(pos))
 
     def remove_entity(self, slug: str) -> None:
         """
@@ -691,7 +711,25 @@ class WorldState(state.State):
         npc = self.get_entity(slug)
         if npc:
             npc.remove_collision()
-            self.npcs.remove(npc)
+            self.remove_npc(npc)
+
+    def remove_npc(self, npc: NPC) -> None:
+        """
+        Remove an NPC from the list of entities of the world.
+
+        Unlike :meth:`remove_entity`, the collision of the NPC is kept.
+
+        Parameters:
+            npc: The NPC to remove.
+
+        """
+        self.npcs.remove(npc)
+        self.navigation.remove_entity(npc)
+        if self.npcs_by_slug.get(npc.slug) is npc:
+            del self.npcs_by_slug[npc.slug]
+            other = next((n for n in self.npcs if n.slug == npc.slug), None)
+            if other:
+                self.npcs_by_slug[npc.slug] = other
 
     def get_all_entities(self) -> Sequence[NPC]:
         """
@@ -791,75 +829,48 @@ class WorldState(state.State):
             A list of coordinates of collision zones with the specific label.
 
         """
+        if collision_map is self.navigation.collision_map:
+            return self.navigation.get_zone(label)
         return [
             coords
             for coords, props in collision_map.items()
             if props and props.key == label
         ]
 
-    def get_collision_map(self) -> CollisionMap:
+    def tile_has_label(self, coords: tuple[int, int], label: str) -> bool:
         """
-        Return dictionary for collision testing.
+        Checks whether a tile has a surface property or a collision zone.
 
-        Returns a dictionary where keys are (x, y) tile tuples
-        and the values are tiles or NPCs.
+        Same as looking for the tile in :meth:`get_all_tile_properties`
+        (surface keys) or :meth:`check_collision_zones` (anything else),
+        without going through the whole map.
 
-        # NOTE:
-        This will not respect map changes to collisions
-        after the map has been loaded!
+        Parameters:
+            coords: The coordinates of the tile.
+            label: The surface key or the collision zone label.
 
         Returns:
-            A dictionary of collision tiles.
+            Whether the tile has the label.
 
         """
-        collision_dict: DefaultDict[
-            tuple[int, int], Optional[RegionProperties]
-        ] = defaultdict(lambda: RegionProperties([], [], [], None, None))
-
-        # Get all the NPCs' tile positions
-        for npc in self.get_all_entities():
-            collision_dict[npc.tile_pos] = self._get_region_properties(
-                npc.tile_pos, npc
-            )
+        if label in SurfaceKeys:
+            return label in self.surface_map.get(coords, {})
+        region = self.collision_map.get(coords)
+        return region is not None and region.key == label
 
-        # Add surface map entries to the collision dictionary
-        for coords, surface in self.surface_map.items():
-            for label, value in surface.items():
-                if float(value) == 0:
-                    collision_dict[coords] = self._get_region_properties(
-                        coords, label
-                    )
+    def get_collision_map(self) -> CollisionMap:
+        """
+        Return mapping for collision testing.
 
-        collision_dict.update({k: v for k, v in self.collision_map.items()})
+        Returns a mapping where keys are (x, y) tile tuples
+        and the values are tiles or NPCs. The mapping is a live view
+        kept up to date as the map and the entities change.
 
-        return dict(collision_dict)
+        Returns:
+            A mapping of collision tiles.
 
-    def _get_region_properties(
-        self, coords: tuple[int, int], entity_or_label: Union[NPC, str]
-    ) -> RegionProperties:
-        region = self.collision_map.get(coords)
-        if region:
-            if isinstance(entity_or_label, str):
-                return RegionProperties(
-                    region.enter_from,
-                    region.exit_from,
-                    region.endure,
-                    None,
-                    entity_or_label,
-                )
-            else:
-                return RegionProperties(
-                    region.enter_from,
-                    region.exit_from,
-                    region.endure,
-                    entity_or_label,
-                    region.key,
-                )
-        else:
-            if isinstance(entity_or_label, str):
-                return RegionProperties([], [], [], None, entity_or_label)
-            else:
-                return RegionProperties([], [], [], entity_or_label, None)
+        """
+        return self.navigation
 
     def pathfind(
         self,
@@ -878,16 +889,14 @@ class WorldState(state.State):
             ``None`` otherwise.
 
         """
-        pathnode = self.pathfind_r(dest, [PathfindNode(start)], set())
-
-        if pathnode:
-            # traverse the node to get the path
-            path = []
-            while pathnode:
-                path.append(pathnode.get_value())
-                pathnode = pathnode.get_parent()
+        path = astar(
+            start,
+            dest,
+            partial(self.get_exits, collision_map=self.navigation),
+        )
 
-            return path[:-1]
+        if path is not None:
+            return path
 
         else:
             character = self.get_entity_pos(start)
@@ -900,44 +909,6 @@ class WorldState(state.State):
 
             return None
 
-    def pathfind_r(
-        self,
-        dest: tuple[int, int],
-        queue: list[PathfindNode],
-        known_nodes: set[tuple[int, int]],
-    ) -> Optional[PathfindNode]:
-        """
-        Breadth first search algorithm.
-
-        Parameters:
-            dest: Target tile position.
-            queue: Queue of nodes to explore.
-            known_nodes: Already explored nodes.
-
-        Returns:
-            A node with the path if it exist. ``None`` otherwise.
-
-        """
-        # The collisions shouldn't have changed whilst we were calculating,
-        # so it saves time to reuse the map.
-        collision_map = self.get_collision_map()
-        known_nodes.add(queue[0].get_value())
-        while queue:
-            node = queue.pop(0)
-            if node.get_value() == dest:
-                return node
-            else:
-                for adj_pos in self.get_exits(
-                    node.get_value(),
-                    collision_map,
-                    known_nodes,
-                ):
-                    if adj_pos not in known_nodes:
-                        known_nodes.add(adj_pos)
-                        queue.append(PathfindNode(adj_pos, node))
-
-        return None
-
     def get_explicit_tile_exits(
         self,
         position: tuple[int, int],
@@ -1006,7 +977,8 @@ class WorldState(state.State):
         """
         # TODO: rename this
         # get tile-level and npc/entity blockers
-        collision_map = collision_map or self.get_collision_map()
+        if collision_map is None:
+            collision_map = self.navigation
         skip_nodes = skip_nodes or set()
 
         # if there are explicit way to exit this position use that information,
@@ -1280,8 +1252,10 @@ class WorldState(state.State):
         self.map_area = map_data.area
 
         self.boundary_checker.update_boundaries(self.map_size)
+        self.navigation.load(self.collision_map, self.surface_map)
         self.client.load_map(map_data)
         self.clear_npcs()
+        self.preloader.preload(linked_maps(map_data))
 
     def clear_npcs(self) -> None:
         """
@@ -1289,6 +1263,8 @@ class WorldState(state.State):
         """
         self.npcs = []
         self.npcs_off_map = []
+        self.npcs_by_slug = {}
+        self.navigation.clear_entities()
 
     def update_player_state(self) -> None:
         """
@@ -1312,30 +1288,11 @@ class WorldState(state.State):
             Loaded map.
 
         """
-        txmn_map = TMXMapLoader().load(path)
-        yaml_files = [path.replace(".tmx", ".yaml")]
-
-        if txmn_map.scenario:
-            _scenario = prepare.fetch("maps", f"{txmn_map.scenario}.yaml")
-            yaml_files.append(_scenario)
-
-        _events = list(txmn_map.events)
-        _inits = list(txmn_map.inits)
-        events = {"event": _events, "init": _inits}
-
-        yaml_loader = YAMLEventLoader()
-
-        for yaml_file in yaml_files:
-            if os.path.exists(yaml_file):
-                yaml_data = yaml_loader.load_events(yaml_file, "event")
-                events["event"].extend(yaml_data["event"])
-                yaml_data = yaml_loader.load_events(yaml_file, "init")
-                events["init"].extend(yaml_data["init"])
-            else:
-                logger.warning(f"YAML file {yaml_file} not found")
-
-        txmn_map.events = events["event"]
-        txmn_map.inits = events["init"]
+        txmn_map = self.preloader.take(path)
+        if txmn_map is None:
+            txmn_map = load_map(path)
+        else:
+            logger.debug(f"Using preloaded map '{path}'")
         return txmn_map
 
     @no_type_check  # only used by multiplayer which is disabled
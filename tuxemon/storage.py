@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2024 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import (
+    Callable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from typing import Any, NamedTuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# A storage box as saved: a section of JSON text, or the encoded objects
+# in saves older than the sections
+EncodedBox = Union[str, Sequence[Mapping[str, Any]]]
+
+
+class PendingBox(NamedTuple):
+    data: EncodedBox
+
+
+class StorageBoxes(MutableMapping[str, list[T]]):
+    """
+    Storage boxes of monsters or items, decoded when they are used.
+
+    The boxes are loaded as sections of the save, and each box is only
+    decoded into objects the first time it is accessed. The boxes which
+    were never accessed are saved back as they were loaded, without being
+    decoded and encoded again.
+
+    Checking if a box exists, or listing the names of the boxes, doesn't
+    decode them.
+    """
+
+    def __init__(
+        self,
+        decode: Callable[[Sequence[Mapping[str, Any]]], list[T]],
+        encode: Callable[[Sequence[T]], Sequence[Mapping[str, Any]]],
+    ) -> None:
+        """
+        Parameters:
+            decode: Function creating the objects of a box.
+            encode: Function saving the objects of a box.
+
+        """
+        self.decode = decode
+        self.encode = encode
+        self._boxes: dict[str, Union[list[T], PendingBox]] = {}
+
+    def __getitem__(self, key: str) -> list[T]:
+        box = self._boxes[key]
+        if isinstance(box, PendingBox):
+            data = box.data
+            if isinstance(data, str):
+                data = json.loads(data)
+            logger.debug(f"decoding storage box {key}")
+            box = self._boxes[key] = self.decode(data)
+        return box
+
+    def __setitem__(self, key: str, value: list[T]) -> None:
+        self._boxes[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._boxes[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._boxes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._boxes)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._boxes)})"
+
+    def is_decoded(self, key: str) -> bool:
+        """
+        Whether a box was decoded into objects.
+
+        Parameters:
+            key: Name of the box.
+
+        Returns:
+            True if the box was decoded.
+
+        """
+        return not isinstance(self._boxes[key], PendingBox)
+
+    def load_sections(self, sections: Mapping[str, EncodedBox]) -> None:
+        """
+        Load boxes from the sections of a save, without decoding them.
+
+        Parameters:
+            sections: The saved boxes, by name.
+
+        """
+        for key, data in sections.items():
+            self._boxes[key] = PendingBox(data)
+
+    def get_sections(self) -> dict[str, str]:
+        """
+        Get the sections of the boxes to save.
+
+        Returns:
+            The JSON text of the boxes, by name.
+
+        """
+        sections = {}
+        for key, box in self._boxes.items():
+            if isinstance(box, PendingBox):
+                if isinstance(box.data, str):
+                    sections[key] = box.data
+                    continue
+                data = box.data
+            else:
+                data = self.encode(box)
+            sections[key] = json.dumps(data, separators=(",", ":"))
+        return sections
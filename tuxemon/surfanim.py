@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import bisect
+import copy
 import itertools
 from collections.abc import Mapping, Sequence
 from typing import Any, Final, Literal, Optional, TypeVar, Union
@@ -101,6 +102,23 @@ class SurfaceAnimation:
             itertools.accumulate(self._durations),
         )
 
+    def copy(self) -> SurfaceAnimation:
+        """
+        Return a new, stopped animation with the frames of this one.
+
+        The frames are shared, not copied, so many animations of the same
+        images cost only their playback state.
+
+        """
+        animation = copy.copy(self)
+        animation._internal_clock = float(2**32)
+        animation._state = STOPPED
+        animation._rate = 1.0
+        animation._visibility = True
+        animation._playing_start_time = 0.0
+        animation._paused_start_time = 0.0
+        return animation
+
     def get_frame(self, frame_num: int) -> pygame.surface.Surface:
         """Return the pygame.Surface object of the frame_num-th frame."""
         from tuxemon.sprite import dummy_image
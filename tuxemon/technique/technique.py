@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 import uuid
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields
 from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 from tuxemon import plugin
 from tuxemon.constants import paths
-from tuxemon.db import ElementType, Range, db
+from tuxemon.db import ElementType, Range, TechniqueModel, db
 from tuxemon.element import Element
 from tuxemon.locale import T
 from tuxemon.technique.techcondition import TechCondition
@@ -27,6 +28,49 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+@dataclass(frozen=True)
+class TechniquePrototype:
+    """
+    Definition of a technique, shared by the techniques with its slug.
+
+    It holds what is parsed from the technique database: the translated
+    strings, the elements, and the effect and condition objects.
+
+    """
+
+    slug: str = ""
+    name: str = ""
+    description: str = ""
+    sort: str = ""
+    use_tech: str = ""
+    use_success: str = ""
+    use_failure: str = ""
+    icon: str = ""
+    types: Sequence[Element] = ()
+    accuracy: float = 0.0
+    potency: float = 0.0
+    power: float = 1.0
+    default_potency: float = 0.0
+    default_power: float = 1.0
+    is_fast: bool = False
+    randomly: bool = True
+    healing_power: float = 0.0
+    recharge_length: int = 0
+    range: Range = Range.melee
+    tech_id: int = 0
+    conditions: Sequence[TechCondition] = ()
+    effects: Sequence[TechEffect] = ()
+    target: Mapping[str, bool] = field(default_factory=dict)
+    usable_on: bool = False
+    animation: Optional[str] = None
+    flip_axes: str = ""
+    sfx: str = ""
+
+
+EMPTY_PROTOTYPE = TechniquePrototype()
+PROTOTYPE_FIELDS = {f.name for f in fields(TechniquePrototype)}
+
+
 class Technique:
     """
     Particular skill that tuxemon monsters can use in battle.
@@ -35,40 +79,49 @@ class Technique:
 
     effects_classes: ClassVar[Mapping[str, type[TechEffect]]] = {}
     conditions_classes: ClassVar[Mapping[str, type[TechCondition]]] = {}
+    prototypes: ClassVar[
+        dict[str, tuple[TechniqueModel, TechniquePrototype]]
+    ] = {}
+
+    # read from the prototype of the technique, unless set on the technique
+    slug: str
+    name: str
+    description: str
+    sort: str
+    use_tech: str
+    use_success: str
+    use_failure: str
+    icon: str
+    types: Sequence[Element]
+    accuracy: float
+    potency: float
+    power: float
+    default_potency: float
+    default_power: float
+    is_fast: bool
+    randomly: bool
+    healing_power: float
+    recharge_length: int
+    range: Range
+    tech_id: int
+    conditions: Sequence[TechCondition]
+    effects: Sequence[TechEffect]
+    target: Mapping[str, bool]
+    usable_on: bool
+    animation: Optional[str]
+    flip_axes: str
+    sfx: str
 
     def __init__(self, save_data: Optional[Mapping[str, Any]] = None) -> None:
         save_data = save_data or {}
 
+        self.prototype = EMPTY_PROTOTYPE
         self.instance_id = uuid.uuid4()
         self.counter = 0
-        self.tech_id = 0
-        self.accuracy = 0.0
-        self.animation: Optional[str] = None
         self.combat_state: Optional[CombatState] = None
-        self.conditions: Sequence[TechCondition] = []
-        self.description = ""
-        self.effects: Sequence[TechEffect] = []
-        self.flip_axes = ""
-        self.icon = ""
         self.hit = False
-        self.is_fast = False
-        self.randomly = True
-        self.name = ""
         self.next_use = 0
         self.nr_turn = 0
-        self.potency = 0.0
-        self.power = 1.0
-        self.range = Range.melee
-        self.healing_power = 0.0
-        self.recharge_length = 0
-        self.sfx = ""
-        self.sort = ""
-        self.slug = ""
-        self.types: list[Element] = []
-        self.usable_on = False
-        self.use_success = ""
-        self.use_failure = ""
-        self.use_tech = ""
 
         # load effect and condition plugins if it hasn't been done already
         if not Technique.effects_classes:
@@ -85,6 +138,13 @@ class Technique:
 
         self.set_state(save_data)
 
+    def __getattr__(self, name: str) -> Any:
+        # the attributes which aren't set on the technique are shared
+        # by the techniques with the same slug
+        if name == "prototype":
+            raise AttributeError(name)
+        return getattr(self.prototype, name)
+
     def load(self, slug: str) -> None:
         """
         Loads and sets this technique's attributes from the technique
@@ -93,56 +153,78 @@ class Technique:
         Parameters:
             The slug of the technique to look up in the database.
         """
+        self.prototype = self.load_prototype(slug)
+        for name in PROTOTYPE_FIELDS & vars(self).keys():
+            delattr(self, name)
+
+    @classmethod
+    def load_prototype(cls, slug: str) -> TechniquePrototype:
+        """
+        Gets the definition of a technique, shared by its instances.
+
+        The technique is looked up in the database, and its strings and
+        effects are only parsed the first time its slug is loaded.
+
+        Parameters:
+            slug: The slug of the technique to look up in the database.
+
+        Returns:
+            The definition of the technique.
+
+        """
         try:
             results = db.lookup(slug, table="technique")
         except KeyError:
             raise RuntimeError(f"Technique {slug} not found")
 
-        self.slug = results.slug  # a short English identifier
-        self.name = T.translate(self.slug)
-        self.description = T.translate(f"{self.slug}_description")
-
-        self.sort = results.sort
-
-        # technique use notifications (translated!)
-        self.use_tech = T.maybe_translate(results.use_tech)
-        self.use_success = T.maybe_translate(results.use_success)
-        self.use_failure = T.maybe_translate(results.use_failure)
-
-        self.icon = results.icon
-        self.counter = self.counter
-        # types
-        self.types = [Element(ele) for ele in results.types]
-        # technique stats
-        self.accuracy = results.accuracy or self.accuracy
-        self.potency = results.potency or self.potency
-        self.power = results.power or self.power
-
-        self.default_potency = results.potency or self.potency
-        self.default_power = results.power or self.power
-
-        self.hit = self.hit
-        self.is_fast = results.is_fast or self.is_fast
-        self.randomly = results.randomly or self.randomly
-        self.healing_power = results.healing_power or self.healing_power
-        self.recharge_length = results.recharge or self.recharge_length
-        self.range = results.range or Range.melee
-        self.tech_id = results.tech_id or self.tech_id
-
-        self.conditions = self.parse_conditions(results.conditions)
-        self.effects = self.parse_effects(results.effects)
-        self.target = results.target.model_dump()
-        self.usable_on = results.usable_on or self.usable_on
-
-        # Load the animation sprites that will be used for this technique
-        self.animation = results.animation
-        self.flip_axes = results.flip_axes
-
-        # Load the sound effect for this technique
-        self.sfx = results.sfx
+        # the prototype is rebuilt if the database was reloaded
+        cached = cls.prototypes.get(slug)
+        if cached is not None and cached[0] is results:
+            return cached[1]
+
+        prototype = TechniquePrototype(
+            slug=results.slug,  # a short English identifier
+            name=T.translate(results.slug),
+            description=T.translate(f"{results.slug}_description"),
+            sort=results.sort,
+            # technique use notifications (translated!)
+            use_tech=T.maybe_translate(results.use_tech),
+            use_success=T.maybe_translate(results.use_success),
+            use_failure=T.maybe_translate(results.use_failure),
+            icon=results.icon,
+            # types
+            types=[Element(ele) for ele in results.types],
+            # technique stats
+            accuracy=results.accuracy or EMPTY_PROTOTYPE.accuracy,
+            potency=results.potency or EMPTY_PROTOTYPE.potency,
+            power=results.power or EMPTY_PROTOTYPE.power,
+            default_potency=results.potency or EMPTY_PROTOTYPE.potency,
+            default_power=results.power or EMPTY_PROTOTYPE.power,
+            is_fast=results.is_fast or EMPTY_PROTOTYPE.is_fast,
+            randomly=results.randomly or EMPTY_PROTOTYPE.randomly,
+            healing_power=(
+                results.healing_power or EMPTY_PROTOTYPE.healing_power
+            ),
+            recharge_length=(
+                results.recharge or EMPTY_PROTOTYPE.recharge_length
+            ),
+            range=results.range or Range.melee,
+            tech_id=results.tech_id or EMPTY_PROTOTYPE.tech_id,
+            conditions=cls.parse_conditions(results.conditions),
+            effects=cls.parse_effects(results.effects),
+            target=results.target.model_dump(),
+            usable_on=results.usable_on or EMPTY_PROTOTYPE.usable_on,
+            # Load the animation sprites that will be used for this technique
+            animation=results.animation,
+            flip_axes=results.flip_axes,
+            # Load the sound effect for this technique
+            sfx=results.sfx,
+        )
+        cls.prototypes[slug] = (results, prototype)
+        return prototype
 
+    @staticmethod
     def parse_effects(
-        self,
         raw: Sequence[str],
     ) -> Sequence[TechEffect]:
         """
@@ -174,8 +256,8 @@ class Technique:
 
         return effects
 
+    @staticmethod
     def parse_conditions(
-        self,
         raw: Sequence[str],
     ) -> Sequence[TechCondition]:
         """
@@ -16,6 +16,7 @@ import logging
 import typing
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import fields
+from functools import lru_cache
 from operator import add, eq, floordiv, ge, gt, le, lt, mul, ne, sub
 from typing import (
     TYPE_CHECKING,
@@ -321,21 +322,38 @@ def get_types_tuple(
         return (param_type,)
 
 
+@lru_cache(maxsize=None)
+def get_dataclass_init_types(
+    cls: type,
+) -> Sequence[tuple[str, Sequence[ValidParameterSingleType]]]:
+    """
+    Returns the type constructors of the __init__ fields of a dataclass.
+
+    Resolving the type hints is slow, so the result is cached per class.
+
+    Parameters:
+        cls: The dataclass.
+
+    Returns:
+        The name and the type constructors of each __init__ field.
+    """
+    type_hints = typing.get_type_hints(cls)
+    return tuple(
+        # e.g. ("map_name", (<class 'str'>, <class 'NoneType'>))
+        (field.name, get_types_tuple(type_hints[field.name]))
+        for field in fields(cls)
+        if field.init
+    )
+
+
 def cast_dataclass_parameters(self: Any) -> None:
     """
     Takes a dataclass object and casts its __init__ values to the correct type
     """
-    type_hints = typing.get_type_hints(self.__class__)
-    for field in fields(self):
-        if field.init:
-            field_name = field.name  # e.g "map_name"
-            type_hint = type_hints[field_name]  # e.g. Optional[str]
-            constructors = get_types_tuple(
-                type_hint
-            )  # e.g. (<class 'str'>, <class 'NoneType'>)
-            old_value = getattr(self, field_name)
-            new_value = cast_value(((constructors, field_name), old_value))
-            setattr(self, field_name, new_value)
+    for field_name, constructors in get_dataclass_init_types(self.__class__):
+        old_value = getattr(self, field_name)
+        new_value = cast_value(((constructors, field_name), old_value))
+        setattr(self, field_name, new_value)
 
 
 def show_item_result_as_dialog(
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import math
+import weakref
 from collections.abc import Callable, Generator, Iterable, Sequence
+from functools import lru_cache
 from itertools import product
 from typing import Optional
 
@@ -213,27 +215,176 @@ def shadow_text(
     return image
 
 
-def iter_render_text(
-    text: str,
+class GlyphAtlas:
+    """
+    Shadowed glyphs of a font in given colors, rendered once.
+
+    Each glyph is rendered with :func:`shadow_text` the first time it is
+    used. The advance from a character to the next one, kerning included,
+    is measured once per pair of characters, so that a text is laid out
+    without measuring each of its prefixes.
+
+    The glyphs are shared by every text drawn with the same font and
+    colors, so they must not be modified.
+
+    Parameters:
+        font: Font of the glyphs.
+        fg: Color of the glyphs.
+        bg: Color of the shadow of the glyphs.
+
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        fg: ColorLike,
+        bg: ColorLike,
+    ) -> None:
+        self.font = font
+        self.fg = fg
+        self.bg = bg
+        self.glyphs: dict[str, Surface] = {}
+        self.widths: dict[str, int] = {"": 0}
+
+    def glyph(self, char: str) -> Surface:
+        """
+        Get the shadowed glyph of a character.
+
+        Parameters:
+            char: The character.
+
+        Returns:
+            The glyph, shared by the texts using the atlas.
+
+        """
+        surface = self.glyphs.get(char)
+        if surface is None:
+            surface = shadow_text(self.font, self.fg, self.bg, char)
+            self.glyphs[char] = surface
+        return surface
+
+    def width(self, text: str) -> int:
+        width = self.widths.get(text)
+        if width is None:
+            width = self.widths[text] = self.font.size(text)[0]
+        return width
+
+    def line_offsets(self, line: str) -> list[int]:
+        """
+        Get the horizontal position of each character of a line.
+
+        The position of a character is the width of the text before it,
+        which is the width of the previous character, plus the advance
+        between each pair of characters before it.
+
+        Parameters:
+            line: A line of text.
+
+        Returns:
+            The offset of each character from the start of the line.
+
+        """
+        offsets = []
+        x = 0
+        previous = ""
+        for char in line:
+            offsets.append(x)
+            x += self.width(previous + char) - self.width(previous)
+            previous = char
+        return offsets
+
+
+# atlases of the fonts, by colors; they are dropped with their font
+glyph_atlases: weakref.WeakKeyDictionary[
+    pygame.font.Font, dict[tuple[tuple[int, ...], tuple[int, ...]], GlyphAtlas]
+] = weakref.WeakKeyDictionary()
+
+
+def get_glyph_atlas(
     font: pygame.font.Font,
     fg: ColorLike,
     bg: ColorLike,
+) -> GlyphAtlas:
+    """
+    Get the glyph atlas of a font and colors, shared by the texts.
+
+    Parameters:
+        font: Font of the glyphs.
+        fg: Color of the glyphs.
+        bg: Color of the shadow of the glyphs.
+
+    Returns:
+        The atlas of the glyphs.
+
+    """
+    atlases = glyph_atlases.setdefault(font, {})
+    key = (tuple(pygame.Color(fg)), tuple(pygame.Color(bg)))
+    atlas = atlases.get(key)
+    if atlas is None:
+        atlas = atlases[key] = GlyphAtlas(font, fg, bg)
+    return atlas
+
+
+@lru_cache(maxsize=None)
+def load_font(filename: str, size: int) -> pygame.font.Font:
+    """
+    Load a font, shared by the menus using the same font and size.
+
+    Sharing the fonts lets the menus share their glyph atlases.
+
+    Parameters:
+        filename: Path of the font file.
+        size: Size of the font in pixels.
+
+    Returns:
+        The font.
+
+    """
+    return pygame.font.Font(filename, size)
+
+
+def layout_text(
+    text: str,
+    atlas: GlyphAtlas,
     rect: Rect,
-) -> Generator[tuple[Rect, Surface], None, None]:
+) -> list[tuple[int, int, str]]:
+    """
+    Compute the position of each character of a text, once per text.
+
+    The text is wrapped to the width of the area, and the spaces are
+    left out, since there is nothing to draw for them.
+
+    Parameters:
+        text: The text to lay out.
+        atlas: Glyph atlas of the font and colors of the text.
+        rect: Area of the text.
+
+    Returns:
+        The left and top position and the character of each glyph.
+
+    """
+    font = atlas.font
     line_height = guest_font_height(font)
+    glyphs = []
     for line_index, line in enumerate(constrain_width(text, font, rect.width)):
         top = rect.top + line_index * line_height
-        for scrap in build_line(line):
-            if scrap[-1] == " ":
-                # No need to blit a white sprite onto a white background
-                continue
-            dirty_length = font.size(scrap[:-1])[0]
-            surface = shadow_text(font, fg, bg, scrap[-1])
-            update_rect = surface.get_rect(
-                top=top,
-                left=rect.left + dirty_length,
-            )
-            yield update_rect, surface
+        for char, offset in zip(line, atlas.line_offsets(line)):
+            if char != " ":
+                glyphs.append((rect.left + offset, top, char))
+    return glyphs
+
+
+def iter_render_text(
+    text: str,
+    font: pygame.font.Font,
+    fg: ColorLike,
+    bg: ColorLike,
+    rect: Rect,
+) -> Generator[tuple[Rect, Surface], None, None]:
+    atlas = get_glyph_atlas(font, fg, bg)
+    for left, top, char in layout_text(text, atlas, rect):
+        surface = atlas.glyph(char)
+        yield surface.get_rect(top=top, left=left), surface
 
 
 def build_line(text: str) -> Generator[str, None, None]: